@@ -1,12 +1,81 @@
+import asyncio
+from collections.abc import AsyncGenerator
+from contextlib import asynccontextmanager
+
 import uvicorn
-from fastapi import FastAPI
+from fastapi import Depends, FastAPI, Response
 
 from src.app.api.v1 import router as api_router
+from src.app.core.dependencies.db import DATABASE, DATABASE_REPLICA
+from src.app.core.dependencies.http_client import HTTP_CLIENT
+from src.app.core.dependencies.observability import LOOP_LAG_MONITOR, METRICS_EXPORTER, get_metrics_exporter
+from src.app.core.dependencies.security.password_executor import PASSWORD_HASH_EXECUTOR
+from src.app.core.dependencies.services.lessons_watcher import LESSONS_WATCHER
+from src.app.core.dependencies.services.progress_write_queue import PROGRESS_WRITE_QUEUE
+from src.app.core.observability import METRICS_CONTENT_TYPE, MetricsExporter, RequestMetricsMiddleware
+from src.app.core.observability.registry import (
+    DB_STATEMENTS_PER_REQUEST,
+    DB_TIME_PER_REQUEST,
+    HTTP_REQUEST_DURATION,
+)
+from src.cfg.cfg import settings
+
+
+@asynccontextmanager
+async def lifespan(_app: FastAPI) -> AsyncGenerator[None]:
+    """
+    Open shared resources on startup and release them on shutdown.
+
+    :param _app: application instance
+
+    :return: lifespan context
+    """
+    DATABASE.open()
+
+    if DATABASE_REPLICA is not None:
+        DATABASE_REPLICA.open()
+
+    HTTP_CLIENT.open()
+
+    if settings.progress.write_behind_enabled:
+        PROGRESS_WRITE_QUEUE.start()
+
+    if settings.lessons_watch_enabled:
+        LESSONS_WATCHER.start()
+
+    if settings.observability.metrics_enabled:
+        METRICS_EXPORTER.start()
+
+    if settings.observability.loop_monitor_enabled:
+        LOOP_LAG_MONITOR.start()
 
-app = FastAPI(swagger_ui_parameters={"operationsSorter": "method"})
+    try:
+        yield
+    finally:
+        await LOOP_LAG_MONITOR.stop()
+        await METRICS_EXPORTER.stop()
+        await LESSONS_WATCHER.stop()
+        await PROGRESS_WRITE_QUEUE.stop()
+        await HTTP_CLIENT.aclose()
+        await asyncio.to_thread(PASSWORD_HASH_EXECUTOR.shutdown)
+        await DATABASE.dispose()
+
+        if DATABASE_REPLICA is not None:
+            await DATABASE_REPLICA.dispose()
+
+
+app = FastAPI(lifespan=lifespan, swagger_ui_parameters={"operationsSorter": "method"})
 
 app.include_router(router=api_router, prefix="/api/v1")
 
+if settings.observability.metrics_enabled:
+    app.add_middleware(
+        RequestMetricsMiddleware,
+        histograms=HTTP_REQUEST_DURATION,
+        statement_counts=DB_STATEMENTS_PER_REQUEST,
+        statement_times=DB_TIME_PER_REQUEST,
+    )
+
 
 @app.get(path="/health", summary="Health check")
 async def health_check() -> dict[str, str]:
@@ -19,5 +88,24 @@ async def health_check() -> dict[str, str]:
     return {"status": "ok"}
 
 
+@app.get(path="/metrics", summary="Prometheus metrics", include_in_schema=False)
+async def metrics(exporter: MetricsExporter = Depends(get_metrics_exporter)) -> Response:
+    """
+    Return metrics in the Prometheus text exposition format.
+
+    Metrics are off unless OBSERVABILITY_METRICS_ENABLED is set, since the
+    endpoint is not authenticated and should only be reachable by the scraper.
+
+    :param exporter: metrics exporter
+
+    :return: exposition payload
+    """
+
+    if not settings.observability.metrics_enabled:
+        return Response(status_code=404)
+
+    return Response(content=await exporter.render(), media_type=METRICS_CONTENT_TYPE)
+
+
 if __name__ == "__main__":
     uvicorn.run(app="main:app", host="0.0.0.0", port=8000)
@@ -0,0 +1,27 @@
+"""add unique lesson order
+
+Revision ID: 7a4e2c9d1b05
+Revises: 5d2a9c41e7b3
+Create Date: 2026-10-19 12:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "7a4e2c9d1b05"
+down_revision: Union[str, Sequence[str], None] = "5d2a9c41e7b3"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_unique_constraint("uq_lessons_order", "lessons", ["order"])
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_constraint("uq_lessons_order", "lessons", type_="unique")
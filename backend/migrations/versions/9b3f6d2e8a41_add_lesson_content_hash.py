@@ -0,0 +1,28 @@
+"""add lesson content hash
+
+Revision ID: 9b3f6d2e8a41
+Revises: 7a4e2c9d1b05
+Create Date: 2026-10-19 13:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "9b3f6d2e8a41"
+down_revision: Union[str, Sequence[str], None] = "7a4e2c9d1b05"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column("lessons", sa.Column("content_hash", sa.String(length=64), nullable=True))
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_column("lessons", "content_hash")
@@ -0,0 +1,30 @@
+"""add lesson body html
+
+Revision ID: c3d5e7f9a1b2
+Revises: 9b3f6d2e8a41
+Create Date: 2026-10-19 15:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "c3d5e7f9a1b2"
+down_revision: Union[str, Sequence[str], None] = "9b3f6d2e8a41"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column("lessons", sa.Column("body_html", sa.Text(), nullable=True))
+    # Forget content hashes so the next sync renders every lesson once.
+    op.execute("UPDATE lessons SET content_hash = NULL")
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_column("lessons", "body_html")
@@ -0,0 +1,31 @@
+"""add rate limit previous hits
+
+Revision ID: e1f3a5c7d9b4
+Revises: c3d5e7f9a1b2
+Create Date: 2026-10-19 18:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "e1f3a5c7d9b4"
+down_revision: Union[str, Sequence[str], None] = "c3d5e7f9a1b2"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column(
+        "rate_limit_counters",
+        sa.Column("previous_hits", sa.Integer(), nullable=False, server_default="0"),
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_column("rate_limit_counters", "previous_hits")
@@ -1,5 +1,6 @@
 from fastapi import APIRouter
 
+from .admin import router as admin_router
 from .auth import router as auth_router
 from .execution import router as execution_router
 from .lesson import router as lesson_router
@@ -11,3 +12,4 @@ router.include_router(router=lesson_router)
 router.include_router(router=auth_router)
 router.include_router(router=user_router)
 router.include_router(router=execution_router)
+router.include_router(router=admin_router)
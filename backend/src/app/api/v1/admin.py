@@ -0,0 +1,56 @@
+import asyncio
+import os
+
+from fastapi import APIRouter, Depends, Query, Response
+from fastapi.responses import JSONResponse, PlainTextResponse
+
+from src.app.core.dependencies.observability import get_sampling_profiler
+from src.app.core.dependencies.security.user import require_admin_user
+from src.app.core.observability import SamplingProfiler
+from src.app.domain.models.dto.user import UserDTO
+from src.app.domain.models.enums.profiling import ProfileFormat
+
+router = APIRouter(
+    prefix="/admin",
+    tags=["Admin"],
+    dependencies=[],
+)
+
+
+@router.get(path="/profile", summary="Sample the stacks of this worker")
+async def profile_worker(
+        seconds: float = Query(default=5.0, gt=0, le=60),
+        interval_ms: float = Query(default=10.0, ge=1, le=1000),
+        output: ProfileFormat = Query(default=ProfileFormat.COLLAPSED, alias="format"),
+        profiler: SamplingProfiler = Depends(get_sampling_profiler),
+        _admin: UserDTO = Depends(require_admin_user),
+        *,
+        include_idle: bool = False,
+) -> Response:
+    """
+    Profile the worker that serves this request.
+
+    Sampling runs in a worker thread, so the event loop keeps serving
+    requests and shows up in the profile as it really behaves. Threads
+    waiting for work are left out unless include_idle is set.
+
+    :param seconds: profiling duration
+    :param interval_ms: sampling interval
+    :param output: collapsed stacks or speedscope JSON
+    :param profiler: sampling profiler
+    :param _admin: authenticated admin user
+    :param include_idle: keep samples of idle threads, tagged with an ``[idle]`` frame
+
+    :return: profile in the requested format
+    """
+    samples = await asyncio.to_thread(
+        profiler.sample,
+        duration_sec=seconds,
+        interval_ms=interval_ms,
+        include_idle=include_idle,
+    )
+
+    if output == ProfileFormat.SPEEDSCOPE:
+        return JSONResponse(content=samples.to_speedscope(name=f"pydantic-quest worker {os.getpid()}"))
+
+    return PlainTextResponse(content=samples.to_collapsed())
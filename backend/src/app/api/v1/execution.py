@@ -1,9 +1,11 @@
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, Depends, HTTPException, Response
 
+from src.app.core.dependencies.observability import get_execution_stage_timer
 from src.app.core.dependencies.security.execution import enforce_execution_rate_limit
 from src.app.core.dependencies.security.user import get_optional_user_from_jwt
 from src.app.core.dependencies.services.code_analysis import get_code_analysis_service
 from src.app.core.dependencies.services.code_execution import get_code_execution_service
+from src.app.core.observability import StageTimer
 from src.app.domain.models.dto.execution.code_analysis_request import (
     CodeAnalysisRequestDTO,
 )
@@ -23,24 +25,41 @@ router = APIRouter(
 @router.post(path="/run", summary="Run lesson code")
 async def run_lesson_code(
         data: ExecutionRequestDTO,
+        response: Response,
         _: None = Depends(enforce_execution_rate_limit),
         code_execution_service: CodeExecutionService = Depends(get_code_execution_service),
         user: UserDTO | None = Depends(get_optional_user_from_jwt),
+        timer: StageTimer = Depends(get_execution_stage_timer),
 ) -> ExecutionResultDTO:
     """
     Execute lesson code against evaluation script.
 
+    When stage timing is enabled, per-stage durations are returned in the
+    ``Server-Timing`` header, for error responses too.
+
     :param data: execution request data
+    :param response: outgoing response
     :param code_execution_service: code execution service
+    :param timer: execution stage timer
 
     :return: execution result
     """
+    try:
+        result = await code_execution_service.execute(
+            lesson_id=data.lesson_id,
+            code=data.code,
+            user_id=user.id if user else None,
+            timer=timer,
+        )
+    except HTTPException as exc:
+        if timer.enabled:
+            exc.headers = {**(exc.headers or {}), "Server-Timing": timer.server_timing_header()}
+        raise
+
+    if timer.enabled:
+        response.headers["Server-Timing"] = timer.server_timing_header()
 
-    return await code_execution_service.execute(
-        lesson_id=data.lesson_id,
-        code=data.code,
-        user_id=user.id if user else None,
-    )
+    return result
 
 
 @router.post(path="/analyze", summary="Analyze lesson code")
@@ -1,20 +1,35 @@
+import hashlib
+import logging
+from collections.abc import AsyncIterator
 from uuid import UUID
 
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, Depends, Header, Query, Response
+from fastapi.responses import HTMLResponse, StreamingResponse
 
+from src.app.api.v1.pagination import MAX_PAGE_SIZE, set_next_cursor
 from src.app.core.dependencies.security.user import require_admin_user
-from src.app.core.dependencies.services.lesson import get_lesson_service
+from src.app.core.dependencies.services.lesson import get_lesson_read_service, get_lesson_service
+from src.app.core.dependencies.services.lesson_search import get_lesson_search_index
 from src.app.core.dependencies.services.lesson_sync import get_lesson_sync_service
 from src.app.domain.models.dto.lesson import (
     CreateLessonDTO,
     LessonDTO,
+    LessonSearchHitDTO,
+    LessonSyncEventDTO,
     LessonSyncResultDTO,
     UpdateLessonDTO,
 )
 from src.app.domain.models.dto.user import UserDTO
+from src.app.domain.models.enums.lesson_sync import LessonSyncEvent
+from src.app.domain.services.lesson_search_index import LessonSearchIndex
 from src.app.domain.services.lesson_service import LessonService
 from src.app.domain.services.lesson_sync_service import LessonSyncService
 
+logger = logging.getLogger(__name__)
+
+NDJSON_MEDIA_TYPE = "application/x-ndjson"
+MAX_SEARCH_HITS = 50
+
 router = APIRouter(
     prefix="/lessons",
     tags=["Lessons"],
@@ -42,26 +57,64 @@ async def create_lesson(
     return lesson
 
 
-@router.get(path="/get_all", summary="Get all lessons")
+@router.get(path="/get_all", summary="Get all lessons", response_model_exclude={"__all__": {"body_html"}})
 async def get_all_lessons(
-        lesson_service: LessonService = Depends(dependency=get_lesson_service),
+        response: Response,
+        lesson_service: LessonService = Depends(dependency=get_lesson_read_service),
+        limit: int | None = Query(default=None, ge=1, le=MAX_PAGE_SIZE),
+        cursor: UUID | None = None,
 ) -> list[LessonDTO]:
     """
     Get all lessons.
 
+    Without ``limit`` the whole course is returned in course order. With
+    ``limit`` lessons are paged in storage order and the next page cursor is
+    returned in the ``X-Next-Cursor`` header. Rendered theory is left out of
+    the list; it is served per lesson by the theory endpoint.
+
+    :param response: outgoing response
     :param lesson_service: lesson service
+    :param limit: optional page size
+    :param cursor: last lesson id of the previous page
 
     :return: lesson list
     """
-    lessons = await lesson_service.get_all()
+
+    if limit is None:
+        return await lesson_service.get_all()
+
+    lessons, next_cursor = await lesson_service.get_page(limit=limit, cursor=cursor)
+    set_next_cursor(response=response, next_cursor=next_cursor)
 
     return lessons
 
 
+@router.get(path="/search", summary="Search lessons")
+async def search_lessons(
+        q: str = Query(min_length=1, max_length=200),
+        limit: int = Query(default=10, ge=1, le=MAX_SEARCH_HITS),
+        search_index: LessonSearchIndex = Depends(dependency=get_lesson_search_index),
+) -> list[LessonSearchHitDTO]:
+    """
+    Search lessons by name, theory, quiz prompts and case labels.
+
+    Hits are ranked with BM25, the last word may be partially typed, and each
+    hit carries an HTML-escaped snippet with matches wrapped in ``<mark>``.
+
+    :param q: search text
+    :param limit: max hits
+    :param search_index: lesson search index
+
+    :return: ranked search hits
+    """
+
+    return search_index.search(query=q, limit=limit)
+
+
 @router.get(path="/{lesson_id}", summary="Get lesson by id")
 async def get_lesson_by_id(
         lesson_id: UUID,
-        lesson_service: LessonService = Depends(dependency=get_lesson_service),
+        lesson_service: LessonService = Depends(dependency=get_lesson_read_service),
 ) -> LessonDTO:
     """
     Get lesson by id.
@@ -76,10 +129,42 @@ async def get_lesson_by_id(
     return lesson
 
 
+@router.get(path="/{lesson_id}/theory", summary="Get lesson theory as HTML", response_class=HTMLResponse)
+async def get_lesson_theory(
+        lesson_id: UUID,
+        lesson_service: LessonService = Depends(dependency=get_lesson_read_service),
+        if_none_match: str | None = Header(default=None),
+) -> Response:
+    """
+    Get lesson theory pre-rendered to sanitized HTML.
+
+    The URL does not change when the theory does, so clients may store the
+    response but revalidate it on every use with its ETag and get an empty
+    304 while the theory is unchanged.
+
+    :param lesson_id: lesson id
+    :param lesson_service: lesson service
+    :param if_none_match: ETag the client already has
+
+    :return: theory HTML, or 304 if the client copy is current
+    """
+    body_html = await lesson_service.get_theory_html(id=lesson_id)
+    etag = f'"{hashlib.sha256(body_html.encode()).hexdigest()[:32]}"'
+    headers = {
+        "ETag": etag,
+        "Cache-Control": "no-cache",
+    }
+
+    if if_none_match is not None and etag in {tag.strip().removeprefix("W/") for tag in if_none_match.split(",")}:
+        return Response(status_code=304, headers=headers)
+
+    return HTMLResponse(content=body_html, headers=headers)
+
+
 @router.get(path="/by_slug/{slug}", summary="Get lesson by slug")
 async def get_lesson_by_slug(
         slug: str,
-        lesson_service: LessonService = Depends(dependency=get_lesson_service),
+        lesson_service: LessonService = Depends(dependency=get_lesson_read_service),
 ) -> LessonDTO:
     """
     Get lesson by slug.
@@ -156,3 +241,37 @@ async def sync_lessons_from_files(
         delete_missing=True,
         dry_run=dry_run,
     )
+
+
+@router.post(path="/sync_from_files/stream", summary="Sync lessons from files with streamed progress")
+async def stream_sync_lessons_from_files(
+        lesson_sync_service: LessonSyncService = Depends(dependency=get_lesson_sync_service),
+        _admin: UserDTO = Depends(require_admin_user),
+        *,
+        dry_run: bool = False,
+) -> StreamingResponse:
+    """
+    Sync lessons from files, streaming progress as newline-delimited JSON.
+
+    The response starts right away and keeps producing lines, so long
+    imports are not cut off by proxy timeouts. Writes are committed in
+    chunks. Errors after the stream has started are reported as a final
+    ``failed`` event, since the status code is already sent.
+
+    :param lesson_sync_service: lesson sync service
+    :param _admin: authenticated admin user
+    :param dry_run: dry-run mode
+
+    :return: streaming NDJSON response of sync events
+    """
+
+    async def _events() -> AsyncIterator[str]:
+        try:
+            async for event in lesson_sync_service.stream(delete_missing=True, dry_run=dry_run):
+                yield f"{event.model_dump_json(exclude_none=True)}\n"
+        except Exception as exc:
+            logger.exception("Streamed lesson sync failed")
+            failed = LessonSyncEventDTO(event=LessonSyncEvent.FAILED, detail=str(exc))
+            yield f"{failed.model_dump_json(exclude_none=True)}\n"
+
+    return StreamingResponse(content=_events(), media_type=NDJSON_MEDIA_TYPE)
@@ -0,0 +1,23 @@
+from uuid import UUID
+
+from fastapi import Response
+
+NEXT_CURSOR_HEADER = "X-Next-Cursor"
+MAX_PAGE_SIZE = 500
+
+
+def set_next_cursor(response: Response, next_cursor: UUID | None) -> None:
+    """
+    Expose the cursor of the next page in a response header.
+
+    Keeping the cursor out of the body leaves list responses unchanged for
+    clients that do not paginate.
+
+    :param response: outgoing response
+    :param next_cursor: cursor of the next page, None on the last page
+
+    :return: None
+    """
+
+    if next_cursor is not None:
+        response.headers[NEXT_CURSOR_HEADER] = str(next_cursor)
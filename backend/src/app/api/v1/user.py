@@ -1,11 +1,19 @@
 from uuid import UUID
 
-from fastapi import APIRouter, Depends
-
-from src.app.core.dependencies.security.user import get_user_from_jwt, require_admin_user
+from fastapi import APIRouter, Depends, Query, Response
+
+from src.app.api.v1.pagination import MAX_PAGE_SIZE, set_next_cursor
+from src.app.core.dependencies.security.user import (
+    get_user_from_jwt,
+    get_user_profile_from_jwt,
+    require_admin_user,
+)
+from src.app.core.dependencies.services.lesson_order_index import get_lesson_order_index
 from src.app.core.dependencies.services.lesson_progress import get_lesson_progress_service
-from src.app.core.dependencies.services.user import get_user_service
+from src.app.core.dependencies.services.user import get_user_read_service, get_user_service
+from src.app.domain.models.dto.progress import ProgressSummaryDTO
 from src.app.domain.models.dto.user import CreateUserDTO, UpdateUserDTO, UserDTO
+from src.app.domain.services.lesson_order_index import LessonOrderIndex
 from src.app.domain.services.lesson_progress_service import LessonProgressService
 from src.app.domain.services.user_service import UserService
 
@@ -23,13 +31,21 @@ async def create_user(
 
 @router.get(path="/get_all", summary="Get all users")
 async def get_all_users(
-        user_service: UserService = Depends(dependency=get_user_service),
+        response: Response,
+        user_service: UserService = Depends(dependency=get_user_read_service),
+        limit: int | None = Query(default=None, ge=1, le=MAX_PAGE_SIZE),
+        cursor: UUID | None = None,
 ) -> list[UserDTO]:
-    return await user_service.get_all()
+    if limit is None:
+        return await user_service.get_all()
+
+    users, next_cursor = await user_service.get_page(limit=limit, cursor=cursor)
+    set_next_cursor(response=response, next_cursor=next_cursor)
+    return users
 
 
 @router.get(path="/me", summary="Get current user")
-async def get_me(user: UserDTO = Depends(dependency=get_user_from_jwt)) -> UserDTO:
+async def get_me(user: UserDTO = Depends(dependency=get_user_profile_from_jwt)) -> UserDTO:
     return user
 
 
@@ -51,6 +67,15 @@ async def get_my_progress(
     return await progress_service.get_completed_lesson_ids(user_id=user.id)
 
 
+@router.get(path="/me/progress/summary", summary="Get current user progress summary")
+async def get_my_progress_summary(
+        user: UserDTO = Depends(dependency=get_user_from_jwt),
+        progress_service: LessonProgressService = Depends(get_lesson_progress_service),
+        lesson_index: LessonOrderIndex = Depends(get_lesson_order_index),
+) -> ProgressSummaryDTO:
+    return await progress_service.get_summary(user_id=user.id, lesson_index=lesson_index)
+
+
 @router.post(path="/me/progress/{lesson_id}", summary="Mark lesson completed")
 async def mark_lesson_completed(
         lesson_id: UUID,
@@ -73,7 +98,7 @@ async def reset_my_progress(
 @router.get(path="/{user_id}", summary="Get user by id")
 async def get_user_by_id(
         user_id: UUID,
-        user_service: UserService = Depends(dependency=get_user_service),
+        user_service: UserService = Depends(dependency=get_user_read_service),
 ) -> UserDTO:
     return await user_service.get_by_id(id=user_id)
 
@@ -1,5 +1,14 @@
 from src.app.content.loader import LessonsLoader
-from src.app.content.models import LoadedLesson
+from src.app.content.manifest import LessonsManifest
+from src.app.content.models import LessonSource, LoadedLesson
+from src.app.content.parse_cache import LessonsParseCache
 from src.app.content.validator import LessonsContentValidator
 
-__all__ = ["LessonsContentValidator", "LessonsLoader", "LoadedLesson"]
+__all__ = [
+    "LessonSource",
+    "LessonsContentValidator",
+    "LessonsLoader",
+    "LessonsManifest",
+    "LessonsParseCache",
+    "LoadedLesson",
+]
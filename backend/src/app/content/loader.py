@@ -1,9 +1,15 @@
+import hashlib
+import multiprocessing
 import re
+import time
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 
 import yaml
 
-from src.app.content.models import LessonCasesFile, LessonMetaFile, LessonQuizFile, LoadedLesson
+from src.app.content.manifest import FileFingerprint, LessonsManifest
+from src.app.content.models import LessonCasesFile, LessonMetaFile, LessonQuizFile, LessonSource, LoadedLesson
+from src.app.content.parse_cache import LessonsParseCache
 from src.app.content.validator import LessonsContentValidator
 from src.app.domain.lesson_order import lesson_order_key
 
@@ -12,40 +18,160 @@ LESSON_THEORY_FILENAME = "theory.md"
 LESSON_STARTER_FILENAME = "starter.py"
 LESSON_CASES_FILENAME = "cases.yaml"
 LESSON_QUIZ_FILENAME = "quiz.yaml"
+LESSON_FILENAMES = (
+    LESSON_META_FILENAME,
+    LESSON_THEORY_FILENAME,
+    LESSON_STARTER_FILENAME,
+    LESSON_CASES_FILENAME,
+    LESSON_QUIZ_FILENAME,
+)
 LESSON_TEMPLATE_DIRNAME = "lesson-template"
 LESSON_DIR_PATTERN = re.compile(r"^(?P<prefix>\d+)-(?P<slug>[a-z0-9][a-z0-9-]*)$")
+PARALLEL_MIN_LESSONS_PER_WORKER = 8
+PARALLEL_CHUNKS_PER_WORKER = 4
+# libyaml-backed loader is several times faster; PyYAML builds without it fall back to pure Python.
+YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+_worker_loader: "LessonsLoader | None" = None
 
 
 class LessonsLoader:
-    def __init__(self, root_dir: Path, validator: LessonsContentValidator) -> None:
+    def __init__(
+            self,
+            root_dir: Path,
+            validator: LessonsContentValidator,
+            manifest: LessonsManifest | None = None,
+            workers: int = 1,
+            parse_cache: LessonsParseCache | None = None,
+    ) -> None:
+        """
+        Initialize lessons loader.
+
+        :param root_dir: lessons root directory
+        :param validator: lessons content validator
+        :param manifest: optional manifest that lets scans skip unchanged directories
+        :param workers: parsing processes, 1 parses in the calling thread
+        :param parse_cache: optional cache of parsed yaml files
+
+        :return: None
+        """
         self.root_dir = root_dir
         self.validator = validator
+        self.manifest = manifest or LessonsManifest(path=None)
+        self.workers = workers
+        self.parse_cache = parse_cache or LessonsParseCache(cache_dir=None)
+        self.last_load_timings: dict[str, float] = {}
 
     def load(self) -> list[LoadedLesson]:
-        lessons = []
+        """
+        Scan and parse every lesson.
+
+        :return: loaded lessons sorted by order
+        """
+
+        return self.load_sources(sources=self.scan())
+
+    def scan(self) -> list[LessonSource]:
+        """
+        Discover lessons and hash their files without parsing them.
+
+        Directories whose file stats match the manifest reuse the recorded
+        hash and are not read at all.
+
+        :return: lesson sources sorted by order
+        """
+        sources = []
         for lesson_dir in self._discover_lesson_dirs():
             slug, order = self._infer_slug_and_order(lesson_dir=lesson_dir)
-            lesson_meta = self._load_meta(lesson_dir=lesson_dir)
-            lesson_cases = self._load_cases(lesson_dir=lesson_dir)
-            lesson_quiz = self._load_quiz(lesson_dir=lesson_dir)
-            theory = self._read_text(path=lesson_dir / LESSON_THEORY_FILENAME)
-            starter_code = self._read_text(path=lesson_dir / LESSON_STARTER_FILENAME)
-            lessons.append(
-                LoadedLesson(
+            fingerprint = self._fingerprint(lesson_dir=lesson_dir)
+            content_hash = self.manifest.lookup(lesson_dir=lesson_dir, fingerprint=fingerprint)
+            if content_hash is None:
+                content_hash = self._hash_lesson_dir(lesson_dir=lesson_dir)
+
+            self.manifest.record(lesson_dir=lesson_dir, fingerprint=fingerprint, content_hash=content_hash)
+            sources.append(
+                LessonSource(
                     slug=slug,
                     order=order,
-                    name=lesson_meta.title,
-                    body_markdown=theory,
-                    code_editor_default=starter_code,
-                    cases=lesson_cases.cases,
-                    questions=lesson_quiz.questions,
                     source_dir=lesson_dir,
+                    content_hash=content_hash,
                 ),
             )
 
-        self.validator.validate_lessons(lessons=lessons)
-        lessons.sort(key=lambda item: lesson_order_key(item.order))
-        return lessons
+        self.manifest.save()
+        self.validator.validate_lessons(lessons=sources)
+        sources.sort(key=lambda item: lesson_order_key(item.order))
+        return sources
+
+    def load_sources(self, sources: list[LessonSource]) -> list[LoadedLesson]:
+        """
+        Parse lesson files for the given sources.
+
+        YAML parsing and validation are CPU-bound, so large batches are spread
+        over a process pool when workers is above 1. Results keep source order
+        either way, and per-lesson parse times in milliseconds are kept in
+        last_load_timings.
+
+        :param sources: scanned lesson sources
+
+        :return: loaded lessons in source order
+        """
+
+        if self.workers > 1 and len(sources) >= self.workers * PARALLEL_MIN_LESSONS_PER_WORKER:
+            results = self._load_in_pool(sources=sources)
+        else:
+            results = [self._load_lesson_timed(source=source) for source in sources]
+
+        self.last_load_timings = {lesson.slug: elapsed_ms for lesson, elapsed_ms in results}
+
+        return [lesson for lesson, _ in results]
+
+    def _load_in_pool(self, sources: list[LessonSource]) -> list[tuple[LoadedLesson, float]]:
+        """
+        Parse sources in worker processes.
+
+        Workers are started by a forkserver, so the pool is safe to create
+        from a process that already runs threads.
+
+        :param sources: scanned lesson sources
+
+        :return: loaded lessons with parse times, in source order
+        """
+        chunksize = max(1, len(sources) // (self.workers * PARALLEL_CHUNKS_PER_WORKER))
+
+        with ProcessPoolExecutor(
+            max_workers=self.workers,
+            mp_context=multiprocessing.get_context("forkserver"),
+            initializer=_init_worker_loader,
+            initargs=(self.root_dir, self.parse_cache.cache_dir),
+        ) as executor:
+            return list(executor.map(_load_lesson_in_worker, sources, chunksize=chunksize))
+
+    def _load_lesson_timed(self, source: LessonSource) -> tuple[LoadedLesson, float]:
+        started = time.perf_counter()
+        lesson = self._load_lesson(source=source)
+
+        return lesson, (time.perf_counter() - started) * 1000
+
+    def _load_lesson(self, source: LessonSource) -> LoadedLesson:
+        lesson_dir = source.source_dir
+        lesson_meta = self._load_meta(lesson_dir=lesson_dir)
+        lesson_cases = self._load_cases(lesson_dir=lesson_dir)
+        lesson_quiz = self._load_quiz(lesson_dir=lesson_dir)
+        theory = self._read_text(path=lesson_dir / LESSON_THEORY_FILENAME)
+        starter_code = self._read_text(path=lesson_dir / LESSON_STARTER_FILENAME)
+
+        return LoadedLesson(
+            slug=source.slug,
+            order=source.order,
+            name=lesson_meta.title,
+            body_markdown=theory,
+            code_editor_default=starter_code,
+            cases=lesson_cases.cases,
+            questions=lesson_quiz.questions,
+            source_dir=lesson_dir,
+            content_hash=source.content_hash,
+        )
 
     def _discover_lesson_dirs(self) -> list[Path]:
         lesson_dirs = []
@@ -81,6 +207,25 @@ class LessonsLoader:
 
         return slug, ".".join(order_segments)
 
+    @staticmethod
+    def _fingerprint(lesson_dir: Path) -> FileFingerprint:
+        fingerprint: FileFingerprint = []
+        for filename in LESSON_FILENAMES:
+            stat = (lesson_dir / filename).stat()
+            fingerprint.append([filename, stat.st_mtime_ns, stat.st_size])
+
+        return fingerprint
+
+    def _hash_lesson_dir(self, lesson_dir: Path) -> str:
+        digest = hashlib.sha256()
+        digest.update(lesson_dir.relative_to(self.root_dir).as_posix().encode("utf-8"))
+        for filename in LESSON_FILENAMES:
+            content = (lesson_dir / filename).read_bytes()
+            digest.update(f"\0{filename}\0{len(content)}\0".encode())
+            digest.update(content)
+
+        return digest.hexdigest()
+
     def _load_meta(self, lesson_dir: Path) -> LessonMetaFile:
         payload = self._read_yaml(path=lesson_dir / LESSON_META_FILENAME)
         return LessonMetaFile.model_validate(obj=payload)
@@ -99,17 +244,22 @@ class LessonsLoader:
             return LessonQuizFile(questions=[])
         return LessonQuizFile.model_validate(obj=payload)
 
-    @staticmethod
-    def _read_yaml(path: Path) -> dict:
+    def _read_yaml(self, path: Path) -> dict:
         if not path.exists():
             raise FileNotFoundError(path)
 
+        stat = path.stat()
+        cached = self.parse_cache.get(path=path, stat=stat)
+        if cached is not None:
+            return cached
+
         content = path.read_text(encoding="utf-8")
-        payload = yaml.safe_load(stream=content) or {}
+        payload = yaml.load(stream=content, Loader=YAML_LOADER) or {}
         if not isinstance(payload, dict):
             message = f"yaml root must be mapping: {path}"
             raise TypeError(message)
 
+        self.parse_cache.put(path=path, stat=stat, payload=payload)
         return payload
 
     @staticmethod
@@ -118,3 +268,37 @@ class LessonsLoader:
             raise FileNotFoundError(path)
 
         return path.read_text(encoding="utf-8")
+
+
+def _init_worker_loader(root_dir: Path, parse_cache_dir: Path | None) -> None:
+    """
+    Build the loader used by a parsing worker process.
+
+    :param root_dir: lessons root directory
+    :param parse_cache_dir: parse cache directory, or None when disabled
+
+    :return: None
+    """
+    global _worker_loader  # noqa: PLW0603
+
+    _worker_loader = LessonsLoader(
+        root_dir=root_dir,
+        validator=LessonsContentValidator(),
+        parse_cache=LessonsParseCache(cache_dir=parse_cache_dir),
+    )
+
+
+def _load_lesson_in_worker(source: LessonSource) -> tuple[LoadedLesson, float]:
+    """
+    Parse one lesson in a worker process.
+
+    :param source: scanned lesson source
+
+    :return: loaded lesson with parse time in milliseconds
+    """
+
+    if _worker_loader is None:
+        message = "lesson loader worker is not initialized."
+        raise RuntimeError(message)
+
+    return _worker_loader._load_lesson_timed(source=source)
@@ -0,0 +1,116 @@
+import json
+import logging
+import os
+from pathlib import Path
+
+logger = logging.getLogger(__name__)
+
+MANIFEST_VERSION = 1
+
+type FileFingerprint = list[list[str | int]]
+
+
+class LessonsManifest:
+    """
+    Local cache of lesson content hashes keyed by file path, mtime and size.
+
+    A lesson directory whose files still have the recorded stats is assumed
+    unchanged, so its hash is reused without reading any file content.
+    """
+
+    def __init__(self, path: Path | None) -> None:
+        """
+        Initialize lessons manifest.
+
+        :param path: manifest file, or None to keep the manifest in memory only
+
+        :return: None
+        """
+        self.path = path
+        self._entries: dict[str, dict[str, FileFingerprint | str]] | None = None
+        self._seen: dict[str, dict[str, FileFingerprint | str]] = {}
+
+    def lookup(self, lesson_dir: Path, fingerprint: FileFingerprint) -> str | None:
+        """
+        Get the recorded hash of a lesson directory if its files did not change.
+
+        :param lesson_dir: lesson directory
+        :param fingerprint: current (name, mtime_ns, size) of lesson files
+
+        :return: content hash or None
+        """
+        entry = self._get_entries().get(str(lesson_dir))
+
+        if not isinstance(entry, dict) or entry.get("files") != fingerprint:
+            return None
+
+        content_hash = entry.get("hash")
+
+        return content_hash if isinstance(content_hash, str) else None
+
+    def record(self, lesson_dir: Path, fingerprint: FileFingerprint, content_hash: str) -> None:
+        """
+        Remember the hash of a lesson directory for the next scan.
+
+        :param lesson_dir: lesson directory
+        :param fingerprint: current (name, mtime_ns, size) of lesson files
+        :param content_hash: lesson content hash
+
+        :return: None
+        """
+        self._seen[str(lesson_dir)] = {"files": fingerprint, "hash": content_hash}
+
+    def save(self) -> None:
+        """
+        Persist entries recorded during the current scan.
+
+        Directories that were not seen again are dropped. The file is replaced
+        atomically, and a failed write only costs re-hashing on the next scan.
+
+        :return: None
+        """
+        entries = self._seen
+        self._entries = entries
+        self._seen = {}
+
+        if self.path is None:
+            return
+
+        payload = json.dumps({"version": MANIFEST_VERSION, "lessons": entries})
+        tmp_path = self.path.with_name(f"{self.path.name}.{os.getpid()}.tmp")
+
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path.write_text(payload, encoding="utf-8")
+            tmp_path.replace(self.path)
+        except OSError:
+            logger.warning("Could not write lessons manifest %s", self.path, exc_info=True)
+
+    def _get_entries(self) -> dict[str, dict[str, FileFingerprint | str]]:
+        """
+        Get manifest entries, reading the file on first use.
+
+        A missing, unreadable or outdated manifest is treated as empty.
+
+        :return: entries by lesson directory
+        """
+
+        if self._entries is not None:
+            return self._entries
+
+        self._entries = {}
+
+        if self.path is None:
+            return self._entries
+
+        try:
+            payload = json.loads(self.path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return self._entries
+
+        if isinstance(payload, dict) and payload.get("version") == MANIFEST_VERSION:
+            lessons = payload.get("lessons")
+            if isinstance(lessons, dict):
+                self._entries = lessons
+
+        return self._entries
@@ -0,0 +1,318 @@
+import html
+import re
+
+EXPECTED_OUTPUT_LANGS = frozenset({"expected", "expected_output"})
+PYTHON_LANGS = frozenset({"", "py", "python", "python3"})
+SAFE_LINK_PREFIXES = ("http://", "https://", "mailto:", "/", "#")
+
+PYTHON_KEYWORDS = frozenset(
+    {
+        "False", "None", "True", "and", "as", "assert", "async", "await", "break",
+        "class", "continue", "def", "del", "elif", "else", "except", "finally",
+        "for", "from", "global", "if", "import", "in", "is", "lambda", "nonlocal",
+        "not", "or", "pass", "raise", "return", "try", "while", "with", "yield",
+    },
+)
+
+_FENCE_RE = re.compile(r"^ {0,3}(`{3,}|~{3,})\s*([^`\s]*)[^`]*$")
+_HEADING_RE = re.compile(r"^ {0,3}(#{1,6})(?:\s+(.*?))?(?:\s+#+)?\s*$")
+_RULE_RE = re.compile(r"^ {0,3}([-*_])(?:\s*\1){2,}\s*$")
+_QUOTE_RE = re.compile(r"^ {0,3}> ?(.*)$")
+_LIST_ITEM_RE = re.compile(r"^( {0,3})([-*+]|\d{1,9}[.)])(\s+|$)(.*)$")
+
+_PYTHON_TOKEN_RE = re.compile(r"[A-Za-z_]\w*|\d+(?:\.\d+)?")
+_PYTHON_SEGMENT_RE = re.compile(
+    r"(?P<comment>#[^\n]*)"
+    r"|(?P<string>(?P<quote>'''|\"\"\"|['\"])(?:\\.|(?!(?P=quote)).)*?(?:(?P=quote)|$))",
+    re.DOTALL,
+)
+
+_ESCAPE_RE = re.compile(r"\\([\\`*_{}\[\]()#+\-.!>|~])")
+_CODE_SPAN_RE = re.compile(r"(`+)(.+?)(?<!`)\1(?!`)", re.DOTALL)
+_LINK_RE = re.compile(r"\[([^\]]+)\]\(\s*<?([^)\s>]+)>?(?:\s+\"([^\"]*)\")?\s*\)")
+_STRONG_RE = re.compile(r"\*\*(?=\S)(.+?)(?<=\S)\*\*|(?<!\w)__(?=\S)(.+?)(?<=\S)__(?!\w)", re.DOTALL)
+_EMPHASIS_RE = re.compile(r"\*(?=[^\s*])(.+?)(?<=[^\s*])\*|(?<!\w)_(?=[^\s_])(.+?)(?<=[^\s_])_(?!\w)", re.DOTALL)
+_HARD_BREAK_RE = re.compile(r"(?: {2,}|\\)\n")
+_PLACEHOLDER_RE = re.compile("\x00(\\d+)\x00")
+
+
+def render_markdown(source: str) -> str:
+    """
+    Render lesson markdown to sanitized HTML.
+
+    Covers the markdown the lessons use: headings, paragraphs, lists, block
+    quotes, rules, fenced code, inline code, emphasis and links. Raw HTML is
+    never passed through, all text is escaped and links only keep http(s),
+    mailto and relative targets, so the output is safe to inject as is.
+    Python code blocks get the ``hljs-*`` classes the frontend styles, and
+    ``expected`` fences render as the expected output callout.
+
+    :param source: markdown text
+
+    :return: HTML fragment
+    """
+    normalized = source.replace("\x00", "\ufffd").replace("\r\n", "\n").replace("\r", "\n")
+    lines = normalized.expandtabs(4).split("\n")
+
+    return "\n".join(_render_blocks(lines=lines, tight=False))
+
+
+def highlight_python(code: str) -> str:
+    """
+    Wrap keywords, names after ``def``/``class``, numbers, strings and comments in hljs spans.
+
+    :param code: python source
+
+    :return: escaped and highlighted HTML
+    """
+    parts = []
+    position = 0
+
+    for match in _PYTHON_SEGMENT_RE.finditer(code):
+        parts.append(_highlight_python_names(code=code[position:match.start()]))
+        kind = "comment" if match.group("comment") is not None else "string"
+        parts.append(f'<span class="hljs-{kind}">{_escape(match.group())}</span>')
+        position = match.end()
+
+    parts.append(_highlight_python_names(code=code[position:]))
+
+    return "".join(parts)
+
+
+def _render_blocks(lines: list[str], *, tight: bool) -> list[str]:
+    blocks = []
+    index = 0
+
+    while index < len(lines):
+        line = lines[index]
+
+        if not line.strip():
+            index += 1
+            continue
+
+        if fence := _FENCE_RE.match(line):
+            index, block = _render_fence(lines=lines, start=index, marker=fence.group(1), lang=fence.group(2))
+            blocks.append(block)
+            continue
+
+        if heading := _HEADING_RE.match(line):
+            level = len(heading.group(1))
+            blocks.append(f"<h{level}>{_render_inline(text=heading.group(2) or '')}</h{level}>")
+            index += 1
+            continue
+
+        if _RULE_RE.match(line):
+            blocks.append("<hr>")
+            index += 1
+            continue
+
+        if _QUOTE_RE.match(line):
+            quoted = []
+
+            while index < len(lines) and (quote := _QUOTE_RE.match(lines[index])):
+                quoted.append(quote.group(1))
+                index += 1
+
+            blocks.append(f"<blockquote>\n{'\n'.join(_render_blocks(lines=quoted, tight=False))}\n</blockquote>")
+            continue
+
+        if _LIST_ITEM_RE.match(line):
+            index, block = _render_list(lines=lines, start=index)
+            blocks.append(block)
+            continue
+
+        paragraph = [line.lstrip()]
+        index += 1
+
+        while index < len(lines) and lines[index].strip() and not _starts_block(line=lines[index]):
+            paragraph.append(lines[index].lstrip())
+            index += 1
+
+        text = _render_inline(text="\n".join(paragraph).rstrip())
+        blocks.append(text if tight else f"<p>{text}</p>")
+
+    return blocks
+
+
+def _starts_block(line: str) -> bool:
+    return any(
+        pattern.match(line)
+        for pattern in (_FENCE_RE, _HEADING_RE, _RULE_RE, _QUOTE_RE, _LIST_ITEM_RE)
+    )
+
+
+def _render_fence(lines: list[str], start: int, marker: str, lang: str) -> tuple[int, str]:
+    indent = len(lines[start]) - len(lines[start].lstrip(" "))
+    closing = re.compile(rf"^ {{0,3}}{re.escape(marker[0])}{{{len(marker)},}}\s*$")
+    body = []
+    index = start + 1
+
+    while index < len(lines) and not closing.match(lines[index]):
+        line = lines[index]
+        body.append(line[min(indent, len(line) - len(line.lstrip(" "))):])
+        index += 1
+
+    code = "\n".join(body)
+    lang = lang.lower()
+
+    if lang in EXPECTED_OUTPUT_LANGS:
+        block = f'<div class="callout"><p>Expected output:</p><pre><code>{_escape(code)}</code></pre></div>'
+    elif lang in PYTHON_LANGS:
+        block = f'<pre><code class="hljs language-python">{highlight_python(code=code)}</code></pre>'
+    else:
+        lang_class = re.sub(r"[^\w+-]", "", lang)
+        block = f'<pre><code class="language-{lang_class}">{_escape(code)}</code></pre>'
+
+    return index + 1, block
+
+
+def _render_list(lines: list[str], start: int) -> tuple[int, str]:
+    first = _LIST_ITEM_RE.match(lines[start])
+    ordered = first.group(2)[-1] in ".)"
+    marker_kind = first.group(2)[-1]
+    items: list[list[str]] = []
+    loose = False
+    index = start
+
+    while index < len(lines):
+        item = _LIST_ITEM_RE.match(lines[index])
+
+        if item is None or (item.group(2)[-1] in ".)") != ordered or item.group(2)[-1] != marker_kind:
+            break
+
+        content_indent = len(item.group(1)) + len(item.group(2)) + min(len(item.group(3)), 4)
+        item_lines = [item.group(4)]
+        index += 1
+
+        while index < len(lines):
+            line = lines[index]
+            line_indent = len(line) - len(line.lstrip(" "))
+
+            if not line.strip():
+                following = next((other for other in lines[index + 1:] if other.strip()), None)
+
+                if following is None or len(following) - len(following.lstrip(" ")) < content_indent:
+                    break
+
+                item_lines.append("")
+                index += 1
+                continue
+
+            if line_indent >= content_indent:
+                item_lines.append(line[content_indent:])
+            elif not _starts_block(line=line) and item_lines[-1].strip():
+                item_lines.append(line.strip())
+            else:
+                break
+
+            index += 1
+
+        items.append(item_lines)
+
+        if index < len(lines) and not lines[index].strip():
+            following = next((number for number in range(index, len(lines)) if lines[number].strip()), None)
+
+            if following is None or not _continues_list(line=lines[following], ordered=ordered, marker=marker_kind):
+                break
+
+            loose = True
+            index = following
+
+    loose = loose or any("" in item_lines[:-1] for item_lines in items)
+    rendered_items = []
+
+    for item_lines in items:
+        item_blocks = _render_blocks(lines=item_lines, tight=not loose)
+        rendered_items.append(f"<li>{'\n'.join(item_blocks)}</li>")
+
+    tag = "ol" if ordered else "ul"
+    start_attr = ""
+
+    if ordered and (start_number := int(first.group(2)[:-1])) != 1:
+        start_attr = f' start="{start_number}"'
+
+    return index, f"<{tag}{start_attr}>\n{'\n'.join(rendered_items)}\n</{tag}>"
+
+
+def _continues_list(line: str, *, ordered: bool, marker: str) -> bool:
+    item = _LIST_ITEM_RE.match(line)
+
+    return item is not None and (item.group(2)[-1] in ".)") == ordered and item.group(2)[-1] == marker
+
+
+def _render_inline(text: str) -> str:
+    protected: list[str] = []
+
+    def _protect(value: str) -> str:
+        protected.append(value)
+        return f"\x00{len(protected) - 1}\x00"
+
+    text = _CODE_SPAN_RE.sub(
+        lambda match: _protect(value=f"<code>{_escape(_strip_code_span(value=match.group(2)))}</code>"),
+        text,
+    )
+    text = _ESCAPE_RE.sub(lambda match: _protect(value=_escape(match.group(1))), text)
+    text = _LINK_RE.sub(lambda match: _protect(value=_render_link(match=match)), text)
+    text = _render_emphasis(text=_escape(text))
+    text = _HARD_BREAK_RE.sub("<br>\n", text)
+
+    return _PLACEHOLDER_RE.sub(lambda match: protected[int(match.group(1))], text)
+
+
+def _render_emphasis(text: str) -> str:
+    text = _STRONG_RE.sub(lambda match: f"<strong>{match.group(1) or match.group(2)}</strong>", text)
+
+    return _EMPHASIS_RE.sub(lambda match: f"<em>{match.group(1) or match.group(2)}</em>", text)
+
+
+def _render_link(match: re.Match[str]) -> str:
+    label = _render_inline(text=match.group(1))
+    href = match.group(2)
+
+    if not href.lower().startswith(SAFE_LINK_PREFIXES) and ":" in href.split("/", 1)[0]:
+        return label
+
+    title = match.group(3)
+    title_attr = f' title="{html.escape(title)}"' if title else ""
+
+    return f'<a href="{html.escape(href)}"{title_attr}>{label}</a>'
+
+
+def _strip_code_span(value: str) -> str:
+    value = value.replace("\n", " ")
+
+    if len(value) > 2 and value.startswith(" ") and value.endswith(" ") and value.strip():
+        return value[1:-1]
+
+    return value
+
+
+def _highlight_python_names(code: str) -> str:
+    parts = []
+    position = 0
+    expect_title = False
+
+    for match in _PYTHON_TOKEN_RE.finditer(code):
+        token = match.group()
+        parts.append(_escape(code[position:match.start()]))
+
+        if token[0].isdigit():
+            parts.append(f'<span class="hljs-number">{token}</span>')
+        elif expect_title:
+            parts.append(f'<span class="hljs-title">{token}</span>')
+            expect_title = False
+        elif token in PYTHON_KEYWORDS:
+            parts.append(f'<span class="hljs-keyword">{token}</span>')
+            expect_title = token in {"class", "def"}
+        else:
+            parts.append(token)
+
+        position = match.end()
+
+    parts.append(_escape(code[position:]))
+
+    return "".join(parts)
+
+
+def _escape(value: str) -> str:
+    return html.escape(value, quote=False)
@@ -109,23 +109,27 @@ class LessonQuizFile(ExtendedBaseModel):
     questions: list[LessonQuizQuestionFileItem] = Field(default_factory=list)
 
 
-class LoadedLesson(ExtendedBaseModel):
+class LessonSource(ExtendedBaseModel):
     model_config = ConfigDict(extra="forbid")
 
     slug: str
     order: str
-    name: str
-    body_markdown: str
-    code_editor_default: str
-    cases: list[LessonCaseFileItem]
-    questions: list[LessonQuizQuestionFileItem]
     source_dir: Path
+    content_hash: str
 
     @field_validator("order", mode="before")
     @classmethod
     def validate_order(cls, value: str | int | float) -> str:
         return normalize_lesson_order(value=value)
 
+
+class LoadedLesson(LessonSource):
+    name: str
+    body_markdown: str
+    code_editor_default: str
+    cases: list[LessonCaseFileItem]
+    questions: list[LessonQuizQuestionFileItem]
+
     @field_validator("slug", "name", "body_markdown")
     @classmethod
     def validate_non_blank(cls, value: str) -> str:
@@ -0,0 +1,104 @@
+import hashlib
+import json
+import logging
+import os
+from pathlib import Path
+
+logger = logging.getLogger(__name__)
+
+
+class LessonsParseCache:
+    """
+    On-disk JSON copies of parsed lesson YAML files.
+
+    Each entry remembers the mtime and size of its source file and is ignored
+    as soon as either changes, so repeat syncs and boots skip YAML parsing for
+    files nobody touched.
+    """
+
+    def __init__(self, cache_dir: Path | None) -> None:
+        """
+        Initialize lessons parse cache.
+
+        :param cache_dir: cache directory, or None to disable caching
+
+        :return: None
+        """
+        self.cache_dir = cache_dir
+
+    def get(self, path: Path, stat: os.stat_result) -> dict | None:
+        """
+        Get cached parse result for a source file.
+
+        :param path: source yaml file
+        :param stat: current source file stat
+
+        :return: parsed mapping, or None when missing or stale
+        """
+        entry_path = self._entry_path(path=path)
+
+        if entry_path is None:
+            return None
+
+        try:
+            entry = json.loads(entry_path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return None
+
+        if (
+                not isinstance(entry, dict)
+                or entry.get("mtime_ns") != stat.st_mtime_ns
+                or entry.get("size") != stat.st_size
+                or not isinstance(entry.get("payload"), dict)
+        ):
+            return None
+
+        return entry["payload"]
+
+    def put(self, path: Path, stat: os.stat_result, payload: dict) -> None:
+        """
+        Store parse result for a source file.
+
+        Payloads that are not JSON-serializable and failed writes are skipped,
+        since the cache is only an optimization.
+
+        :param path: source yaml file
+        :param stat: source file stat taken before parsing
+        :param payload: parsed mapping
+
+        :return: None
+        """
+        entry_path = self._entry_path(path=path)
+
+        if entry_path is None:
+            return
+
+        try:
+            content = json.dumps({"mtime_ns": stat.st_mtime_ns, "size": stat.st_size, "payload": payload})
+        except (TypeError, ValueError):
+            return
+
+        tmp_path = entry_path.with_name(f"{entry_path.name}.{os.getpid()}.tmp")
+
+        try:
+            entry_path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path.write_text(content, encoding="utf-8")
+            tmp_path.replace(entry_path)
+        except OSError:
+            logger.warning("Could not write lesson parse cache entry %s", entry_path, exc_info=True)
+
+    def _entry_path(self, path: Path) -> Path | None:
+        """
+        Get the cache file for a source file.
+
+        :param path: source yaml file
+
+        :return: cache entry path, or None when caching is disabled
+        """
+
+        if self.cache_dir is None:
+            return None
+
+        key = hashlib.sha256(str(path.resolve()).encode("utf-8")).hexdigest()
+
+        return self.cache_dir / f"{key}.json"
@@ -1,10 +1,12 @@
-from src.app.content.models import LoadedLesson
+from collections.abc import Sequence
+
+from src.app.content.models import LessonSource
 from src.app.domain.lesson_order import lesson_order_key
 
 
 class LessonsContentValidator:
     @staticmethod
-    def validate_lessons(lessons: list[LoadedLesson]) -> None:
+    def validate_lessons(lessons: Sequence[LessonSource]) -> None:
         if not lessons:
             message = "lessons directory must contain at least one lesson."
             raise ValueError(message)
@@ -0,0 +1,4 @@
+from src.app.core.cache.lesson_cache import LessonCache
+from src.app.core.cache.ttl_cache import TTLCache
+
+__all__ = ["LessonCache", "TTLCache"]
@@ -0,0 +1,104 @@
+from uuid import UUID
+
+from src.app.core.cache.ttl_cache import TTLCache
+from src.app.domain.models.dto.lesson import LessonDTO
+
+
+class LessonCache:
+    """
+    Caches lessons by id so hot read paths, such as code execution, skip the
+    database entirely.
+
+    Writes in this process invalidate entries through the lesson change hub;
+    the TTL bounds how long another worker may serve a lesson after a change.
+    """
+
+    def __init__(self, max_size: int, ttl_sec: float) -> None:
+        """
+        Initialize lesson cache.
+
+        :param max_size: max cached lessons
+        :param ttl_sec: entry lifetime
+
+        :return: None
+        """
+        self._cache: TTLCache[UUID, LessonDTO] = TTLCache(max_size=max_size, ttl_sec=ttl_sec)
+        self._generation = 0
+
+    @property
+    def hits(self) -> int:
+        """
+        Count lookups served from the cache.
+
+        :return: cache hits
+        """
+
+        return self._cache.hits
+
+    @property
+    def misses(self) -> int:
+        """
+        Count lookups that missed the cache.
+
+        :return: cache misses
+        """
+
+        return self._cache.misses
+
+    @property
+    def generation(self) -> int:
+        """
+        Get the invalidation generation.
+
+        Callers read it before loading a missed lesson and pass it to ``set``,
+        so a load that raced with an invalidation does not store the old
+        lesson.
+
+        :return: number of invalidations so far
+        """
+
+        return self._generation
+
+    def get(self, lesson_id: UUID) -> LessonDTO | None:
+        """
+        Get cached lesson by id.
+
+        :param lesson_id: lesson id
+
+        :return: cached lesson or None
+        """
+
+        return self._cache.get(key=lesson_id)
+
+    def set(self, lesson: LessonDTO, generation: int | None = None) -> None:
+        """
+        Cache loaded lesson.
+
+        :param lesson: loaded lesson
+        :param generation: generation read before the load; the lesson is not
+          stored if an invalidation happened since
+
+        :return: None
+        """
+
+        if generation is not None and generation != self._generation:
+            return
+
+        self._cache.set(key=lesson.id, value=lesson)
+
+    def invalidate(self, lesson_ids: list[UUID] | None = None) -> None:
+        """
+        Drop changed lessons, or every lesson when the change is not itemized.
+
+        :param lesson_ids: changed lesson ids or None
+
+        :return: None
+        """
+        self._generation += 1
+
+        if lesson_ids is None:
+            self._cache.clear()
+            return
+
+        for lesson_id in lesson_ids:
+            self._cache.pop(key=lesson_id)
@@ -0,0 +1,111 @@
+import time
+from collections import OrderedDict
+from collections.abc import Callable
+
+
+class TTLCache[K, V]:
+    """
+    Bounded in-process cache with per-entry expiry and LRU eviction.
+    """
+
+    def __init__(self, max_size: int, ttl_sec: float) -> None:
+        """
+        Initialize cache.
+
+        A non-positive ``ttl_sec`` or ``max_size`` disables caching, so callers
+        can switch caches off from settings without branching.
+
+        :param max_size: max number of entries
+        :param ttl_sec: entry lifetime in seconds
+
+        :return: None
+        """
+        self.max_size = max_size
+        self.ttl_sec = ttl_sec
+        self.hits = 0
+        self.misses = 0
+        self._entries: OrderedDict[K, tuple[float, V]] = OrderedDict()
+
+    @property
+    def enabled(self) -> bool:
+        return self.max_size > 0 and self.ttl_sec > 0
+
+    def get(self, key: K) -> V | None:
+        """
+        Get a live entry and mark it recently used.
+
+        :param key: cache key
+
+        :return: cached value or None
+        """
+        entry = self._entries.get(key)
+
+        if entry is None:
+            self.misses += 1
+            return None
+
+        expires_at, value = entry
+
+        if expires_at <= time.monotonic():
+            del self._entries[key]
+            self.misses += 1
+            return None
+
+        self._entries.move_to_end(key)
+        self.hits += 1
+
+        return value
+
+    def set(self, key: K, value: V) -> None:
+        """
+        Store an entry, evicting the least recently used one when full.
+
+        :param key: cache key
+        :param value: value to cache
+
+        :return: None
+        """
+        if not self.enabled:
+            return
+
+        self._entries[key] = (time.monotonic() + self.ttl_sec, value)
+        self._entries.move_to_end(key)
+
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+
+    def pop(self, key: K) -> None:
+        """
+        Drop an entry if present.
+
+        :param key: cache key
+
+        :return: None
+        """
+        self._entries.pop(key, None)
+
+    def pop_where(self, predicate: Callable[[V], bool]) -> int:
+        """
+        Drop every entry whose value matches predicate.
+
+        :param predicate: value filter
+
+        :return: number of dropped entries
+        """
+        keys = [key for key, (_, value) in self._entries.items() if predicate(value)]
+
+        for key in keys:
+            del self._entries[key]
+
+        return len(keys)
+
+    def clear(self) -> None:
+        """
+        Drop all entries.
+
+        :return: None
+        """
+        self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
@@ -0,0 +1,3 @@
+from src.app.core.db.shared_engine import SharedDatabaseEngine
+
+__all__ = ["SharedDatabaseEngine"]
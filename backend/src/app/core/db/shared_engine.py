@@ -0,0 +1,111 @@
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, async_sessionmaker, create_async_engine
+
+from src.app.core.observability.db_pool import InstrumentedAsyncQueuePool
+
+
+class SharedDatabaseEngine:
+    """
+    Owns the process-wide async engine and its connection pool.
+
+    The session factory exists from import time so it can be handed to
+    long-lived services, and is bound to the engine once the engine opens.
+    Opening in the application lifespan, instead of at import, keeps
+    engines out of processes that never touch the database and lets
+    shutdown close pooled connections cleanly.
+    """
+
+    def __init__(
+            self,
+            url: str,
+            pool_size: int,
+            max_overflow: int,
+            pool_timeout_sec: float,
+            pool_recycle_sec: int,
+            *,
+            pool_pre_ping: bool,
+    ) -> None:
+        """
+        Initialize shared database engine holder.
+
+        :param url: database URL
+        :param pool_size: connections kept open in the pool
+        :param max_overflow: extra connections allowed during bursts
+        :param pool_timeout_sec: how long a checkout waits for a free connection
+        :param pool_recycle_sec: connection age after which it is replaced
+        :param pool_pre_ping: test connections on checkout and replace dead ones
+
+        :return: None
+        """
+        self.url = url
+        self.pool_size = pool_size
+        self.max_overflow = max_overflow
+        self.pool_timeout_sec = pool_timeout_sec
+        self.pool_recycle_sec = pool_recycle_sec
+        self.pool_pre_ping = pool_pre_ping
+        self.session_factory = async_sessionmaker(class_=AsyncSession, expire_on_commit=False)
+        self._engine: AsyncEngine | None = None
+
+    @property
+    def is_open(self) -> bool:
+        """
+        Check whether the engine is open.
+
+        :return: True if the engine exists
+        """
+
+        return self._engine is not None
+
+    def open(self) -> AsyncEngine:
+        """
+        Create the engine if it is not open yet and bind the session factory to it.
+
+        The application lifespan opens the engine on startup; lazy creation
+        covers entrypoints that run without a lifespan, such as scripts.
+
+        :return: async engine
+        """
+
+        if self._engine is None:
+            self._engine = create_async_engine(
+                self.url,
+                poolclass=InstrumentedAsyncQueuePool,
+                pool_size=self.pool_size,
+                max_overflow=self.max_overflow,
+                pool_timeout=self.pool_timeout_sec,
+                pool_recycle=self.pool_recycle_sec,
+                pool_pre_ping=self.pool_pre_ping,
+            )
+            self.session_factory.configure(bind=self._engine)
+
+        return self._engine
+
+    async def dispose(self) -> None:
+        """
+        Close pooled connections and drop the engine.
+
+        :return: None
+        """
+
+        if self._engine is not None:
+            await self._engine.dispose()
+            self._engine = None
+
+    def pool_status(self) -> dict[str, int]:
+        """
+        Get connection counts of the pool.
+
+        :return: connections by state, empty while the engine is closed
+        """
+
+        if self._engine is None:
+            return {}
+
+        pool = self._engine.pool
+
+        return {
+            "checked_out": pool.checkedout(),
+            "idle": pool.checkedin(),
+            "overflow": max(pool.overflow(), 0),
+            "size": pool.size(),
+            "limit": self.pool_size + self.max_overflow,
+        }
@@ -1,18 +1,99 @@
 from collections.abc import AsyncGenerator
 
-from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from fastapi import Depends
+from sqlalchemy.ext.asyncio import AsyncSession
 
+from src.app.core.db import SharedDatabaseEngine
+from src.app.core.observability import QueryTracker
+from src.app.core.observability.registry import DB_POOL_CONNECTIONS, METRICS_REGISTRY
 from src.cfg.cfg import settings
 
-engine = create_async_engine(settings.database.url)
-session_factory = async_sessionmaker(bind=engine, class_=AsyncSession, expire_on_commit=False)
+
+def build_database(url: str) -> SharedDatabaseEngine:
+    """
+    Build an engine holder with the configured pool settings.
+
+    :param url: database URL
+
+    :return: shared database engine
+    """
+
+    return SharedDatabaseEngine(
+        url=url,
+        pool_size=settings.database.pool_size,
+        max_overflow=settings.database.max_overflow,
+        pool_timeout_sec=settings.database.pool_timeout_sec,
+        pool_recycle_sec=settings.database.pool_recycle_sec,
+        pool_pre_ping=settings.database.pool_pre_ping,
+    )
+
+
+DATABASE = build_database(url=settings.database.url)
+DATABASE_REPLICA = (
+    build_database(url=settings.database.replica_url)
+    if settings.database.replica_url is not None
+    else None
+)
+session_factory = DATABASE.session_factory
+QUERY_TRACKER = QueryTracker(slow_query_threshold_ms=settings.observability.slow_query_threshold_ms)
+QUERY_TRACKER.install()
+
+
+def collect_pool_metrics() -> None:
+    """
+    Copy database pool occupancy into the pool gauges.
+
+    :return: None
+    """
+    for pool, database in (("primary", DATABASE), ("replica", DATABASE_REPLICA)):
+        if database is None:
+            continue
+
+        for state, value in database.pool_status().items():
+            DB_POOL_CONNECTIONS.set(value=value, labels=(pool, state))
+
+
+METRICS_REGISTRY.add_collector(collector=collect_pool_metrics)
 
 
 async def get_session() -> AsyncGenerator[AsyncSession]:
     """
     Yields a new SQLAlchemy AsynsSession.
 
+    The session checks out a pooled connection only when it executes its
+    first statement, so requests answered from in-process caches never
+    touch the pool even though their repositories hold a session.
+
     :return: async session generator
     """
+    DATABASE.open()
+
     async with session_factory() as session:
         yield session
+
+
+async def get_read_session(
+        primary_session: AsyncSession = Depends(get_session),
+) -> AsyncGenerator[AsyncSession]:
+    """
+    Yields a session for read-only dependency scopes.
+
+    With ``DB_REPLICA_HOST`` set the session reads from the replica pool,
+    otherwise it is the request's primary session. Sessions connect lazily,
+    so the unused primary session costs no connection. Flows that read their
+    own writes, such as profile and progress updates, keep using
+    ``get_session`` because the replica may lag behind the primary.
+
+    :param primary_session: request's primary session
+
+    :return: async session generator
+    """
+
+    if DATABASE_REPLICA is None:
+        yield primary_session
+        return
+
+    DATABASE_REPLICA.open()
+
+    async with DATABASE_REPLICA.session_factory() as session:
+        yield session
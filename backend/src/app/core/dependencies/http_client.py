@@ -0,0 +1,21 @@
+import httpx
+
+from src.app.core.http.shared_client import SharedHttpClient
+from src.cfg.cfg import settings
+
+HTTP_CLIENT = SharedHttpClient(
+    timeout_sec=settings.http_client.timeout_sec,
+    max_connections=settings.http_client.max_connections,
+    max_keepalive_connections=settings.http_client.max_keepalive_connections,
+    keepalive_expiry_sec=settings.http_client.keepalive_expiry_sec,
+)
+
+
+def get_http_client() -> httpx.AsyncClient:
+    """
+    Provide the process-wide pooled HTTP client.
+
+    :return: pooled HTTP client
+    """
+
+    return HTTP_CLIENT.open()
@@ -0,0 +1,78 @@
+from pathlib import Path
+
+from src.app.core.observability import (
+    NOOP_STAGE_TIMER,
+    HistogramFamily,
+    LoopLagMonitor,
+    MetricsExporter,
+    SamplingProfiler,
+    StageTimer,
+)
+from src.app.core.observability.registry import (
+    EVENT_LOOP_LAG,
+    EVENT_LOOP_STALLS,
+    EXECUTION_STAGE_DURATION,
+    METRICS_REGISTRY,
+)
+from src.cfg.cfg import settings
+
+EXECUTION_STAGE_HISTOGRAMS = EXECUTION_STAGE_DURATION
+METRICS_EXPORTER = MetricsExporter(
+    registry=METRICS_REGISTRY,
+    multiprocess_dir=(
+        Path(settings.observability.metrics_multiprocess_dir)
+        if settings.observability.metrics_multiprocess_dir
+        else None
+    ),
+    flush_interval_sec=settings.observability.metrics_flush_interval_sec,
+)
+LOOP_LAG_MONITOR = LoopLagMonitor(
+    interval_ms=settings.observability.loop_monitor_interval_ms,
+    stall_threshold_ms=settings.observability.loop_monitor_stall_threshold_ms,
+    lag_histograms=EVENT_LOOP_LAG,
+    stalls=EVENT_LOOP_STALLS,
+)
+SAMPLING_PROFILER = SamplingProfiler()
+
+
+def get_execution_stage_histograms() -> HistogramFamily:
+    """
+    Provide the process-wide execution stage histograms.
+
+    :return: execution stage histograms
+    """
+
+    return EXECUTION_STAGE_HISTOGRAMS
+
+
+def get_execution_stage_timer() -> StageTimer:
+    """
+    Build a stage timer for one execution request.
+
+    :return: recording timer when stage timing is enabled, shared no-op timer otherwise
+    """
+
+    if not settings.observability.stage_timing_enabled:
+        return NOOP_STAGE_TIMER
+
+    return StageTimer(histograms=EXECUTION_STAGE_HISTOGRAMS)
+
+
+def get_metrics_exporter() -> MetricsExporter:
+    """
+    Provide the process-wide metrics exporter.
+
+    :return: metrics exporter
+    """
+
+    return METRICS_EXPORTER
+
+
+def get_sampling_profiler() -> SamplingProfiler:
+    """
+    Provide the process-wide sampling profiler.
+
+    :return: sampling profiler
+    """
+
+    return SAMPLING_PROFILER
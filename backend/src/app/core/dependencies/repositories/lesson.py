@@ -1,7 +1,7 @@
 from fastapi import Depends
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from src.app.core.dependencies.db import get_session
+from src.app.core.dependencies.db import get_read_session, get_session
 from src.app.domain.repositories.lesson_repository import LessonRepository
 
 
@@ -17,3 +17,17 @@ def get_lesson_repository(
     """
 
     return LessonRepository(session=session)
+
+
+def get_lesson_read_repository(
+        session: AsyncSession = Depends(get_read_session),
+) -> LessonRepository:
+    """
+    Constructs an instance of LessonRepository for read-only dependency scopes.
+
+    :param session: read session, bound to the replica when one is configured
+
+    :return: lesson repository
+    """
+
+    return LessonRepository(session=session)
@@ -1,7 +1,7 @@
 from fastapi import Depends
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from src.app.core.dependencies.db import get_session
+from src.app.core.dependencies.db import get_read_session, get_session
 from src.app.domain.repositories import UserRepository
 
 
@@ -17,3 +17,17 @@ def get_user_repository(
     """
 
     return UserRepository(session=session)
+
+
+def get_user_read_repository(
+        session: AsyncSession = Depends(get_read_session),
+) -> UserRepository:
+    """
+    Constructs an instance of UserRepository for read-only dependency scopes.
+
+    :param session: read session, bound to the replica when one is configured
+
+    :return: user repository
+    """
+
+    return UserRepository(session=session)
@@ -2,15 +2,18 @@ from fastapi import Depends
 from passlib.context import CryptContext
 
 from src.app.core.dependencies.security.crypt_context import get_crypt_context
+from src.app.core.dependencies.security.password_executor import get_password_hash_executor
 from src.app.core.security.auth_manager import AuthManager
+from src.app.core.security.password_executor import PasswordHashExecutor
 
 
 def get_auth_manager(
         context: CryptContext = Depends(get_crypt_context),
+        executor: PasswordHashExecutor = Depends(get_password_hash_executor),
 ) -> AuthManager:
     """
     Constructs an instance of AuthManager with passlib.CryptContext injected.
 
     :return: AuthManager object.
     """
-    return AuthManager(context=context)
+    return AuthManager(context=context, executor=executor)
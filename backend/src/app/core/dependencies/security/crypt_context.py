@@ -1,11 +1,17 @@
+from functools import cache
+
 from passlib.context import CryptContext
 
 
+@cache
 def get_crypt_context() -> CryptContext:
     """
     Constructs an instance of passlib.CryptContext, which handles
     hash operations (hashing a password, verifying a hash etc).
 
+    The context is immutable once built, so one instance is shared by all
+    requests and hashing threads.
+
     :return: CryptContext object.
     """
 
@@ -1,23 +1,45 @@
 from fastapi import Depends, Request
 
+from src.app.core.dependencies.security.user import get_optional_user_from_jwt
 from src.app.core.dependencies.services.execution_rate_limiter import (
     get_execution_rate_limiter,
 )
+from src.app.domain.models.dto.user import UserDTO
 from src.app.domain.services.execution_rate_limiter import ExecutionRateLimiter
 
 
-def enforce_execution_rate_limit(
+def build_rate_limit_key(request: Request, user: UserDTO | None) -> str:
+    """
+    Build rate limit key for the caller.
+
+    Authenticated callers are keyed by user id, so users behind one NAT do not
+    share a budget. Anonymous callers fall back to the client address.
+
+    :param request: request context
+    :param user: authenticated user or None
+
+    :return: rate limit key
+    """
+    if user is not None:
+        return f"user:{user.id}"
+
+    client = request.client
+
+    return f"ip:{client.host if client else 'unknown'}"
+
+
+async def enforce_execution_rate_limit(
         request: Request,
         rate_limiter: ExecutionRateLimiter = Depends(get_execution_rate_limiter),
+        user: UserDTO | None = Depends(get_optional_user_from_jwt),
 ) -> None:
     """
     Enforce code execution rate limit.
 
     :param request: request context
     :param rate_limiter: execution rate limiter
+    :param user: authenticated user or None
 
     :return: None
     """
-    client = request.client
-    key = client.host if client else "unknown"
-    rate_limiter.check(key=key)
+    await rate_limiter.check(key=build_rate_limit_key(request=request, user=user))
@@ -0,0 +1,17 @@
+from src.app.core.security.password_executor import PasswordHashExecutor
+from src.cfg.cfg import settings
+
+PASSWORD_HASH_EXECUTOR = PasswordHashExecutor(
+    max_workers=settings.auth.hash_workers,
+    max_concurrent_logins=settings.auth.login_hash_concurrency,
+)
+
+
+def get_password_hash_executor() -> PasswordHashExecutor:
+    """
+    Provide the process-wide password hash executor.
+
+    :return: password hash executor
+    """
+
+    return PASSWORD_HASH_EXECUTOR
@@ -1,11 +1,15 @@
+from uuid import UUID
+
 from fastapi import Depends
 from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
 from jwt import decode
 from jwt.exceptions import InvalidTokenError
 
+from src.app.core.dependencies.security.user_cache import get_user_cache
 from src.app.core.dependencies.services.user import get_user_service
 from src.app.core.exceptions.auth_exc import AuthenticationRequired, Unauthorized
 from src.app.core.exceptions.base_exc import NotFoundError
+from src.app.core.security.user_cache import UserCache
 from src.app.domain.models.dto.user import UserDTO
 from src.app.domain.models.enums.role import UserRole
 from src.app.domain.services import UserService
@@ -17,50 +21,74 @@ scheme_factory = HTTPBearer(auto_error=False)
 async def get_user_from_jwt(
         user_service: UserService = Depends(get_user_service),
         jwt: HTTPAuthorizationCredentials = Depends(scheme_factory),
+        user_cache: UserCache = Depends(get_user_cache),
 ) -> UserDTO:
     """
     Gets user from the given JSON Web Token.
 
-    :param user_service:
-    :param jwt:
-    :return:
+    When ``AUTH_TRUST_TOKEN_CLAIMS`` is enabled, the identity is built from the
+    signed ``uid`` and ``role`` claims without touching the database. Such a
+    user has no email, so endpoints that return the profile must use
+    ``get_user_profile_from_jwt`` instead.
+
+    :param user_service: user service
+    :param jwt: authorization credentials
+    :param user_cache: resolved user cache
+
+    :return: authenticated user
     """
+    claims = _decode_claims(jwt=jwt)
 
-    if not jwt:
-        raise AuthenticationRequired
+    if settings.auth.trust_token_claims:
+        trusted_user = _build_user_from_claims(claims=claims)
 
-    try:
-        decoded_token: dict = decode(
-            jwt=jwt.credentials,
-            key=settings.auth.jwt_secret_key,
-            algorithms=[settings.auth.jwt_algorithm],
-        )
+        if trusted_user is not None:
+            return trusted_user
 
-        username = decoded_token.get('sub')
+    return await _resolve_user(
+        username=claims["sub"],
+        user_service=user_service,
+        user_cache=user_cache,
+    )
 
-        if not username:
-            raise AuthenticationRequired
 
-    except InvalidTokenError as e:
-        raise AuthenticationRequired from e
+async def get_user_profile_from_jwt(
+        user_service: UserService = Depends(get_user_service),
+        jwt: HTTPAuthorizationCredentials = Depends(scheme_factory),
+        user_cache: UserCache = Depends(get_user_cache),
+) -> UserDTO:
+    """
+    Gets the full user profile from the given JSON Web Token.
 
-    try:
-        user = await user_service.get_by_username(username=username)
-    except NotFoundError as e:
-        raise AuthenticationRequired from e
+    Unlike ``get_user_from_jwt`` this never trusts token claims, so the
+    result always carries the stored profile fields.
 
-    return user
+    :param user_service: user service
+    :param jwt: authorization credentials
+    :param user_cache: resolved user cache
+
+    :return: authenticated user
+    """
+    claims = _decode_claims(jwt=jwt)
+
+    return await _resolve_user(
+        username=claims["sub"],
+        user_service=user_service,
+        user_cache=user_cache,
+    )
 
 
 async def get_optional_user_from_jwt(
         user_service: UserService = Depends(get_user_service),
         jwt: HTTPAuthorizationCredentials | None = Depends(scheme_factory),
+        user_cache: UserCache = Depends(get_user_cache),
 ) -> UserDTO | None:
     """
     Gets optional user from the given JSON Web Token.
 
     :param user_service: user service
     :param jwt: authorization credentials
+    :param user_cache: resolved user cache
 
     :return: user dto or None
     """
@@ -71,6 +99,7 @@ async def get_optional_user_from_jwt(
     return await get_user_from_jwt(
         user_service=user_service,
         jwt=jwt,
+        user_cache=user_cache,
     )
 
 
@@ -89,3 +118,80 @@ async def require_admin_user(
         raise Unauthorized
 
     return user
+
+
+def _decode_claims(jwt: HTTPAuthorizationCredentials | None) -> dict:
+    """
+    Decode and verify token claims.
+
+    :param jwt: authorization credentials
+
+    :return: decoded claims with a non-empty ``sub``
+    """
+
+    if not jwt:
+        raise AuthenticationRequired
+
+    try:
+        decoded_token: dict = decode(
+            jwt=jwt.credentials,
+            key=settings.auth.jwt_secret_key,
+            algorithms=[settings.auth.jwt_algorithm],
+        )
+    except InvalidTokenError as e:
+        raise AuthenticationRequired from e
+
+    if not decoded_token.get('sub'):
+        raise AuthenticationRequired
+
+    return decoded_token
+
+
+def _build_user_from_claims(claims: dict) -> UserDTO | None:
+    """
+    Build user identity from signed token claims.
+
+    Tokens issued before the ``uid`` claim existed return None, so they fall
+    back to the regular lookup instead of being rejected.
+
+    :param claims: decoded token claims
+
+    :return: user dto or None
+    """
+    user_id = claims.get("uid")
+    role = claims.get("role")
+
+    if not user_id or not role:
+        return None
+
+    try:
+        return UserDTO(id=UUID(user_id), username=claims["sub"], email=None, role=UserRole(role))
+    except ValueError as e:
+        raise AuthenticationRequired from e
+
+
+async def _resolve_user(username: str, user_service: UserService, user_cache: UserCache) -> UserDTO:
+    """
+    Resolve user by username through the user cache.
+
+    :param username: token subject
+    :param user_service: user service
+    :param user_cache: resolved user cache
+
+    :return: user dto
+    """
+    cached = user_cache.get(username=username)
+
+    if cached is not None:
+        return cached
+
+    generation = user_cache.generation
+
+    try:
+        user = await user_service.get_by_username(username=username)
+    except NotFoundError as e:
+        raise AuthenticationRequired from e
+
+    user_cache.set(user=user, generation=generation)
+
+    return user
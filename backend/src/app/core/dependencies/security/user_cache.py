@@ -0,0 +1,31 @@
+from src.app.core.observability.registry import CACHE_HITS, CACHE_MISSES, METRICS_REGISTRY
+from src.app.core.security.user_cache import UserCache
+from src.cfg.cfg import settings
+
+USER_CACHE = UserCache(
+    max_size=settings.auth.user_cache_max_size,
+    ttl_sec=settings.auth.user_cache_ttl_sec,
+)
+
+
+def collect_user_cache_metrics() -> None:
+    """
+    Copy user cache hit and miss counters into the cache metrics.
+
+    :return: None
+    """
+    CACHE_HITS.set(value=USER_CACHE.hits, labels=("user",))
+    CACHE_MISSES.set(value=USER_CACHE.misses, labels=("user",))
+
+
+METRICS_REGISTRY.add_collector(collector=collect_user_cache_metrics)
+
+
+def get_user_cache() -> UserCache:
+    """
+    Provide the process-wide user cache.
+
+    :return: user cache
+    """
+
+    return USER_CACHE
@@ -2,7 +2,7 @@ from pathlib import Path
 
 from fastapi import Depends
 
-from src.app.core.dependencies.services.lesson import get_lesson_service
+from src.app.core.dependencies.services.lesson import get_lesson_read_service
 from src.app.core.dependencies.services.lesson_progress import get_lesson_progress_service
 from src.app.core.dependencies.services.piston import get_piston_service
 from src.app.domain.services.code_execution_service import CodeExecutionService
@@ -19,14 +19,14 @@ RESULT_PARSER = ExecutionResultParser(max_output_chars=settings.execution.max_ou
 
 
 def get_code_execution_service(
-        lesson_service: LessonService = Depends(get_lesson_service),
+        lesson_service: LessonService = Depends(get_lesson_read_service),
         code_runner: CodeRunner = Depends(get_piston_service),
         progress_service: LessonProgressService = Depends(get_lesson_progress_service),
 ) -> CodeExecutionService:
     """
     Build code execution service.
 
-    :param lesson_service: lesson service
+    :param lesson_service: lesson service on the read session
     :param code_runner: code runner
     :param progress_service: progress service
 
@@ -1,16 +1,51 @@
+from functools import cache
+from pathlib import Path
+
+from src.app.core.dependencies.db import session_factory
+from src.app.domain.models.enums.execution import RateLimitBackendKind
 from src.app.domain.services.execution_rate_limiter import ExecutionRateLimiter
+from src.app.domain.services.rate_limit_backend import (
+    DatabaseRateLimitBackend,
+    InMemoryRateLimitBackend,
+    RateLimitBackend,
+    SharedMemoryRateLimitBackend,
+)
 from src.cfg.cfg import settings
 
 
+def build_rate_limit_backend(kind: RateLimitBackendKind) -> RateLimitBackend:
+    """
+    Build rate limit backend of the configured kind.
+
+    :param kind: backend kind
+
+    :return: rate limit backend
+    """
+    if kind == RateLimitBackendKind.SHARED_MEMORY:
+        return SharedMemoryRateLimitBackend(
+            path=Path(settings.execution.rate_limit_shm_path),
+            slots=settings.execution.rate_limit_shm_slots,
+        )
+
+    if kind == RateLimitBackendKind.DATABASE:
+        return DatabaseRateLimitBackend(session_factory=session_factory)
+
+    return InMemoryRateLimitBackend()
+
+
+@cache
 def get_execution_rate_limiter() -> ExecutionRateLimiter:
     """
-    Build execution rate limiter.
+    Provide the process-wide execution rate limiter.
+
+    The limiter is built once, so its counters survive between requests
+    instead of being reset by a fresh instance on every call.
 
     :return: execution rate limiter
     """
-    rate_limiter = ExecutionRateLimiter(
+
+    return ExecutionRateLimiter(
         max_requests=settings.execution.rate_limit_max,
         window_sec=settings.execution.rate_limit_window_sec,
+        backend=build_rate_limit_backend(kind=settings.execution.rate_limit_backend),
     )
-
-    return rate_limiter
@@ -1,5 +1,7 @@
+import httpx
 from fastapi import Depends
 
+from src.app.core.dependencies.http_client import get_http_client
 from src.app.core.dependencies.repositories.user import get_user_repository
 from src.app.core.dependencies.security.auth_manager import get_auth_manager
 from src.app.core.security.auth_manager import AuthManager
@@ -10,14 +12,20 @@ from src.app.domain.services.github_oauth_service import GithubOAuthService
 def get_github_oauth_service(
         repository: UserRepository = Depends(get_user_repository),
         auth_manager: AuthManager = Depends(get_auth_manager),
+        http_client: httpx.AsyncClient = Depends(get_http_client),
 ) -> GithubOAuthService:
     """
-    Build a GitHub OAuth service with repository and auth manager injected.
+    Build a GitHub OAuth service with repository, auth manager and pooled HTTP client injected.
 
     :param repository: user repository
     :param auth_manager: auth manager
+    :param http_client: pooled HTTP client
 
     :return: GitHub OAuth service
     """
 
-    return GithubOAuthService(user_repository=repository, auth_manager=auth_manager)
+    return GithubOAuthService(
+        user_repository=repository,
+        auth_manager=auth_manager,
+        http_client=http_client,
+    )
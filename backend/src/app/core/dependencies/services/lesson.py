@@ -1,19 +1,56 @@
 from fastapi import Depends
 
-from src.app.core.dependencies.repositories.lesson import get_lesson_repository
+from src.app.core.cache import LessonCache
+from src.app.core.dependencies.repositories.lesson import get_lesson_read_repository, get_lesson_repository
+from src.app.core.dependencies.services.lesson_cache import get_lesson_cache
+from src.app.core.dependencies.services.lesson_change_hub import get_lesson_change_hub
 from src.app.domain.repositories.lesson_repository import LessonRepository
 from src.app.domain.services import LessonService
+from src.app.domain.services.lesson_change_hub import LessonChangeHub
 
 
 def get_lesson_service(
         repository: LessonRepository = Depends(get_lesson_repository),
+        change_hub: LessonChangeHub = Depends(get_lesson_change_hub),
+        lesson_cache: LessonCache = Depends(get_lesson_cache),
 ) -> LessonService:
     """
     Build a lesson service.
 
     :param repository: lesson repository
+    :param change_hub: lesson change hub
+    :param lesson_cache: lesson cache
 
     :return: lesson service
     """
 
-    return LessonService(lesson_repository=repository)
+    return LessonService(lesson_repository=repository, change_hub=change_hub, lesson_cache=lesson_cache)
+
+
+def get_lesson_read_service(
+        repository: LessonRepository = Depends(get_lesson_read_repository),
+        primary_repository: LessonRepository = Depends(get_lesson_repository),
+        change_hub: LessonChangeHub = Depends(get_lesson_change_hub),
+        lesson_cache: LessonCache = Depends(get_lesson_cache),
+) -> LessonService:
+    """
+    Build a lesson service for read-only endpoints.
+
+    Lesson cache misses are filled from the primary: an entry is usually
+    missing because the lesson just changed, and a lagging replica would
+    put the old version back for the whole cache TTL.
+
+    :param repository: lesson repository on the read session
+    :param primary_repository: lesson repository on the primary session
+    :param change_hub: lesson change hub
+    :param lesson_cache: lesson cache
+
+    :return: lesson service
+    """
+
+    return LessonService(
+        lesson_repository=repository,
+        change_hub=change_hub,
+        lesson_cache=lesson_cache,
+        cache_fill_repository=primary_repository,
+    )
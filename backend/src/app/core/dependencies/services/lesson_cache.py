@@ -0,0 +1,33 @@
+from src.app.core.cache import LessonCache
+from src.app.core.dependencies.services.lesson_change_hub import LESSON_CHANGE_HUB
+from src.app.core.observability.registry import CACHE_HITS, CACHE_MISSES, METRICS_REGISTRY
+from src.cfg.cfg import settings
+
+LESSON_CACHE = LessonCache(
+    max_size=settings.lessons_cache_max_size,
+    ttl_sec=settings.lessons_cache_ttl_sec,
+)
+LESSON_CHANGE_HUB.subscribe(listener=LESSON_CACHE.invalidate)
+
+
+def collect_lesson_cache_metrics() -> None:
+    """
+    Copy lesson cache hit and miss counters into the cache metrics.
+
+    :return: None
+    """
+    CACHE_HITS.set(value=LESSON_CACHE.hits, labels=("lesson",))
+    CACHE_MISSES.set(value=LESSON_CACHE.misses, labels=("lesson",))
+
+
+METRICS_REGISTRY.add_collector(collector=collect_lesson_cache_metrics)
+
+
+def get_lesson_cache() -> LessonCache:
+    """
+    Provide the process-wide lesson cache.
+
+    :return: lesson cache
+    """
+
+    return LESSON_CACHE
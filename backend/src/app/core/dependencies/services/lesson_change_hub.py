@@ -0,0 +1,13 @@
+from src.app.domain.services.lesson_change_hub import LessonChangeHub
+
+LESSON_CHANGE_HUB = LessonChangeHub()
+
+
+def get_lesson_change_hub() -> LessonChangeHub:
+    """
+    Provide the process-wide lesson change hub.
+
+    :return: lesson change hub
+    """
+
+    return LESSON_CHANGE_HUB
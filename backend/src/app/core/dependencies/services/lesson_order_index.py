@@ -0,0 +1,54 @@
+from fastapi import Depends
+
+from src.app.core.dependencies.repositories.lesson import get_lesson_repository
+from src.app.core.dependencies.services.lesson_change_hub import LESSON_CHANGE_HUB
+from src.app.core.observability.registry import CACHE_HITS, CACHE_MISSES, METRICS_REGISTRY
+from src.app.domain.repositories.lesson_repository import LessonRepository
+from src.app.domain.services.lesson_order_index import LessonOrderIndex, LessonOrderIndexCache
+from src.cfg.cfg import settings
+
+LESSON_ORDER_INDEX_CACHE = LessonOrderIndexCache(ttl_sec=settings.lessons_cache_ttl_sec)
+LESSON_CHANGE_HUB.subscribe(listener=LESSON_ORDER_INDEX_CACHE.invalidate)
+
+
+def collect_lesson_order_index_metrics() -> None:
+    """
+    Copy lesson order index cache hit and miss counters into the cache metrics.
+
+    :return: None
+    """
+    CACHE_HITS.set(value=LESSON_ORDER_INDEX_CACHE.hits, labels=("lesson_order_index",))
+    CACHE_MISSES.set(value=LESSON_ORDER_INDEX_CACHE.misses, labels=("lesson_order_index",))
+
+
+METRICS_REGISTRY.add_collector(collector=collect_lesson_order_index_metrics)
+
+
+def get_lesson_order_index_cache() -> LessonOrderIndexCache:
+    """
+    Provide the process-wide lesson order index cache.
+
+    :return: lesson order index cache
+    """
+
+    return LESSON_ORDER_INDEX_CACHE
+
+
+async def get_lesson_order_index(
+        repository: LessonRepository = Depends(get_lesson_repository),
+        cache: LessonOrderIndexCache = Depends(get_lesson_order_index_cache),
+) -> LessonOrderIndex:
+    """
+    Resolve the cached lesson order index.
+
+    The index is rebuilt after a lesson change, so it reads from the
+    primary; a lagging replica could still miss the change, and the stale
+    index would be kept until it expires.
+
+    :param repository: lesson repository on the primary session
+    :param cache: lesson order index cache
+
+    :return: lesson order index
+    """
+
+    return await cache.get(repository=repository)
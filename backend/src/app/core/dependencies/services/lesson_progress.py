@@ -3,21 +3,25 @@ from fastapi import Depends
 from src.app.core.dependencies.repositories.lesson_progress import (
     get_lesson_progress_repository,
 )
+from src.app.core.dependencies.services.progress_write_queue import get_progress_write_queue
 from src.app.domain.repositories.lesson_progress_repository import (
     LessonProgressRepository,
 )
 from src.app.domain.services.lesson_progress_service import LessonProgressService
+from src.app.domain.services.progress_write_queue import ProgressWriteQueue
 
 
 def get_lesson_progress_service(
         repository: LessonProgressRepository = Depends(get_lesson_progress_repository),
+        write_queue: ProgressWriteQueue = Depends(get_progress_write_queue),
 ) -> LessonProgressService:
     """
     Build lesson progress service.
 
     :param repository: lesson progress repository
+    :param write_queue: progress write-behind queue
 
     :return: lesson progress service
     """
 
-    return LessonProgressService(progress_repository=repository)
+    return LessonProgressService(progress_repository=repository, write_queue=write_queue)
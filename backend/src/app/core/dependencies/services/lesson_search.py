@@ -0,0 +1,39 @@
+from fastapi import Depends
+
+from src.app.core.dependencies.repositories.lesson import get_lesson_repository
+from src.app.core.dependencies.services.lesson_change_hub import LESSON_CHANGE_HUB
+from src.app.domain.repositories.lesson_repository import LessonRepository
+from src.app.domain.services.lesson_search_index import LessonSearchIndex, LessonSearchIndexCache
+from src.cfg.cfg import settings
+
+LESSON_SEARCH_INDEX_CACHE = LessonSearchIndexCache(ttl_sec=settings.lessons_cache_ttl_sec)
+LESSON_CHANGE_HUB.subscribe(listener=LESSON_SEARCH_INDEX_CACHE.invalidate)
+
+
+def get_lesson_search_index_cache() -> LessonSearchIndexCache:
+    """
+    Provide the process-wide lesson search index cache.
+
+    :return: lesson search index cache
+    """
+
+    return LESSON_SEARCH_INDEX_CACHE
+
+
+async def get_lesson_search_index(
+        repository: LessonRepository = Depends(get_lesson_repository),
+        cache: LessonSearchIndexCache = Depends(get_lesson_search_index_cache),
+) -> LessonSearchIndex:
+    """
+    Resolve the lesson search index with pending lesson changes applied.
+
+    Changes are applied right after they are written, so they are read from
+    the primary rather than a replica that may not have them yet.
+
+    :param repository: lesson repository on the primary session
+    :param cache: lesson search index cache
+
+    :return: lesson search index
+    """
+
+    return await cache.get(repository=repository)
@@ -2,10 +2,12 @@ from pathlib import Path
 
 from fastapi import Depends
 
-from src.app.content import LessonsLoader
+from src.app.content import LessonsLoader, LessonsManifest, LessonsParseCache
 from src.app.content.validator import LessonsContentValidator
 from src.app.core.dependencies.repositories.lesson import get_lesson_repository
+from src.app.core.dependencies.services.lesson_change_hub import get_lesson_change_hub
 from src.app.domain.repositories.lesson_repository import LessonRepository
+from src.app.domain.services.lesson_change_hub import LessonChangeHub
 from src.app.domain.services.lesson_sync_diff_builder import LessonSyncDiffBuilder
 from src.app.domain.services.lesson_sync_importer import LessonSyncImporter
 from src.app.domain.services.lesson_sync_service import LessonSyncService
@@ -22,18 +24,49 @@ def get_lessons_content_validator() -> LessonsContentValidator:
     return LessonsContentValidator()
 
 
+def get_lessons_manifest() -> LessonsManifest:
+    """
+    Build lessons manifest backed by the configured file.
+
+    :return: lessons manifest
+    """
+
+    return LessonsManifest(path=Path(settings.lessons_manifest_path))
+
+
+def get_lessons_parse_cache() -> LessonsParseCache:
+    """
+    Build lessons parse cache, disabled unless a directory is configured.
+
+    :return: lessons parse cache
+    """
+    cache_dir = settings.lessons_parse_cache_dir
+
+    return LessonsParseCache(cache_dir=Path(cache_dir) if cache_dir else None)
+
+
 def get_lessons_loader(
         validator: LessonsContentValidator = Depends(get_lessons_content_validator),
+        manifest: LessonsManifest = Depends(get_lessons_manifest),
+        parse_cache: LessonsParseCache = Depends(get_lessons_parse_cache),
 ) -> LessonsLoader:
     """
     Build a lessons loader.
 
     :param validator: lessons content validator
+    :param manifest: lessons manifest
+    :param parse_cache: lessons parse cache
 
     :return: lessons loader
     """
 
-    return LessonsLoader(root_dir=Path(settings.lessons_dir).resolve(), validator=validator)
+    return LessonsLoader(
+        root_dir=Path(settings.lessons_dir).resolve(),
+        validator=validator,
+        manifest=manifest,
+        workers=settings.lessons_load_workers,
+        parse_cache=parse_cache,
+    )
 
 
 def get_lesson_sync_diff_builder() -> LessonSyncDiffBuilder:
@@ -48,16 +81,18 @@ def get_lesson_sync_diff_builder() -> LessonSyncDiffBuilder:
 
 def get_lesson_sync_importer(
         repository: LessonRepository = Depends(get_lesson_repository),
+        change_hub: LessonChangeHub = Depends(get_lesson_change_hub),
 ) -> LessonSyncImporter:
     """
     Build lesson sync importer.
 
     :param repository: lesson repository
+    :param change_hub: lesson change hub
 
     :return: lesson sync importer
     """
 
-    return LessonSyncImporter(lesson_repository=repository)
+    return LessonSyncImporter(lesson_repository=repository, change_hub=change_hub)
 
 
 def get_lesson_sync_service(
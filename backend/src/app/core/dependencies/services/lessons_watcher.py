@@ -0,0 +1,33 @@
+from pathlib import Path
+
+from src.app.content import LessonsContentValidator, LessonsLoader, LessonsManifest
+from src.app.core.dependencies.db import session_factory
+from src.app.core.dependencies.services.lesson_change_hub import LESSON_CHANGE_HUB
+from src.app.core.dependencies.services.lesson_sync import get_lessons_parse_cache
+from src.app.domain.services.lessons_watcher import LessonsWatcher
+from src.cfg.cfg import settings
+
+LESSONS_WATCHER = LessonsWatcher(
+    loader=LessonsLoader(
+        root_dir=Path(settings.lessons_dir).resolve(),
+        validator=LessonsContentValidator(),
+        manifest=LessonsManifest(path=Path(settings.lessons_manifest_path)),
+        workers=settings.lessons_load_workers,
+        parse_cache=get_lessons_parse_cache(),
+    ),
+    session_factory=session_factory,
+    change_hub=LESSON_CHANGE_HUB,
+    debounce_ms=settings.lessons_watch_debounce_ms,
+    poll_interval_ms=settings.lessons_watch_poll_interval_ms,
+    lock_path=Path(settings.lessons_watch_lock_path),
+)
+
+
+def get_lessons_watcher() -> LessonsWatcher:
+    """
+    Provide the process-wide lessons watcher.
+
+    :return: lessons watcher
+    """
+
+    return LESSONS_WATCHER
@@ -0,0 +1,19 @@
+from src.app.core.dependencies.db import session_factory
+from src.app.domain.services.progress_write_queue import ProgressWriteQueue
+from src.cfg.cfg import settings
+
+PROGRESS_WRITE_QUEUE = ProgressWriteQueue(
+    session_factory=session_factory,
+    flush_interval_ms=settings.progress.flush_interval_ms,
+    max_batch=settings.progress.flush_max_batch,
+)
+
+
+def get_progress_write_queue() -> ProgressWriteQueue:
+    """
+    Provide the process-wide progress write-behind queue.
+
+    :return: progress write queue
+    """
+
+    return PROGRESS_WRITE_QUEUE
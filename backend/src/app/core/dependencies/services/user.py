@@ -1,8 +1,10 @@
 from fastapi import Depends
 
-from src.app.core.dependencies.repositories.user import get_user_repository
+from src.app.core.dependencies.repositories.user import get_user_read_repository, get_user_repository
 from src.app.core.dependencies.security.auth_manager import get_auth_manager
+from src.app.core.dependencies.security.user_cache import get_user_cache
 from src.app.core.security.auth_manager import AuthManager
+from src.app.core.security.user_cache import UserCache
 from src.app.domain.repositories import UserRepository
 from src.app.domain.services import UserService
 
@@ -10,14 +12,34 @@ from src.app.domain.services import UserService
 def get_user_service(
         repository: UserRepository = Depends(get_user_repository),
         auth_manager: AuthManager = Depends(get_auth_manager),
+        user_cache: UserCache = Depends(get_user_cache),
 ) -> UserService:
     """
     Build a user service with repository and auth manager injected
 
     :param repository: user repository
     :param auth_manager: auth manager
+    :param user_cache: resolved user cache
 
     :return: user service
     """
 
-    return UserService(user_repository=repository, auth_manager=auth_manager)
+    return UserService(user_repository=repository, auth_manager=auth_manager, user_cache=user_cache)
+
+
+def get_user_read_service(
+        repository: UserRepository = Depends(get_user_read_repository),
+        auth_manager: AuthManager = Depends(get_auth_manager),
+        user_cache: UserCache = Depends(get_user_cache),
+) -> UserService:
+    """
+    Build a user service for read-only endpoints.
+
+    :param repository: user repository on the read session
+    :param auth_manager: auth manager
+    :param user_cache: resolved user cache
+
+    :return: user service
+    """
+
+    return UserService(user_repository=repository, auth_manager=auth_manager, user_cache=user_cache)
@@ -0,0 +1,20 @@
+from fastapi import HTTPException
+
+
+class ProfilerBusy(HTTPException):
+    """
+    Another profiling session is running in this worker.
+    """
+    status_code = 409
+    detail = "A profiling session is already running."
+
+    def __init__(self) -> None:
+        """
+        Initialize profiler busy error.
+
+        :return: None
+        """
+        super().__init__(
+            status_code=self.status_code,
+            detail=self.detail,
+        )
@@ -0,0 +1,3 @@
+from src.app.core.http.shared_client import SharedHttpClient
+
+__all__ = ["SharedHttpClient"]
@@ -0,0 +1,61 @@
+import httpx
+
+
+class SharedHttpClient:
+    """
+    Owns one pooled httpx client for outbound API calls.
+
+    Reusing the client keeps TCP and TLS connections alive between requests,
+    instead of paying a full handshake for every outbound call.
+    """
+
+    def __init__(
+            self,
+            timeout_sec: float,
+            max_connections: int,
+            max_keepalive_connections: int,
+            keepalive_expiry_sec: float,
+    ) -> None:
+        """
+        Initialize shared HTTP client holder.
+
+        :param timeout_sec: default request timeout
+        :param max_connections: max open connections in the pool
+        :param max_keepalive_connections: max idle connections kept alive
+        :param keepalive_expiry_sec: idle connection lifetime
+
+        :return: None
+        """
+        self.timeout = httpx.Timeout(timeout=timeout_sec)
+        self.limits = httpx.Limits(
+            max_connections=max_connections,
+            max_keepalive_connections=max_keepalive_connections,
+            keepalive_expiry=keepalive_expiry_sec,
+        )
+        self._client: httpx.AsyncClient | None = None
+
+    def open(self) -> httpx.AsyncClient:
+        """
+        Create the pooled client if it is not open yet.
+
+        The application lifespan opens the client on startup; lazy creation
+        covers entrypoints that run without a lifespan, such as tests.
+
+        :return: pooled client
+        """
+
+        if self._client is None or self._client.is_closed:
+            self._client = httpx.AsyncClient(timeout=self.timeout, limits=self.limits)
+
+        return self._client
+
+    async def aclose(self) -> None:
+        """
+        Close the pooled client and its connections.
+
+        :return: None
+        """
+
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
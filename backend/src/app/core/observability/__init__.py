@@ -0,0 +1,37 @@
+from src.app.core.observability.exporter import MetricsExporter
+from src.app.core.observability.histogram import Histogram, HistogramFamily
+from src.app.core.observability.loop_monitor import LoopLagMonitor
+from src.app.core.observability.metrics import (
+    METRICS_CONTENT_TYPE,
+    CounterFamily,
+    GaugeFamily,
+    MetricsRegistry,
+    merge_snapshots,
+    render_text,
+)
+from src.app.core.observability.middleware import RequestMetricsMiddleware
+from src.app.core.observability.query_tracker import QueryStats, QueryTracker, track_queries
+from src.app.core.observability.sampling_profiler import SamplingProfiler, StackSamples
+from src.app.core.observability.stage_timer import NOOP_STAGE_TIMER, NoopStageTimer, StageTimer
+
+__all__ = [
+    "METRICS_CONTENT_TYPE",
+    "NOOP_STAGE_TIMER",
+    "CounterFamily",
+    "GaugeFamily",
+    "Histogram",
+    "HistogramFamily",
+    "LoopLagMonitor",
+    "MetricsExporter",
+    "MetricsRegistry",
+    "NoopStageTimer",
+    "QueryStats",
+    "QueryTracker",
+    "RequestMetricsMiddleware",
+    "SamplingProfiler",
+    "StackSamples",
+    "StageTimer",
+    "merge_snapshots",
+    "render_text",
+    "track_queries",
+]
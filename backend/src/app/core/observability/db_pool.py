@@ -0,0 +1,27 @@
+import time
+
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
+from sqlalchemy.pool import AsyncAdaptedQueuePool, ConnectionPoolEntry
+
+from src.app.core.observability.registry import DB_POOL_CHECKOUT_TIMEOUTS, DB_POOL_CHECKOUT_WAIT
+
+
+class InstrumentedAsyncQueuePool(AsyncAdaptedQueuePool):
+    """
+    Async queue pool that observes how long each checkout waited.
+
+    The measured time covers waiting for a free connection and opening a new
+    one, which is what a request actually pays before its first query.
+    Checkouts that time out on an exhausted pool are counted separately.
+    """
+
+    def _do_get(self) -> ConnectionPoolEntry:
+        started = time.perf_counter_ns()
+
+        try:
+            return super()._do_get()
+        except PoolTimeoutError:
+            DB_POOL_CHECKOUT_TIMEOUTS.inc()
+            raise
+        finally:
+            DB_POOL_CHECKOUT_WAIT.observe(value=(time.perf_counter_ns() - started) / 1_000_000)
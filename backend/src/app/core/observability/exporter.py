@@ -0,0 +1,169 @@
+import asyncio
+import contextlib
+import json
+import logging
+import os
+from pathlib import Path
+
+from src.app.core.observability.histogram import MetricSnapshot
+from src.app.core.observability.metrics import MetricsRegistry, merge_snapshots, render_text
+
+logger = logging.getLogger(__name__)
+
+
+class MetricsExporter:
+    """
+    Renders the ``/metrics`` payload for one or many worker processes.
+
+    Without a multiprocess directory the local registry is rendered as is.
+    With one, every worker periodically writes its snapshot to
+    ``<dir>/<pid>.json`` and a scrape, which lands on a single worker, merges
+    all files. Counters and histograms of exited workers are kept so totals
+    never go backwards, while their gauges are dropped. The directory should
+    be emptied before the server starts, like the one of prometheus_client.
+    """
+
+    def __init__(
+            self,
+            registry: MetricsRegistry,
+            multiprocess_dir: Path | None,
+            flush_interval_sec: float,
+    ) -> None:
+        """
+        Initialize metrics exporter.
+
+        :param registry: process-local metrics registry
+        :param multiprocess_dir: shared snapshot directory, or None for a single process
+        :param flush_interval_sec: how often a worker writes its snapshot
+
+        :return: None
+        """
+        self.registry = registry
+        self.multiprocess_dir = multiprocess_dir
+        self.flush_interval_sec = flush_interval_sec
+        self._task: asyncio.Task[None] | None = None
+
+    def start(self) -> None:
+        """
+        Start writing snapshots periodically in multiprocess mode.
+
+        :return: None
+        """
+
+        if self.multiprocess_dir is None or self._task is not None:
+            return
+
+        self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        """
+        Stop the flush loop and write a final snapshot without gauges.
+
+        :return: None
+        """
+
+        if self._task is None:
+            return
+
+        self._task.cancel()
+
+        with contextlib.suppress(asyncio.CancelledError):
+            await self._task
+
+        self._task = None
+        await self.flush(include_gauges=False)
+
+    async def render(self) -> str:
+        """
+        Render metrics of this process, or of all workers in multiprocess mode.
+
+        The registry is collected on the event loop, the only thread that
+        updates it, and only snapshot file I/O is handed to a worker thread.
+
+        :return: text exposition payload
+        """
+        families = self.registry.collect()
+
+        if self.multiprocess_dir is None:
+            return render_text(families=families)
+
+        snapshots = await asyncio.to_thread(self._exchange_snapshots, families)
+
+        return render_text(families=merge_snapshots(snapshots=snapshots))
+
+    async def flush(self, *, include_gauges: bool) -> None:
+        """
+        Write this process snapshot atomically.
+
+        :param include_gauges: keep gauges, False once the process is exiting
+
+        :return: None
+        """
+
+        if self.multiprocess_dir is None:
+            return
+
+        families = self.registry.collect()
+
+        if not include_gauges:
+            families = [family for family in families if family["kind"] != "gauge"]
+
+        await asyncio.to_thread(self._write_snapshot, families)
+
+    async def _run(self) -> None:
+        while True:
+            await asyncio.sleep(self.flush_interval_sec)
+
+            try:
+                await self.flush(include_gauges=True)
+            except Exception:
+                logger.exception("Metrics snapshot flush failed")
+
+    def _exchange_snapshots(self, families: list[MetricSnapshot]) -> list[list[MetricSnapshot]]:
+        self._write_snapshot(families=families)
+
+        return self._read_snapshots()
+
+    def _write_snapshot(self, families: list[MetricSnapshot]) -> None:
+        pid = os.getpid()
+        path = self.multiprocess_dir / f"{pid}.json"
+        tmp_path = path.with_name(f"{path.name}.tmp")
+
+        try:
+            self.multiprocess_dir.mkdir(parents=True, exist_ok=True)
+            tmp_path.write_text(json.dumps({"pid": pid, "families": families}), encoding="utf-8")
+            tmp_path.replace(path)
+        except OSError:
+            logger.warning("Could not write metrics snapshot %s", path, exc_info=True)
+
+    def _read_snapshots(self) -> list[list[MetricSnapshot]]:
+        snapshots = []
+
+        for path in sorted(self.multiprocess_dir.glob("*.json")):
+            try:
+                payload = json.loads(path.read_text(encoding="utf-8"))
+            except (OSError, ValueError):
+                continue
+
+            families = payload.get("families", [])
+
+            if not _is_alive(pid=payload.get("pid")):
+                families = [family for family in families if family["kind"] != "gauge"]
+
+            snapshots.append(families)
+
+        return snapshots
+
+
+def _is_alive(pid: int | None) -> bool:
+    if not isinstance(pid, int):
+        return False
+
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        return True
+
+    return True
@@ -0,0 +1,124 @@
+import bisect
+from collections.abc import Sequence
+from typing import Any
+
+type LabelValues = tuple[str, ...]
+type MetricSnapshot = dict[str, Any]
+
+DEFAULT_LATENCY_BUCKETS_MS = (1, 2.5, 5, 10, 25, 50, 100, 250, 500, 1_000, 2_500, 5_000, 10_000)
+
+
+class Histogram:
+    """
+    Cumulative-bucket histogram in the Prometheus style.
+    """
+
+    def __init__(self, buckets: Sequence[float] = DEFAULT_LATENCY_BUCKETS_MS) -> None:
+        """
+        Initialize histogram.
+
+        :param buckets: sorted upper bounds, an implicit +Inf bucket is added
+
+        :return: None
+        """
+        self.buckets = tuple(buckets)
+        self.counts = [0] * (len(self.buckets) + 1)
+        self.sum = 0.0
+        self.count = 0
+
+    def observe(self, value: float) -> None:
+        """
+        Record one value.
+
+        :param value: observed value
+
+        :return: None
+        """
+        self.counts[bisect.bisect_left(self.buckets, value)] += 1
+        self.sum += value
+        self.count += 1
+
+    def cumulative_counts(self) -> list[int]:
+        """
+        Get per-bucket counts of values less than or equal to each bound.
+
+        :return: cumulative counts, the last one for +Inf
+        """
+        cumulative = []
+        total = 0
+        for bucket_count in self.counts:
+            total += bucket_count
+            cumulative.append(total)
+
+        return cumulative
+
+
+class HistogramFamily:
+    """
+    Histograms of one metric keyed by label values, created on first use.
+    """
+
+    kind = "histogram"
+
+    def __init__(
+            self,
+            name: str,
+            help_text: str = "",
+            label_names: Sequence[str] = (),
+            buckets: Sequence[float] = DEFAULT_LATENCY_BUCKETS_MS,
+    ) -> None:
+        """
+        Initialize histogram family.
+
+        :param name: metric name
+        :param help_text: metric description
+        :param label_names: label names, in the order label values are passed
+        :param buckets: bucket upper bounds shared by all histograms
+
+        :return: None
+        """
+        self.name = name
+        self.help_text = help_text
+        self.label_names = tuple(label_names)
+        self.buckets = tuple(buckets)
+        self.histograms: dict[LabelValues, Histogram] = {}
+
+    def observe(self, value: float, labels: LabelValues = ()) -> None:
+        """
+        Record one value for a label set.
+
+        :param value: observed value
+        :param labels: label values, e.g. a stage name
+
+        :return: None
+        """
+        histogram = self.histograms.get(labels)
+
+        if histogram is None:
+            histogram = self.histograms[labels] = Histogram(buckets=self.buckets)
+
+        histogram.observe(value=value)
+
+    def snapshot(self) -> MetricSnapshot:
+        """
+        Dump the family into a JSON-serializable snapshot.
+
+        :return: metric snapshot
+        """
+
+        return {
+            "name": self.name,
+            "kind": self.kind,
+            "help": self.help_text,
+            "label_names": list(self.label_names),
+            "buckets": list(self.buckets),
+            "samples": [
+                {
+                    "labels": list(labels),
+                    "counts": list(histogram.counts),
+                    "sum": histogram.sum,
+                    "count": histogram.count,
+                }
+                for labels, histogram in self.histograms.items()
+            ],
+        }
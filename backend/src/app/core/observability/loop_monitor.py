@@ -0,0 +1,163 @@
+import asyncio
+import contextlib
+import logging
+import sys
+import threading
+import time
+import traceback
+
+from src.app.core.observability.histogram import HistogramFamily
+from src.app.core.observability.metrics import CounterFamily
+
+logger = logging.getLogger(__name__)
+
+
+class LoopLagMonitor:
+    """
+    Detects synchronous work that blocks the event loop.
+
+    A loop task sleeps for a fixed interval and observes how late it woke
+    up, which is the scheduling delay every other coroutine suffered too. A
+    watchdog thread checks the task's heartbeat; once the loop has been
+    stuck for longer than the stall threshold, it captures the loop thread
+    stack with ``sys._current_frames`` while the blocking call is still on
+    it and logs it. The stall is counted on the loop thread, like every
+    other metric update, once the loop is free again. Each stall is
+    reported once.
+
+    When asyncio debug mode is on, the loop's own slow callback warning is
+    aligned with the same threshold.
+    """
+
+    def __init__(
+            self,
+            interval_ms: int,
+            stall_threshold_ms: int,
+            lag_histograms: HistogramFamily,
+            stalls: CounterFamily,
+    ) -> None:
+        """
+        Initialize loop lag monitor.
+
+        :param interval_ms: tick interval of the measuring task
+        :param stall_threshold_ms: blocked time after which the loop stack is captured
+        :param lag_histograms: histograms receiving the lag of every tick
+        :param stalls: counter of detected stalls
+
+        :return: None
+        """
+        self.interval_ms = interval_ms
+        self.stall_threshold_ms = stall_threshold_ms
+        self.lag_histograms = lag_histograms
+        self.stalls = stalls
+        self.last_stall_stack: str | None = None
+        self._task: asyncio.Task[None] | None = None
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._watchdog: threading.Thread | None = None
+        self._stopping = threading.Event()
+        self._loop_thread_id = 0
+        self._heartbeat_ns = 0
+
+    @property
+    def is_running(self) -> bool:
+        """
+        Check whether the monitor is running.
+
+        :return: True if the loop is being measured
+        """
+
+        return self._task is not None and not self._task.done()
+
+    def start(self) -> None:
+        """
+        Start measuring the running event loop.
+
+        :return: None
+        """
+
+        if self.is_running:
+            return
+
+        loop = asyncio.get_running_loop()
+
+        if loop.get_debug():
+            loop.slow_callback_duration = self.stall_threshold_ms / 1000
+
+        self._loop = loop
+        self._loop_thread_id = threading.get_ident()
+        self._heartbeat_ns = time.perf_counter_ns()
+        self._stopping.clear()
+        self._task = asyncio.create_task(self._measure())
+        self._watchdog = threading.Thread(target=self._watch, name="loop-lag-watchdog", daemon=True)
+        self._watchdog.start()
+
+    async def stop(self) -> None:
+        """
+        Stop measuring.
+
+        :return: None
+        """
+
+        if self._task is None:
+            return
+
+        self._task.cancel()
+
+        with contextlib.suppress(asyncio.CancelledError):
+            await self._task
+
+        self._task = None
+        self._stopping.set()
+
+        if self._watchdog is not None:
+            await asyncio.to_thread(self._watchdog.join)
+            self._watchdog = None
+
+    def capture_loop_stack(self) -> str:
+        """
+        Format the current stack of the event loop thread.
+
+        :return: formatted stack, innermost call last
+        """
+        frame = sys._current_frames().get(self._loop_thread_id)
+
+        if frame is None:
+            return "<event loop thread is gone>"
+
+        return "".join(traceback.format_stack(frame))
+
+    async def _measure(self) -> None:
+        interval_sec = self.interval_ms / 1000
+
+        while True:
+            started = time.perf_counter_ns()
+            await asyncio.sleep(interval_sec)
+            now = time.perf_counter_ns()
+            self._heartbeat_ns = now
+            self.lag_histograms.observe(value=max(0.0, (now - started) / 1_000_000 - self.interval_ms))
+
+    def _watch(self) -> None:
+        reported_heartbeat = None
+
+        while not self._stopping.wait(timeout=self.interval_ms / 1000):
+            heartbeat = self._heartbeat_ns
+            blocked_ms = (time.perf_counter_ns() - heartbeat) / 1_000_000 - self.interval_ms
+
+            if blocked_ms < self.stall_threshold_ms or heartbeat == reported_heartbeat:
+                continue
+
+            reported_heartbeat = heartbeat
+            self.last_stall_stack = self.capture_loop_stack()
+            self._count_stall()
+            logger.warning(
+                "Event loop blocked for at least %.0f ms, loop thread stack:\n%s",
+                blocked_ms,
+                self.last_stall_stack,
+            )
+
+    def _count_stall(self) -> None:
+        if self._loop is None:
+            return
+
+        with contextlib.suppress(RuntimeError):
+            self._loop.call_soon_threadsafe(self.stalls.inc)
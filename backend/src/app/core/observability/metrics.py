@@ -0,0 +1,302 @@
+import math
+from collections.abc import Callable, Iterable, Sequence
+
+from src.app.core.observability.histogram import (
+    DEFAULT_LATENCY_BUCKETS_MS,
+    HistogramFamily,
+    LabelValues,
+    MetricSnapshot,
+)
+
+METRICS_CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+
+class CounterFamily:
+    """
+    Monotonic counters of one metric keyed by label values.
+    """
+
+    kind = "counter"
+
+    def __init__(self, name: str, help_text: str = "", label_names: Sequence[str] = ()) -> None:
+        """
+        Initialize counter family.
+
+        :param name: metric name
+        :param help_text: metric description
+        :param label_names: label names, in the order label values are passed
+
+        :return: None
+        """
+        self.name = name
+        self.help_text = help_text
+        self.label_names = tuple(label_names)
+        self.values: dict[LabelValues, float] = {}
+
+    def inc(self, labels: LabelValues = (), amount: float = 1.0) -> None:
+        """
+        Add to the value of a label set.
+
+        :param labels: label values
+        :param amount: increment
+
+        :return: None
+        """
+        self.values[labels] = self.values.get(labels, 0.0) + amount
+
+    def set(self, value: float, labels: LabelValues = ()) -> None:
+        """
+        Overwrite the value of a label set.
+
+        Used by collectors that mirror a counter kept elsewhere, e.g. cache hits.
+
+        :param value: new value
+        :param labels: label values
+
+        :return: None
+        """
+        self.values[labels] = value
+
+    def snapshot(self) -> MetricSnapshot:
+        """
+        Dump the family into a JSON-serializable snapshot.
+
+        :return: metric snapshot
+        """
+
+        return {
+            "name": self.name,
+            "kind": self.kind,
+            "help": self.help_text,
+            "label_names": list(self.label_names),
+            "samples": [{"labels": list(labels), "value": value} for labels, value in self.values.items()],
+        }
+
+
+class GaugeFamily(CounterFamily):
+    """
+    Gauges of one metric keyed by label values.
+
+    Gauges describe the current state of one process, so they are dropped
+    from the aggregate once that process exits.
+    """
+
+    kind = "gauge"
+
+
+type MetricFamily = CounterFamily | HistogramFamily
+
+
+class MetricsRegistry:
+    """
+    Process-local set of metric families.
+
+    Registering a name twice returns the existing family, so modules can
+    declare the metrics they update without coordinating import order.
+    """
+
+    def __init__(self) -> None:
+        """
+        Initialize metrics registry.
+
+        :return: None
+        """
+        self._families: dict[str, MetricFamily] = {}
+        self._collectors: list[Callable[[], None]] = []
+
+    def counter(self, name: str, help_text: str, label_names: Sequence[str] = ()) -> CounterFamily:
+        """
+        Get or register a counter family.
+
+        :param name: metric name, conventionally ending in ``_total``
+        :param help_text: metric description
+        :param label_names: label names
+
+        :return: counter family
+        """
+
+        return self._register(family=CounterFamily(name=name, help_text=help_text, label_names=label_names))
+
+    def gauge(self, name: str, help_text: str, label_names: Sequence[str] = ()) -> GaugeFamily:
+        """
+        Get or register a gauge family.
+
+        :param name: metric name
+        :param help_text: metric description
+        :param label_names: label names
+
+        :return: gauge family
+        """
+
+        return self._register(family=GaugeFamily(name=name, help_text=help_text, label_names=label_names))
+
+    def histogram(
+            self,
+            name: str,
+            help_text: str,
+            label_names: Sequence[str] = (),
+            buckets: Sequence[float] = DEFAULT_LATENCY_BUCKETS_MS,
+    ) -> HistogramFamily:
+        """
+        Get or register a histogram family.
+
+        :param name: metric name
+        :param help_text: metric description
+        :param label_names: label names
+        :param buckets: bucket upper bounds
+
+        :return: histogram family
+        """
+        family = HistogramFamily(name=name, help_text=help_text, label_names=label_names, buckets=buckets)
+
+        return self._register(family=family)
+
+    def add_collector(self, collector: Callable[[], None]) -> None:
+        """
+        Register a callback that refreshes metrics right before collection.
+
+        Collectors copy state that is cheap to read but not pushed, such as
+        pool occupancy or cache hit counters.
+
+        :param collector: callback updating registered families
+
+        :return: None
+        """
+        self._collectors.append(collector)
+
+    def collect(self) -> list[MetricSnapshot]:
+        """
+        Run collectors and snapshot every family.
+
+        :return: metric snapshots
+        """
+        for collector in self._collectors:
+            collector()
+
+        return [family.snapshot() for family in self._families.values()]
+
+    def _register[F: MetricFamily](self, family: F) -> F:
+        existing = self._families.get(family.name)
+
+        if existing is None:
+            self._families[family.name] = family
+            return family
+
+        if type(existing) is not type(family) or existing.label_names != family.label_names:
+            message = f"Metric {family.name} is already registered with a different type or labels"
+            raise ValueError(message)
+
+        return existing
+
+
+def merge_snapshots(snapshots: Iterable[list[MetricSnapshot]]) -> list[MetricSnapshot]:
+    """
+    Sum metric snapshots of several processes.
+
+    Counter and gauge values and histogram buckets are added per label set.
+
+    :param snapshots: metric snapshots per process
+
+    :return: merged metric snapshots
+    """
+    merged: dict[str, MetricSnapshot] = {}
+    samples: dict[str, dict[tuple[str, ...], dict]] = {}
+
+    for families in snapshots:
+        for family in families:
+            name = family["name"]
+
+            if name not in merged:
+                merged[name] = {**family, "samples": []}
+                samples[name] = {}
+
+            if merged[name]["kind"] != family["kind"]:
+                continue
+
+            for sample in family["samples"]:
+                labels = tuple(sample["labels"])
+                current = samples[name].get(labels)
+
+                if current is None:
+                    samples[name][labels] = {**sample, **_copy_counts(sample=sample)}
+                    continue
+
+                if "counts" in sample:
+                    if len(current["counts"]) == len(sample["counts"]):
+                        current["counts"] = [a + b for a, b in zip(current["counts"], sample["counts"], strict=True)]
+                        current["sum"] += sample["sum"]
+                        current["count"] += sample["count"]
+                    continue
+
+                current["value"] += sample["value"]
+
+    for name, family in merged.items():
+        family["samples"] = list(samples[name].values())
+
+    return list(merged.values())
+
+
+def render_text(families: list[MetricSnapshot]) -> str:
+    """
+    Render metric snapshots in the Prometheus text exposition format.
+
+    :param families: metric snapshots
+
+    :return: exposition text
+    """
+    lines: list[str] = []
+
+    for family in families:
+        name = family["name"]
+        label_names = family["label_names"]
+        lines.append(f"# HELP {name} {_escape_help(text=family['help'])}")
+        lines.append(f"# TYPE {name} {family['kind']}")
+
+        for sample in family["samples"]:
+            pairs = list(zip(label_names, sample["labels"], strict=True))
+
+            if "counts" not in sample:
+                lines.append(f"{name}{_format_labels(pairs=pairs)} {_format_value(value=sample['value'])}")
+                continue
+
+            cumulative = 0
+            bounds = [*(_format_value(value=bound) for bound in family["buckets"]), "+Inf"]
+
+            for bound, bucket_count in zip(bounds, sample["counts"], strict=True):
+                cumulative += bucket_count
+                bucket_labels = _format_labels(pairs=[*pairs, ("le", bound)])
+                lines.append(f"{name}_bucket{bucket_labels} {cumulative}")
+
+            lines.append(f"{name}_sum{_format_labels(pairs=pairs)} {_format_value(value=sample['sum'])}")
+            lines.append(f"{name}_count{_format_labels(pairs=pairs)} {sample['count']}")
+
+    return "\n".join(lines) + "\n"
+
+
+def _copy_counts(sample: dict) -> dict:
+    return {"counts": list(sample["counts"])} if "counts" in sample else {}
+
+
+def _format_labels(pairs: list[tuple[str, str]]) -> str:
+    if not pairs:
+        return ""
+
+    return "{" + ",".join(f'{name}="{_escape_label(value=value)}"' for name, value in pairs) + "}"
+
+
+def _format_value(value: float) -> str:
+    if math.isinf(value):
+        return "+Inf" if value > 0 else "-Inf"
+
+    if float(value).is_integer():
+        return str(int(value))
+
+    return repr(float(value))
+
+
+def _escape_label(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _escape_help(text: str) -> str:
+    return text.replace("\\", "\\\\").replace("\n", "\\n")
@@ -0,0 +1,80 @@
+import time
+
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from src.app.core.observability.histogram import HistogramFamily
+from src.app.core.observability.query_tracker import track_queries
+
+UNMATCHED_ROUTE = "unmatched"
+
+
+class RequestMetricsMiddleware:
+    """
+    Observes HTTP request latency labelled by method, route template and status.
+
+    The route template, e.g. ``/api/v1/lessons/{lesson_id}``, is read from the
+    matched route after the app ran, so label cardinality stays bounded by the
+    number of routes rather than by the number of distinct URLs. Database
+    statements of the request are counted per route as well, so N+1 query
+    regressions show up in the metrics.
+    """
+
+    def __init__(
+            self,
+            app: ASGIApp,
+            histograms: HistogramFamily,
+            statement_counts: HistogramFamily,
+            statement_times: HistogramFamily,
+    ) -> None:
+        """
+        Initialize request metrics middleware.
+
+        :param app: wrapped ASGI app
+        :param histograms: latency histograms labelled by method, route and status
+        :param statement_counts: statements per request labelled by route
+        :param statement_times: database time per request labelled by route
+
+        :return: None
+        """
+        self.app = app
+        self.histograms = histograms
+        self.statement_counts = statement_counts
+        self.statement_times = statement_times
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        """
+        Time one HTTP request.
+
+        :param scope: ASGI scope
+        :param receive: ASGI receive channel
+        :param send: ASGI send channel
+
+        :return: None
+        """
+
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        started = time.perf_counter_ns()
+        status_code = 500
+
+        async def send_with_status(message: Message) -> None:
+            nonlocal status_code
+
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+
+            await send(message)
+
+        with track_queries() as queries:
+            try:
+                await self.app(scope, receive, send_with_status)
+            finally:
+                route = getattr(scope.get("route"), "path", UNMATCHED_ROUTE)
+                self.histograms.observe(
+                    value=(time.perf_counter_ns() - started) / 1_000_000,
+                    labels=(scope["method"], route, str(status_code)),
+                )
+                self.statement_counts.observe(value=queries.count, labels=(route,))
+                self.statement_times.observe(value=queries.total_ms, labels=(route,))
@@ -0,0 +1,161 @@
+import logging
+import time
+from collections.abc import Iterator, Mapping, Sequence
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any
+
+from sqlalchemy import event
+from sqlalchemy.engine import Connection, Engine, ExecutionContext
+
+logger = logging.getLogger(__name__)
+
+_ACTIVE_QUERY_STATS: ContextVar[tuple["QueryStats", ...]] = ContextVar("active_query_stats", default=())
+_STARTED_AT_ATTR = "_query_tracker_started_ns"
+
+
+class QueryStats:
+    """
+    Statements executed inside one tracking scope.
+    """
+
+    def __init__(self) -> None:
+        """
+        Initialize query stats.
+
+        :return: None
+        """
+        self.count = 0
+        self.total_ms = 0.0
+        self.statements: list[str] = []
+
+    def record(self, statement: str, duration_ms: float) -> None:
+        """
+        Record one executed statement.
+
+        :param statement: SQL statement
+        :param duration_ms: execution time
+
+        :return: None
+        """
+        self.count += 1
+        self.total_ms += duration_ms
+        self.statements.append(statement)
+
+
+@contextmanager
+def track_queries() -> Iterator[QueryStats]:
+    """
+    Count statements executed by the current task and everything it awaits.
+
+    Scopes nest: a statement is recorded in every active scope, so a test can
+    wrap a request that the request middleware tracks as well.
+
+    :return: context manager yielding the scope stats
+    """
+    stats = QueryStats()
+    token = _ACTIVE_QUERY_STATS.set((*_ACTIVE_QUERY_STATS.get(), stats))
+
+    try:
+        yield stats
+    finally:
+        _ACTIVE_QUERY_STATS.reset(token)
+
+
+def describe_parameters(parameters: Any) -> str:  # noqa: ANN401
+    """
+    Describe the shape of bound parameters without their values.
+
+    Values can hold emails or password hashes, so slow query logs only show
+    parameter types and, for executemany, the batch size.
+
+    :param parameters: DBAPI parameters
+
+    :return: parameter shape, e.g. ``(str, int)`` or ``500 x (str, int)``
+    """
+
+    if isinstance(parameters, Mapping):
+        return "{" + ", ".join(f"{name}: {type(value).__name__}" for name, value in parameters.items()) + "}"
+
+    if isinstance(parameters, Sequence) and not isinstance(parameters, str | bytes):
+        if parameters and all(isinstance(item, Mapping | tuple | list) for item in parameters):
+            return f"{len(parameters)} x {describe_parameters(parameters=parameters[0])}"
+
+        return "(" + ", ".join(type(value).__name__ for value in parameters) + ")"
+
+    return type(parameters).__name__
+
+
+class QueryTracker:
+    """
+    Cursor execution hooks that feed query stats and the slow query log.
+
+    The hooks are attached to the ``Engine`` class, so every engine, async
+    ones included, is covered without wiring each of them.
+    """
+
+    def __init__(self, slow_query_threshold_ms: float) -> None:
+        """
+        Initialize query tracker.
+
+        :param slow_query_threshold_ms: statements slower than this are logged
+
+        :return: None
+        """
+        self.slow_query_threshold_ms = slow_query_threshold_ms
+        self._installed = False
+
+    def install(self) -> None:
+        """
+        Attach the cursor execution hooks once.
+
+        :return: None
+        """
+
+        if self._installed:
+            return
+
+        event.listen(Engine, "before_cursor_execute", self._before_cursor_execute)
+        event.listen(Engine, "after_cursor_execute", self._after_cursor_execute)
+        self._installed = True
+
+    @staticmethod
+    def _before_cursor_execute(
+            conn: Connection,  # noqa: ARG004
+            cursor: Any,  # noqa: ANN401, ARG004
+            statement: str,  # noqa: ARG004
+            parameters: Any,  # noqa: ANN401, ARG004
+            context: ExecutionContext | None,
+            executemany: bool,  # noqa: ARG004, FBT001
+    ) -> None:
+        # The start time lives on the execution context rather than the
+        # connection, so a statement that fails leaves nothing behind.
+        if context is not None:
+            setattr(context, _STARTED_AT_ATTR, time.perf_counter_ns())
+
+    def _after_cursor_execute(
+            self,
+            conn: Connection,  # noqa: ARG002
+            cursor: Any,  # noqa: ANN401, ARG002
+            statement: str,
+            parameters: Any,  # noqa: ANN401
+            context: ExecutionContext | None,
+            executemany: bool,  # noqa: ARG002, FBT001
+    ) -> None:
+        started = getattr(context, _STARTED_AT_ATTR, None)
+
+        if started is None:
+            return
+
+        duration_ms = (time.perf_counter_ns() - started) / 1_000_000
+
+        for stats in _ACTIVE_QUERY_STATS.get():
+            stats.record(statement=statement, duration_ms=duration_ms)
+
+        if duration_ms >= self.slow_query_threshold_ms:
+            logger.warning(
+                "Slow query took %.1f ms: %s; parameters %s",
+                duration_ms,
+                " ".join(statement.split()),
+                describe_parameters(parameters=parameters),
+            )
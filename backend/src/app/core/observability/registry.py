@@ -0,0 +1,71 @@
+from src.app.core.observability.metrics import MetricsRegistry
+
+METRICS_REGISTRY = MetricsRegistry()
+
+HTTP_REQUEST_DURATION = METRICS_REGISTRY.histogram(
+    name="http_request_duration_ms",
+    help_text="HTTP request latency in milliseconds by method, route template and status code.",
+    label_names=("method", "route", "status"),
+)
+EXECUTION_STAGE_DURATION = METRICS_REGISTRY.histogram(
+    name="execution_stage_duration_ms",
+    help_text="Code execution stage latency in milliseconds, recorded when stage timing is enabled.",
+    label_names=("stage",),
+)
+RUNNER_CALL_DURATION = METRICS_REGISTRY.histogram(
+    name="code_runner_call_duration_ms",
+    help_text="Code runner call latency in milliseconds by execution status.",
+    label_names=("status",),
+)
+EXECUTION_RATE_LIMIT_REJECTIONS = METRICS_REGISTRY.counter(
+    name="execution_rate_limit_rejections_total",
+    help_text="Code execution requests rejected by the rate limiter by caller kind.",
+    label_names=("caller",),
+)
+CODE_ANALYSIS_DURATION = METRICS_REGISTRY.histogram(
+    name="code_analysis_duration_ms",
+    help_text="Static analysis subprocess latency in milliseconds by outcome.",
+    label_names=("outcome",),
+)
+DB_POOL_CHECKOUT_WAIT = METRICS_REGISTRY.histogram(
+    name="db_pool_checkout_wait_ms",
+    help_text="Time in milliseconds spent getting a connection from the database pool.",
+)
+DB_POOL_CHECKOUT_TIMEOUTS = METRICS_REGISTRY.counter(
+    name="db_pool_checkout_timeouts_total",
+    help_text="Database pool checkouts that gave up waiting for a free connection.",
+)
+DB_POOL_CONNECTIONS = METRICS_REGISTRY.gauge(
+    name="db_pool_connections",
+    help_text="Database pool connections by pool and state, with the configured limit as state limit.",
+    label_names=("pool", "state"),
+)
+CACHE_HITS = METRICS_REGISTRY.counter(
+    name="cache_hits_total",
+    help_text="In-process cache hits by cache.",
+    label_names=("cache",),
+)
+CACHE_MISSES = METRICS_REGISTRY.counter(
+    name="cache_misses_total",
+    help_text="In-process cache misses by cache.",
+    label_names=("cache",),
+)
+EVENT_LOOP_LAG = METRICS_REGISTRY.histogram(
+    name="event_loop_lag_ms",
+    help_text="Delay in milliseconds between when a periodic loop tick was due and when it ran.",
+)
+EVENT_LOOP_STALLS = METRICS_REGISTRY.counter(
+    name="event_loop_stalls_total",
+    help_text="Times the event loop stayed blocked longer than the stall threshold.",
+)
+DB_STATEMENTS_PER_REQUEST = METRICS_REGISTRY.histogram(
+    name="db_statements_per_request",
+    help_text="Database statements executed per HTTP request by route template.",
+    label_names=("route",),
+    buckets=(0, 1, 2, 3, 5, 8, 13, 21, 34, 55),
+)
+DB_TIME_PER_REQUEST = METRICS_REGISTRY.histogram(
+    name="db_time_per_request_ms",
+    help_text="Time in milliseconds spent executing database statements per HTTP request by route template.",
+    label_names=("route",),
+)
@@ -0,0 +1,191 @@
+import os
+import sys
+import threading
+import time
+from collections import Counter
+from pathlib import Path
+from types import FrameType
+
+from src.app.core.exceptions.profiling_exc import ProfilerBusy
+
+SPEEDSCOPE_SCHEMA = "https://www.speedscope.app/file-format-schema.json"
+
+# (file name, function) of leaf frames where a thread blocks waiting for work
+IDLE_LEAF_FRAMES = frozenset(
+    {
+        ("selectors.py", "select"),
+        ("threading.py", "wait"),
+        ("threading.py", "_wait_for_tstate_lock"),
+        ("queue.py", "get"),
+        ("thread.py", "_worker"),
+    },
+)
+IDLE_FRAME = "[idle]"
+
+type Stack = tuple[str, ...]
+
+
+class StackSamples:
+    """
+    Aggregated stack samples of one profiling session.
+    """
+
+    def __init__(self, interval_ms: float) -> None:
+        """
+        Initialize stack samples.
+
+        :param interval_ms: sampling interval
+
+        :return: None
+        """
+        self.interval_ms = interval_ms
+        self.duration_ms = 0.0
+        self.counts: Counter[Stack] = Counter()
+
+    def to_collapsed(self) -> str:
+        """
+        Format samples as collapsed stacks, one ``root;...;leaf count`` line each.
+
+        The output is accepted by flamegraph.pl, speedscope and most flame
+        graph viewers.
+
+        :return: collapsed stacks
+        """
+
+        return "".join(f"{';'.join(stack)} {count}\n" for stack, count in self.counts.most_common())
+
+    def to_speedscope(self, name: str) -> dict:
+        """
+        Format samples as a speedscope sampled profile.
+
+        :param name: profile name
+
+        :return: speedscope file payload
+        """
+        frame_indexes: dict[str, int] = {}
+        samples = []
+        weights = []
+
+        for stack, count in self.counts.most_common():
+            samples.append([frame_indexes.setdefault(frame, len(frame_indexes)) for frame in stack])
+            weights.append(count * self.interval_ms)
+
+        return {
+            "$schema": SPEEDSCOPE_SCHEMA,
+            "name": name,
+            "exporter": "pydantic-quest",
+            "shared": {"frames": [{"name": frame} for frame in frame_indexes]},
+            "profiles": [
+                {
+                    "type": "sampled",
+                    "name": name,
+                    "unit": "milliseconds",
+                    "startValue": 0,
+                    "endValue": sum(weights),
+                    "samples": samples,
+                    "weights": weights,
+                },
+            ],
+        }
+
+
+class SamplingProfiler:
+    """
+    Wall-clock sampling profiler for the threads of the current process.
+
+    A sampling thread reads every thread's frame with ``sys._current_frames``
+    at a fixed interval, so profiled code runs unmodified and only pays for
+    the GIL handoffs of the sampler. Each stack is rooted at its thread name,
+    which keeps the event loop thread separate from threadpool workers.
+    Threads blocked in a selector, lock or queue wait would otherwise
+    dominate a wall-clock profile, so their samples are dropped unless idle
+    time is asked for, in which case they end with an ``[idle]`` frame.
+    Only one session runs at a time per process.
+    """
+
+    def __init__(self) -> None:
+        """
+        Initialize sampling profiler.
+
+        :return: None
+        """
+        self._lock = threading.Lock()
+        self._root = f"{Path.cwd()}/"
+
+    def sample(
+            self,
+            duration_sec: float,
+            interval_ms: float,
+            *,
+            include_idle: bool = False,
+    ) -> StackSamples:
+        """
+        Sample all other threads for a while.
+
+        Blocks the calling thread for the whole duration, so async callers
+        run it in a worker thread.
+
+        :param duration_sec: profiling duration
+        :param interval_ms: sampling interval
+        :param include_idle: keep samples of threads waiting for work
+
+        :return: aggregated stack samples
+        """
+
+        if not self._lock.acquire(blocking=False):
+            raise ProfilerBusy
+
+        try:
+            return self._sample(duration_sec=duration_sec, interval_ms=interval_ms, include_idle=include_idle)
+        finally:
+            self._lock.release()
+
+    def _sample(self, duration_sec: float, interval_ms: float, *, include_idle: bool) -> StackSamples:
+        own_thread_id = threading.get_ident()
+        thread_names: dict[int, str] = {}
+        samples = StackSamples(interval_ms=interval_ms)
+        started = time.perf_counter()
+        deadline = started + duration_sec
+
+        while time.perf_counter() < deadline:
+            for thread_id, frame in sys._current_frames().items():
+                if thread_id == own_thread_id:
+                    continue
+
+                if thread_id not in thread_names:
+                    thread_names.update((thread.ident, thread.name) for thread in threading.enumerate())
+
+                idle = _is_idle(frame=frame)
+
+                if idle and not include_idle:
+                    continue
+
+                thread_name = thread_names.get(thread_id, f"thread-{thread_id}")
+                stack = (thread_name, *self._collapse(frame=frame))
+                samples.counts[(*stack, IDLE_FRAME) if idle else stack] += 1
+
+            time.sleep(interval_ms / 1000)
+
+        samples.duration_ms = (time.perf_counter() - started) * 1000
+
+        return samples
+
+    def _collapse(self, frame: FrameType) -> Stack:
+        frames = []
+        current: FrameType | None = frame
+
+        while current is not None:
+            code = current.f_code
+            filename = code.co_filename.removeprefix(self._root).replace(";", ":")
+            frames.append(f"{code.co_name} ({filename}:{code.co_firstlineno})")
+            current = current.f_back
+
+        frames.reverse()
+
+        return tuple(frames)
+
+
+def _is_idle(frame: FrameType) -> bool:
+    code = frame.f_code
+
+    return (os.path.basename(code.co_filename), code.co_name) in IDLE_LEAF_FRAMES
@@ -1,9 +1,11 @@
+import asyncio
 from datetime import UTC, datetime, timedelta
 from uuid import uuid4
 
 from jwt import encode
 from passlib.context import CryptContext
 
+from src.app.core.security.password_executor import PasswordHashExecutor
 from src.cfg.cfg import settings
 
 
@@ -12,8 +14,9 @@ class AuthManager:
     Manages security operations related to authentication.
     """
 
-    def __init__(self, context: CryptContext) -> None:
+    def __init__(self, context: CryptContext, executor: PasswordHashExecutor | None = None) -> None:
         self.context = context
+        self.executor = executor
 
     def hash_password(self, password: str) -> str:
         """
@@ -43,6 +46,75 @@ class AuthManager:
 
         return self.context.verify(secret=plain_password, hash=hashed_password)
 
+    async def hash_password_async(self, password: str) -> str:
+        """
+        Hashes a password without blocking the event loop.
+
+        :param password: input password to hash
+        :return: hash value
+        """
+
+        if self.executor is None:
+            return await asyncio.to_thread(self.hash_password, password)
+
+        return await self.executor.run(self.hash_password, password=password)
+
+    async def verify_password_against_hash_async(
+            self,
+            plain_password: str,
+            hashed_password: str,
+    ) -> bool:
+        """
+        Validates a password against a hash without blocking the event loop.
+
+        :param plain_password: Password to validate
+        :param hashed_password: Hashed password to validate against
+
+        :return: True if the password matches the hash, otherwise False.
+        """
+
+        if self.executor is None:
+            return await asyncio.to_thread(
+                self.verify_password_against_hash,
+                plain_password,
+                hashed_password,
+            )
+
+        return await self.executor.run(
+            self.verify_password_against_hash,
+            plain_password=plain_password,
+            hashed_password=hashed_password,
+        )
+
+    async def verify_login_password(
+            self,
+            plain_password: str,
+            hashed_password: str,
+    ) -> bool:
+        """
+        Validates a login password under the login concurrency limit.
+
+        Logins are the only unauthenticated hashing path, so they are capped
+        separately to keep a login storm from monopolizing hashing threads.
+
+        :param plain_password: Password to validate
+        :param hashed_password: Hashed password to validate against
+
+        :return: True if the password matches the hash, otherwise False.
+        """
+
+        if self.executor is None:
+            return await self.verify_password_against_hash_async(
+                plain_password=plain_password,
+                hashed_password=hashed_password,
+            )
+
+        return await self.executor.run_login(
+            self.verify_password_against_hash,
+            plain_password=plain_password,
+            hashed_password=hashed_password,
+        )
+
     @staticmethod
     def generate_jwt(
             input_data: dict,
@@ -0,0 +1,106 @@
+import asyncio
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+
+
+class PasswordHashExecutor:
+    """
+    Runs password hashing off the event loop in a bounded thread pool.
+
+    bcrypt releases the GIL while hashing, so threads give real parallelism
+    without the pickling overhead of a process pool.
+    """
+
+    def __init__(self, max_workers: int, max_concurrent_logins: int) -> None:
+        """
+        Initialize password hash executor.
+
+        Login verification is capped below the pool size, so a login storm
+        cannot starve signups and password changes of hashing threads.
+
+        :param max_workers: hashing threads
+        :param max_concurrent_logins: max login verifications in flight
+
+        :return: None
+        """
+        self.max_workers = max_workers
+        self.max_concurrent_logins = max_concurrent_logins
+        self._executor: ThreadPoolExecutor | None = None
+        self._login_slots: asyncio.Semaphore | None = None
+        self._login_loop: asyncio.AbstractEventLoop | None = None
+
+    def open(self) -> ThreadPoolExecutor:
+        """
+        Create the thread pool if it is not open yet.
+
+        The pool is created on first use and again after ``shutdown``, so a
+        stopped executor keeps working for entrypoints that outlive the
+        application lifespan, such as tests and scripts.
+
+        :return: thread pool
+        """
+
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(
+                max_workers=self.max_workers,
+                thread_name_prefix="password-hash",
+            )
+
+        return self._executor
+
+    async def run[T](self, func: Callable[..., T], /, **kwargs: object) -> T:
+        """
+        Run a hashing call in the pool.
+
+        :param func: blocking hashing callable
+        :param kwargs: callable keyword arguments
+
+        :return: callable result
+        """
+        loop = asyncio.get_running_loop()
+
+        return await loop.run_in_executor(self.open(), partial(func, **kwargs))
+
+    async def run_login[T](self, func: Callable[..., T], /, **kwargs: object) -> T:
+        """
+        Run a login verification under the login concurrency limit.
+
+        Excess logins wait for a slot on the event loop, which costs nothing
+        while they wait.
+
+        :param func: blocking hashing callable
+        :param kwargs: callable keyword arguments
+
+        :return: callable result
+        """
+        async with self._get_login_slots():
+            return await self.run(func, **kwargs)
+
+    def _get_login_slots(self) -> asyncio.Semaphore:
+        """
+        Get the login semaphore bound to the running event loop.
+
+        The executor is a process-wide singleton, while a semaphore belongs to
+        one loop, so it is rebuilt when the loop changes.
+
+        :return: login semaphore
+        """
+        loop = asyncio.get_running_loop()
+
+        if self._login_slots is None or self._login_loop is not loop:
+            self._login_slots = asyncio.Semaphore(value=self.max_concurrent_logins)
+            self._login_loop = loop
+
+        return self._login_slots
+
+    def shutdown(self) -> None:
+        """
+        Stop pool threads after queued work finishes and drop the pool.
+
+        :return: None
+        """
+        executor, self._executor = self._executor, None
+
+        if executor is not None:
+            executor.shutdown(wait=True)
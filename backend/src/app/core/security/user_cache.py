@@ -0,0 +1,117 @@
+from uuid import UUID
+
+from src.app.core.cache import TTLCache
+from src.app.domain.models.dto.user import UserDTO
+
+
+class UserCache:
+    """
+    Caches resolved users by JWT subject to skip per-request user lookups.
+
+    The cache is per process: an invalidation in one worker does not reach
+    the others, so the TTL bounds how long another worker may serve a stale
+    profile after a change.
+    """
+
+    def __init__(self, max_size: int, ttl_sec: float) -> None:
+        """
+        Initialize user cache.
+
+        :param max_size: max cached users
+        :param ttl_sec: entry lifetime
+
+        :return: None
+        """
+        self._cache: TTLCache[str, UserDTO] = TTLCache(max_size=max_size, ttl_sec=ttl_sec)
+        self._generation = 0
+
+    @property
+    def hits(self) -> int:
+        """
+        Count lookups served from the cache.
+
+        :return: cache hits
+        """
+
+        return self._cache.hits
+
+    @property
+    def misses(self) -> int:
+        """
+        Count lookups that missed the cache.
+
+        :return: cache misses
+        """
+
+        return self._cache.misses
+
+    @property
+    def generation(self) -> int:
+        """
+        Get the invalidation generation.
+
+        Callers read it before a lookup and pass it to ``set``, so a lookup
+        that raced with an invalidation does not store the old user.
+
+        :return: number of invalidations so far
+        """
+
+        return self._generation
+
+    def get(self, username: str) -> UserDTO | None:
+        """
+        Get cached user by username.
+
+        :param username: token subject
+
+        :return: cached user or None
+        """
+
+        return self._cache.get(key=username)
+
+    def set(self, user: UserDTO, generation: int | None = None) -> None:
+        """
+        Cache resolved user.
+
+        :param user: resolved user
+        :param generation: generation read before the lookup; the user is not
+          stored if an invalidation happened since
+
+        :return: None
+        """
+
+        if generation is not None and generation != self._generation:
+            return
+
+        self._cache.set(key=user.username, value=user)
+
+    def invalidate(self, username: str) -> None:
+        """
+        Drop cached user by username.
+
+        :param username: token subject
+
+        :return: None
+        """
+        self._generation += 1
+        self._cache.pop(key=username)
+
+    def invalidate_user_id(self, user_id: UUID) -> None:
+        """
+        Drop cached user by id, whatever username it was cached under.
+
+        :param user_id: user id
+
+        :return: None
+        """
+        self._generation += 1
+        self._cache.pop_where(predicate=lambda user: user.id == user_id)
+
+    def clear(self) -> None:
+        """
+        Drop every cached user.
+
+        :return: None
+        """
+        self._generation += 1
+        self._cache.clear()
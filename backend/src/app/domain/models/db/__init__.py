@@ -1,6 +1,7 @@
 from .base import Base
 from .lesson import Lesson
 from .lesson_progress import LessonProgress
+from .rate_limit_counter import RateLimitCounter
 from .user import User
 
-__all__ = ["Base", "Lesson", "LessonProgress", "User"]
+__all__ = ["Base", "Lesson", "LessonProgress", "RateLimitCounter", "User"]
@@ -1,6 +1,6 @@
 from datetime import datetime
 
-from sqlalchemy import Boolean, DateTime, JSON, String, Text, false, func
+from sqlalchemy import Boolean, DateTime, JSON, String, Text, UniqueConstraint, false, func
 from sqlalchemy.orm import Mapped, mapped_column
 
 from src.app.domain.models.db import Base
@@ -9,15 +9,20 @@ from src.app.domain.models.dto.lesson import LessonCaseDTO, LessonDTO, LessonSam
 
 class Lesson(Base):
     __tablename__ = "lessons"
+    __table_args__ = (
+        UniqueConstraint("order", name="uq_lessons_order"),
+    )
 
     order: Mapped[str] = mapped_column(String(64))
     no_code: Mapped[bool] = mapped_column(Boolean(), default=False, server_default=false())
     slug: Mapped[str] = mapped_column(String(255), unique=True)
     name: Mapped[str] = mapped_column(String(255), default="Lesson name")
     body_markdown: Mapped[str] = mapped_column(Text(), default="body")
+    body_html: Mapped[str | None] = mapped_column(Text(), nullable=True, default=None)
     code_editor_default: Mapped[str] = mapped_column(Text(), default="")
     cases: Mapped[list[dict[str, str | bool]]] = mapped_column(JSON(), default=list)
     questions: Mapped[list[dict[str, str | int | list[str]]]] = mapped_column(JSON(), default=list)
+    content_hash: Mapped[str | None] = mapped_column(String(64), nullable=True, default=None)
 
     created_at: Mapped[datetime] = mapped_column(DateTime(), server_default=func.now())
     updated_at: Mapped[datetime] = mapped_column(
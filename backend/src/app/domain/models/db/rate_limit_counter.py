@@ -0,0 +1,13 @@
+from sqlalchemy import BigInteger, Integer, String
+from sqlalchemy.orm import Mapped, mapped_column
+
+from src.app.domain.models.db import Base
+
+
+class RateLimitCounter(Base):
+    __tablename__ = "rate_limit_counters"
+
+    key: Mapped[str] = mapped_column(String(255), unique=True)
+    window_index: Mapped[int] = mapped_column(BigInteger())
+    hits: Mapped[int] = mapped_column(Integer(), default=0)
+    previous_hits: Mapped[int] = mapped_column(Integer(), default=0)
@@ -1,19 +1,32 @@
 from .case import LessonCaseDTO
 from .create_lesson import CreateLessonDTO
+from .index_entry import LessonIndexEntryDTO
 from .lesson import LessonDTO
 from .question import LessonQuestionDTO
 from .sample_case import LessonSampleCaseDTO
-from .sync import LessonSyncDiffDTO, LessonSyncResultDTO, LessonSyncUpdateItemDTO
+from .search import LessonSearchDocumentDTO, LessonSearchHitDTO
+from .sync import (
+    LessonSyncDiffDTO,
+    LessonSyncEventDTO,
+    LessonSyncResultDTO,
+    LessonSyncStateDTO,
+    LessonSyncUpdateItemDTO,
+)
 from .update_lesson import UpdateLessonDTO
 
 __all__ = [
     "CreateLessonDTO",
     "LessonCaseDTO",
     "LessonDTO",
+    "LessonIndexEntryDTO",
     "LessonQuestionDTO",
     "LessonSampleCaseDTO",
+    "LessonSearchDocumentDTO",
+    "LessonSearchHitDTO",
     "LessonSyncDiffDTO",
+    "LessonSyncEventDTO",
     "LessonSyncResultDTO",
+    "LessonSyncStateDTO",
     "LessonSyncUpdateItemDTO",
     "UpdateLessonDTO",
 ]
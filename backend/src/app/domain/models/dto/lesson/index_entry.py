@@ -0,0 +1,10 @@
+from uuid import UUID
+
+from src.app.domain.models.dto.extended_basemodel import ExtendedBaseModel
+
+
+class LessonIndexEntryDTO(ExtendedBaseModel):
+    id: UUID
+    order: str
+    slug: str
+    name: str
@@ -16,6 +16,7 @@ class LessonDTO(ExtendedBaseModel):
     slug: str
     name: str
     body_markdown: str
+    body_html: str | None = None
     code_editor_default: str
     cases: list[LessonCaseDTO]
     questions: list[LessonQuestionDTO]
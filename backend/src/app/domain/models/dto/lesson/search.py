@@ -0,0 +1,24 @@
+from uuid import UUID
+
+from pydantic import Field
+
+from src.app.domain.models.dto.extended_basemodel import ExtendedBaseModel
+
+
+class LessonSearchDocumentDTO(ExtendedBaseModel):
+    id: UUID
+    order: str
+    slug: str
+    name: str
+    body_markdown: str
+    question_prompts: list[str] = Field(default_factory=list)
+    case_labels: list[str] = Field(default_factory=list)
+
+
+class LessonSearchHitDTO(ExtendedBaseModel):
+    id: UUID
+    order: str
+    slug: str
+    name: str
+    score: float
+    snippet: str
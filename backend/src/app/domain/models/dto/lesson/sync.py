@@ -6,6 +6,13 @@ from pydantic import Field, model_validator
 
 from src.app.domain.models.dto.extended_basemodel import ExtendedBaseModel
 from src.app.domain.models.dto.lesson.create_lesson import CreateLessonDTO
+from src.app.domain.models.enums.lesson_sync import LessonSyncAction, LessonSyncEvent
+
+
+class LessonSyncStateDTO(ExtendedBaseModel):
+    id: UUID
+    slug: str
+    content_hash: str | None = None
 
 
 class LessonSyncUpdateItemDTO(ExtendedBaseModel):
@@ -17,6 +24,7 @@ class LessonSyncDiffDTO(ExtendedBaseModel):
     create_payloads: list[CreateLessonDTO] = Field(default_factory=list)
     update_payloads: list[LessonSyncUpdateItemDTO] = Field(default_factory=list)
     delete_ids: list[UUID] = Field(default_factory=list)
+    content_hashes: dict[str, str] = Field(default_factory=dict)
     unchanged: int = 0
     total: int
 
@@ -44,6 +52,7 @@ class LessonSyncResultDTO(ExtendedBaseModel):
     unchanged: int
     total: int
     dry_run: bool = False
+    timings_ms: dict[str, float] = Field(default_factory=dict)
 
     @model_validator(mode="after")
     def validate_counters(self) -> LessonSyncResultDTO:
@@ -56,3 +65,14 @@ class LessonSyncResultDTO(ExtendedBaseModel):
             raise ValueError(message)
 
         return self
+
+
+class LessonSyncEventDTO(ExtendedBaseModel):
+    event: LessonSyncEvent
+    action: LessonSyncAction | None = None
+    slug: str | None = None
+    lesson_id: UUID | None = None
+    count: int | None = None
+    elapsed_ms: float | None = None
+    detail: str | None = None
+    result: LessonSyncResultDTO | None = None
@@ -0,0 +1,3 @@
+from .progress_summary import ProgressSectionDTO, ProgressSummaryDTO
+
+__all__ = ["ProgressSectionDTO", "ProgressSummaryDTO"]
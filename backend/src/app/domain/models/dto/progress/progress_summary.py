@@ -0,0 +1,16 @@
+from src.app.domain.models.dto.extended_basemodel import ExtendedBaseModel
+from src.app.domain.models.dto.lesson.index_entry import LessonIndexEntryDTO
+
+
+class ProgressSectionDTO(ExtendedBaseModel):
+    section: str
+    title: str | None = None
+    completed: int
+    total: int
+
+
+class ProgressSummaryDTO(ExtendedBaseModel):
+    completed: int
+    total: int
+    sections: list[ProgressSectionDTO]
+    next_lesson: LessonIndexEntryDTO | None = None
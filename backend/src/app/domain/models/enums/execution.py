@@ -11,3 +11,13 @@ class ExecutionStatus(StrEnum):
     COMPILE_ERROR = "compile_error"
     RUNTIME_ERROR = "runtime_error"
     TIMEOUT = "timeout"
+
+
+class RateLimitBackendKind(StrEnum):
+    """
+    Rate limit storage backend definition.
+    """
+
+    MEMORY = "memory"
+    SHARED_MEMORY = "shared_memory"
+    DATABASE = "database"
@@ -0,0 +1,24 @@
+from enum import StrEnum
+
+
+class LessonSyncEvent(StrEnum):
+    """
+    Streamed lesson sync progress event definition.
+    """
+
+    SCANNED = "scanned"
+    LOADED = "loaded"
+    DIFFED = "diffed"
+    WRITTEN = "written"
+    COMPLETED = "completed"
+    FAILED = "failed"
+
+
+class LessonSyncAction(StrEnum):
+    """
+    Lesson sync write action definition.
+    """
+
+    CREATE = "create"
+    UPDATE = "update"
+    DELETE = "delete"
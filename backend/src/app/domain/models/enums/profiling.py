@@ -0,0 +1,10 @@
+from enum import StrEnum
+
+
+class ProfileFormat(StrEnum):
+    """
+    Sampling profile output format definition.
+    """
+
+    COLLAPSED = "collapsed"
+    SPEEDSCOPE = "speedscope"
@@ -1,11 +1,13 @@
 from .base_repository import BaseRepository
 from .lesson_progress_repository import LessonProgressRepository
 from .lesson_repository import LessonRepository
+from .rate_limit_counter_repository import RateLimitCounterRepository
 from .user_repository import UserRepository
 
 __all__ = [
     'BaseRepository',
     'LessonProgressRepository',
     'LessonRepository',
+    'RateLimitCounterRepository',
     'UserRepository',
 ]
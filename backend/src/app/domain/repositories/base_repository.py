@@ -1,13 +1,19 @@
-from typing import TypeVar
+from collections.abc import AsyncIterator, Callable, Sequence
+from typing import Any, TypeVar
 from uuid import UUID
 
-from sqlalchemy import select
+from sqlalchemy import Select, delete, insert, select, update
+from sqlalchemy.dialects.mysql import insert as mysql_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.sql.dml import Insert
 
 from src.app.domain.models.db import Base
 
 Model = TypeVar("Model", bound=Base)
 
+BULK_CHUNK_SIZE = 500
+
 
 class BaseRepository[Model]:
     def __init__(
@@ -39,17 +45,84 @@ class BaseRepository[Model]:
 
         return result
 
-    async def get_all(self) -> list[Model]:
+    async def get_all(self, columns: Sequence[Any] | None = None) -> list[Any]:
         """
         Get all objects from the database
 
-        :return: List of all objects from the database
+        :param columns: optional columns to select instead of whole models
+
+        :return: List of all objects, or rows with the requested columns
         """
+
+        if columns:
+            result = await self.session.execute(select(*columns))
+            return list(result)
+
         stmt = select(self.model)
         result = await self.session.scalars(stmt)
 
         return list(result.unique())
 
+    async def get_page(
+            self,
+            limit: int,
+            cursor: UUID | None = None,
+            columns: Sequence[Any] | None = None,
+    ) -> list[Any]:
+        """
+        Get one page of objects ordered by id.
+
+        Pages are keyset-based: the next page starts after the last id of the
+        previous one, so each page is an index range scan no matter how deep
+        the client has paged.
+
+        :param limit: max objects per page
+        :param cursor: last id of the previous page, None for the first page
+        :param columns: optional columns to select instead of whole models
+
+        :return: models, or rows with the requested columns
+        """
+        id_column = self.model.id  # type: ignore
+        stmt: Select[Any] = select(*columns) if columns else select(self.model)
+        stmt = stmt.order_by(id_column).limit(limit)
+
+        if cursor is not None:
+            stmt = stmt.where(id_column > cursor)
+
+        if columns:
+            result = await self.session.execute(stmt)
+
+            return list(result.all())
+
+        scalars = await self.session.scalars(stmt)
+
+        return list(scalars.all())
+
+    async def stream_scalars(
+            self,
+            stmt: Select[Any] | None = None,
+            batch_size: int = 500,
+    ) -> AsyncIterator[Model]:
+        """
+        Iterate over objects without loading the whole result into memory.
+
+        Rows are fetched from a server-side cursor in batches of batch_size,
+        so memory stays bounded by the batch rather than the table.
+
+        :param stmt: select statement, all objects by default
+        :param batch_size: rows fetched per round trip
+
+        :return: async iterator of objects
+        """
+        stmt = stmt if stmt is not None else select(self.model)
+        result = await self.session.stream_scalars(
+            stmt,
+            execution_options={"yield_per": batch_size},
+        )
+
+        async for item in result:
+            yield item
+
     async def add(self, model: Model) -> None:
         """
         Add a model instance to the session.
@@ -60,6 +133,51 @@ class BaseRepository[Model]:
         """
         self.session.add(model)
 
+    async def add_many(self, rows: list[dict[str, object]], chunk_size: int = BULK_CHUNK_SIZE) -> None:
+        """
+        Insert rows with executemany, chunk_size rows per statement.
+
+        :param rows: column values per row
+        :param chunk_size: max rows per statement
+
+        :return: None
+        """
+        for start in range(0, len(rows), chunk_size):
+            await self.session.execute(insert(self.model), rows[start:start + chunk_size])
+
+    async def update_many(self, rows: list[dict[str, object]], chunk_size: int = BULK_CHUNK_SIZE) -> None:
+        """
+        Update rows by primary key with executemany, chunk_size rows per statement.
+
+        Every row must contain ``id``. Rows are not loaded first.
+
+        :param rows: id and changed column values per row
+        :param chunk_size: max rows per statement
+
+        :return: None
+        """
+        for start in range(0, len(rows), chunk_size):
+            await self.session.execute(update(self.model), rows[start:start + chunk_size])
+
+    async def delete_many(self, ids: list[UUID], chunk_size: int = BULK_CHUNK_SIZE) -> int:
+        """
+        Delete objects with ``DELETE ... WHERE id IN (...)``, chunk_size ids per statement.
+
+        :param ids: object ids
+        :param chunk_size: max ids per statement
+
+        :return: number of deleted rows
+        """
+        id_column = self.model.id  # type: ignore
+        deleted = 0
+
+        for start in range(0, len(ids), chunk_size):
+            stmt = delete(self.model).where(id_column.in_(ids[start:start + chunk_size]))
+            result = await self.session.execute(stmt)
+            deleted += result.rowcount
+
+        return deleted
+
     async def delete(self, id: UUID) -> bool:
         """
         Delete an object by id.
@@ -99,3 +217,76 @@ class BaseRepository[Model]:
                 setattr(item, key, value)
 
         return item
+
+    def _build_upsert(
+            self,
+            values: dict[str, object],
+            index_elements: list[str],
+            build_update: Callable[[Any], list[tuple[str, object]]],
+    ) -> Insert:
+        """
+        Build a single-statement insert-or-update for the session dialect.
+
+        ``build_update`` receives the dialect's proposed-row namespace
+        (``inserted`` on MySQL, ``excluded`` on SQLite) and returns ordered
+        column assignments. Order matters on MySQL, where assignments are
+        applied left to right and later ones see earlier results.
+
+        :param values: row values to insert
+        :param index_elements: unique columns that identify a conflicting row
+        :param build_update: assignments applied when the row already exists
+
+        :return: upsert statement
+        """
+        dialect_name = self.session.get_bind().dialect.name
+
+        if dialect_name == "mysql":
+            mysql_stmt = mysql_insert(self.model).values(**values)
+
+            return mysql_stmt.on_duplicate_key_update(build_update(mysql_stmt.inserted))
+
+        if dialect_name == "sqlite":
+            sqlite_stmt = sqlite_insert(self.model).values(**values)
+
+            return sqlite_stmt.on_conflict_do_update(
+                index_elements=index_elements,
+                set_=dict(build_update(sqlite_stmt.excluded)),
+            )
+
+        message = f"upsert is not supported for dialect: {dialect_name}"
+        raise NotImplementedError(message)
+
+    def _build_insert_ignore(
+            self,
+            values: dict[str, object] | list[dict[str, object]],
+            index_elements: list[str],
+    ) -> Insert:
+        """
+        Build a single-statement insert that skips rows which already exist.
+
+        On MySQL this is a no-op ``ON DUPLICATE KEY UPDATE`` rather than
+        ``INSERT IGNORE``, which would also downgrade foreign key and data
+        errors to warnings.
+
+        :param values: row values to insert, or a list of rows for a multi-row insert
+        :param index_elements: unique columns that identify a conflicting row
+
+        :return: insert statement
+        """
+        dialect_name = self.session.get_bind().dialect.name
+
+        if dialect_name == "mysql":
+            mysql_stmt = mysql_insert(self.model).values(values)
+            first_column = index_elements[0]
+
+            return mysql_stmt.on_duplicate_key_update(
+                [(first_column, getattr(self.model, first_column))],
+            )
+
+        if dialect_name == "sqlite":
+            return sqlite_insert(self.model).values(values).on_conflict_do_nothing(
+                index_elements=index_elements,
+            )
+
+        message = f"insert ignore is not supported for dialect: {dialect_name}"
+        raise NotImplementedError(message)
@@ -34,23 +34,41 @@ class LessonProgressRepository(BaseRepository[LessonProgress]):
 
         return list(result.all())
 
-    async def exists(self, user_id: UUID, lesson_id: UUID) -> bool:
+    async def add_if_missing(self, user_id: UUID, lesson_id: UUID) -> None:
         """
-        Check if progress exists.
+        Insert progress row unless it already exists.
+
+        The unique (user_id, lesson_id) constraint resolves duplicates inside
+        the database, so concurrent accepts never race into an integrity error.
 
         :param user_id: user id
         :param lesson_id: lesson id
 
-        :return: True if progress exists
+        :return: None
         """
-        stmt = (
-            select(LessonProgress.id)
-            .where(LessonProgress.user_id == user_id)
-            .where(LessonProgress.lesson_id == lesson_id)
+        stmt = self._build_insert_ignore(
+            values={"user_id": user_id, "lesson_id": lesson_id},
+            index_elements=["user_id", "lesson_id"],
         )
-        result = await self.session.scalar(stmt)
+        await self.session.execute(stmt)
+
+    async def add_many_if_missing(self, pairs: list[tuple[UUID, UUID]]) -> None:
+        """
+        Insert progress rows in one multi-row statement, skipping existing ones.
+
+        :param pairs: (user_id, lesson_id) pairs
 
-        return result is not None
+        :return: None
+        """
+
+        if not pairs:
+            return
+
+        stmt = self._build_insert_ignore(
+            values=[{"user_id": user_id, "lesson_id": lesson_id} for user_id, lesson_id in pairs],
+            index_elements=["user_id", "lesson_id"],
+        )
+        await self.session.execute(stmt)
 
     async def reset_for_user(self, user_id: UUID) -> int:
         """
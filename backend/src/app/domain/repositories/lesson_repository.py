@@ -1,7 +1,10 @@
-from sqlalchemy import select
+from uuid import UUID
+
+from sqlalchemy import select, update
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.app.domain.models.db.lesson import Lesson
+from src.app.domain.models.dto.lesson import LessonIndexEntryDTO, LessonSearchDocumentDTO, LessonSyncStateDTO
 from src.app.domain.repositories.base_repository import BaseRepository
 
 
@@ -30,3 +33,127 @@ class LessonRepository(BaseRepository[Lesson]):
         stmt = select(Lesson).where(Lesson.slug == slug)
 
         return await self.session.scalar(stmt)
+
+    async def order_exists(self, order: str, exclude_id: UUID | None = None) -> bool:
+        """
+        Check whether a lesson order is taken.
+
+        The lookup hits the unique order index and reads only the id, so its
+        cost does not grow with course size.
+
+        :param order: normalized lesson order
+        :param exclude_id: lesson id to ignore, used when updating a lesson
+
+        :return: True if another lesson uses the order
+        """
+        stmt = select(Lesson.id).where(Lesson.order == order)
+
+        if exclude_id is not None:
+            stmt = stmt.where(Lesson.id != exclude_id)
+
+        result = await self.session.scalar(stmt.limit(1))
+
+        return result is not None
+
+    async def get_orders(self, ids: list[UUID]) -> dict[UUID, str]:
+        """
+        Get stored orders for lessons.
+
+        :param ids: lesson ids
+
+        :return: order by lesson id
+        """
+
+        if not ids:
+            return {}
+
+        stmt = select(Lesson.id, Lesson.order).where(Lesson.id.in_(ids))
+        result = await self.session.execute(stmt)
+
+        return {row.id: row.order for row in result}
+
+    async def park_orders(self, ids: list[UUID]) -> None:
+        """
+        Move lessons to temporary orders that cannot collide with real ones.
+
+        Real orders are dotted numbers, so a ``~`` prefix keeps parked values
+        unique and outside the valid order space.
+
+        :param ids: lesson ids
+
+        :return: None
+        """
+
+        if not ids:
+            return
+
+        await self.session.execute(
+            update(Lesson),
+            [{"id": lesson_id, "order": f"~{lesson_id.hex}"} for lesson_id in ids],
+        )
+
+    async def get_index_entries(self) -> list[LessonIndexEntryDTO]:
+        """
+        Get the lesson outline without bodies, cases or questions.
+
+        :return: lesson index entries
+        """
+        stmt = select(Lesson.id, Lesson.order, Lesson.slug, Lesson.name)
+        result = await self.session.execute(stmt)
+
+        return [
+            LessonIndexEntryDTO(id=row.id, order=row.order, slug=row.slug, name=row.name)
+            for row in result
+        ]
+
+    async def get_search_documents(self, ids: list[UUID] | None = None) -> list[LessonSearchDocumentDTO]:
+        """
+        Get the searchable text of lessons.
+
+        :param ids: lesson ids to fetch, or None for every lesson
+
+        :return: lesson search documents of the lessons that exist
+        """
+        stmt = select(
+            Lesson.id,
+            Lesson.order,
+            Lesson.slug,
+            Lesson.name,
+            Lesson.body_markdown,
+            Lesson.questions,
+            Lesson.cases,
+        )
+
+        if ids is not None:
+            stmt = stmt.where(Lesson.id.in_(ids))
+
+        result = await self.session.execute(stmt)
+
+        return [
+            LessonSearchDocumentDTO(
+                id=row.id,
+                order=row.order,
+                slug=row.slug,
+                name=row.name,
+                body_markdown=row.body_markdown,
+                question_prompts=[str(question.get("prompt", "")) for question in row.questions or []],
+                case_labels=[str(case.get("label", "")) for case in row.cases or []],
+            )
+            for row in result
+        ]
+
+    async def get_sync_states(self) -> list[LessonSyncStateDTO]:
+        """
+        Get the slug and content hash of every lesson.
+
+        Sync compares these hashes with the files instead of loading full rows.
+
+        :return: lesson sync states
+        """
+        stmt = select(Lesson.id, Lesson.slug, Lesson.content_hash)
+        result = await self.session.execute(stmt)
+
+        return [
+            LessonSyncStateDTO(id=row.id, slug=row.slug, content_hash=row.content_hash)
+            for row in result
+        ]
@@ -0,0 +1,66 @@
+from sqlalchemy import case, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.app.domain.models.db.rate_limit_counter import RateLimitCounter
+from src.app.domain.repositories.base_repository import BaseRepository
+
+
+class RateLimitCounterRepository(BaseRepository[RateLimitCounter]):
+    def __init__(self, session: AsyncSession) -> None:
+        """
+        Initialize rate limit counter repository.
+
+        :param session: database session
+
+        :return: None
+        """
+        super().__init__(
+            session=session,
+            model=RateLimitCounter,
+        )
+
+    async def increment(self, key: str, window_index: int) -> tuple[int, int]:
+        """
+        Atomically count one hit for key in the given window.
+
+        The upsert rolls the counter over when the stored window is stale,
+        keeping the hits of the window right before the current one, so each
+        key keeps exactly one row and no cleanup job is needed. The row lock
+        taken by the upsert is held until commit, which makes the follow-up
+        read consistent across concurrent workers.
+
+        :param key: rate limit key
+        :param window_index: current fixed window number
+
+        :return: current window hits, including this one, and previous window hits
+        """
+        stmt = self._build_upsert(
+            values={"key": key, "window_index": window_index, "hits": 1, "previous_hits": 0},
+            index_elements=["key"],
+            build_update=lambda inserted: [
+                (
+                    "previous_hits",
+                    case(
+                        (RateLimitCounter.window_index == inserted.window_index, RateLimitCounter.previous_hits),
+                        (RateLimitCounter.window_index == inserted.window_index - 1, RateLimitCounter.hits),
+                        else_=0,
+                    ),
+                ),
+                (
+                    "hits",
+                    case(
+                        (RateLimitCounter.window_index == inserted.window_index, RateLimitCounter.hits + 1),
+                        else_=1,
+                    ),
+                ),
+                ("window_index", inserted.window_index),
+            ],
+        )
+        await self.session.execute(stmt)
+
+        hits_stmt = select(RateLimitCounter.hits, RateLimitCounter.previous_hits).where(
+            RateLimitCounter.key == key,
+        )
+        row = (await self.session.execute(hits_stmt)).one()
+
+        return row.hits, row.previous_hits
@@ -8,7 +8,9 @@ from .lesson_service import LessonService
 from .lesson_sync_diff_builder import LessonSyncDiffBuilder
 from .lesson_sync_importer import LessonSyncImporter
 from .lesson_sync_service import LessonSyncService
+from .lessons_watcher import LessonsWatcher
 from .piston_service import PistonService
+from .progress_write_queue import ProgressWriteQueue
 from .user_service import UserService
 
 __all__ = [
@@ -22,6 +24,8 @@ __all__ = [
     "LessonSyncDiffBuilder",
     "LessonSyncImporter",
     "LessonSyncService",
+    "LessonsWatcher",
     "PistonService",
+    "ProgressWriteQueue",
     "UserService",
 ]
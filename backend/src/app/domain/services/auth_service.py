@@ -41,6 +41,7 @@ class AuthService:
         return self.auth_manager.generate_jwt(
             input_data={
                 "sub": user.username,
+                "uid": str(user.id),
                 "role": user.role.value,
             },
         )
@@ -66,7 +67,7 @@ class AuthService:
         if hashed_password is None:
             return None
 
-        is_password_correct = self.auth_manager.verify_password_against_hash(
+        is_password_correct = await self.auth_manager.verify_login_password(
             plain_password=credentials.plain_password,
             hashed_password=hashed_password,
         )
@@ -1,9 +1,11 @@
 import asyncio
 import json
+import time
 from pathlib import Path
 from tempfile import TemporaryDirectory
 
 from src.app.core.exceptions.execution_exc import ExecutionServiceUnavailable
+from src.app.core.observability.registry import CODE_ANALYSIS_DURATION
 from src.app.domain.models.dto.execution.code_analysis_diagnostic import (
     CodeAnalysisDiagnosticDTO,
 )
@@ -19,6 +21,7 @@ class CodeAnalysisService:
             file_path = Path(temp_dir) / "lesson_code.py"
             file_path.write_text(code, encoding="utf-8")
 
+            started = time.perf_counter_ns()
             process = await asyncio.create_subprocess_exec(
                 "pyrefly",
                 "check",
@@ -37,9 +40,12 @@ class CodeAnalysisService:
             except TimeoutError as exc:
                 process.kill()
                 await process.communicate()
+                self._observe(started=started, outcome="timeout")
                 message = "Static analysis timed out."
                 raise ExecutionServiceUnavailable(detail=message) from exc
 
+        self._observe(started=started, outcome="ok" if process.returncode in {0, 1} else "error")
+
         if process.returncode not in {0, 1}:
             detail = stderr.decode("utf-8").strip() or "Static analysis failed."
             raise ExecutionServiceUnavailable(detail=detail)
@@ -65,3 +71,7 @@ class CodeAnalysisService:
         ]
 
         return CodeAnalysisResultDTO(diagnostics=diagnostics)
+
+    @staticmethod
+    def _observe(started: int, outcome: str) -> None:
+        CODE_ANALYSIS_DURATION.observe(value=(time.perf_counter_ns() - started) / 1_000_000, labels=(outcome,))
@@ -1,7 +1,10 @@
 import json
+import time
 from uuid import UUID
 
 from src.app.core.exceptions.execution_exc import ExecutionPayloadTooLarge
+from src.app.core.observability import NOOP_STAGE_TIMER, StageTimer
+from src.app.core.observability.registry import RUNNER_CALL_DURATION
 from src.app.domain.models.dto.execution.execution_result import ExecutionResultDTO
 from src.app.domain.models.dto.lesson.case import LessonCaseDTO
 from src.app.domain.models.dto.lesson.lesson import LessonDTO
@@ -29,9 +32,18 @@ class CodeExecutionService:
         self.source_builder = source_builder
         self.result_parser = result_parser
 
-    async def execute(self, lesson_id: UUID, code: str, user_id: UUID | None = None) -> ExecutionResultDTO:
-        lesson = await self._get_lesson(lesson_id=lesson_id)
-        self._validate_payload_sizes(code=code, cases=lesson.cases)
+    async def execute(
+            self,
+            lesson_id: UUID,
+            code: str,
+            user_id: UUID | None = None,
+            timer: StageTimer = NOOP_STAGE_TIMER,
+    ) -> ExecutionResultDTO:
+        with timer.stage(name="lesson_fetch"):
+            lesson = await self._get_lesson(lesson_id=lesson_id)
+
+        with timer.stage(name="validate"):
+            self._validate_payload_sizes(code=code, cases=lesson.cases)
 
         if not lesson.cases:
             return ExecutionResultDTO(
@@ -42,18 +54,51 @@ class CodeExecutionService:
                 duration_ms=None,
             )
 
-        source_code = self.source_builder.build(cases=lesson.cases, code=code)
-        if len(source_code) > settings.execution.max_source_chars:
-            raise ExecutionPayloadTooLarge
+        with timer.stage(name="build_source"):
+            source_code = self.source_builder.build(cases=lesson.cases, code=code)
+            if len(source_code) > settings.execution.max_source_chars:
+                raise ExecutionPayloadTooLarge
+
+        runner_started = time.perf_counter_ns()
+
+        try:
+            with timer.stage(name="runner"):
+                runner_result = await self.code_runner.execute(source_code=source_code)
+        except Exception:
+            self._observe_runner_call(duration_ms=_elapsed_ms(started=runner_started), status="unavailable")
+            raise
+
+        runner_ms = _elapsed_ms(started=runner_started)
+
+        if runner_result.run is not None and runner_result.run.wall_time is not None:
+            timer.record(name="runner_wall", duration_ms=runner_result.run.wall_time)
+
+        with timer.stage(name="parse"):
+            result = self.result_parser.parse(runner_result=runner_result, lesson_cases=lesson.cases)
 
-        runner_result = await self.code_runner.execute(source_code=source_code)
-        result = self.result_parser.parse(runner_result=runner_result, lesson_cases=lesson.cases)
+        self._observe_runner_call(duration_ms=runner_ms, status=result.status)
 
         if result.status == ExecutionStatus.ACCEPTED and user_id is not None:
-            await self.progress_service.mark_completed(user_id=user_id, lesson_id=lesson_id)
+            with timer.stage(name="progress"):
+                await self.progress_service.record_completion(user_id=user_id, lesson_id=lesson_id)
 
         return result
 
+    @staticmethod
+    def _observe_runner_call(duration_ms: float, status: str) -> None:
+        """
+        Observe runner call latency labelled with the execution outcome.
+
+        The outcome is only known after parsing, so the duration is measured
+        right after the call returns and recorded once the status is known.
+
+        :param duration_ms: runner call duration in milliseconds
+        :param status: execution status, or "unavailable" if the call failed
+
+        :return: None
+        """
+        RUNNER_CALL_DURATION.observe(value=duration_ms, labels=(status,))
+
     async def _get_lesson(self, lesson_id: UUID) -> LessonDTO:
         return await self.lesson_service.get_by_id(id=lesson_id)
 
@@ -65,3 +110,7 @@ class CodeExecutionService:
         cases_json = json.dumps([case.model_dump() for case in cases])
         if len(cases_json) > settings.execution.max_eval_script_chars:
             raise ExecutionPayloadTooLarge
+
+
+def _elapsed_ms(started: int) -> float:
+    return (time.perf_counter_ns() - started) / 1_000_000
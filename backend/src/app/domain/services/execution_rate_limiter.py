@@ -1,40 +1,43 @@
-import time
-
 from src.app.core.exceptions.execution_exc import ExecutionRateLimited
+from src.app.core.observability.registry import EXECUTION_RATE_LIMIT_REJECTIONS
+from src.app.domain.services.rate_limit_backend import InMemoryRateLimitBackend, RateLimitBackend
 
 
 class ExecutionRateLimiter:
-    def __init__(self, max_requests: int, window_sec: int) -> None:
+    def __init__(
+            self,
+            max_requests: int,
+            window_sec: int,
+            backend: RateLimitBackend | None = None,
+    ) -> None:
         """
         Initialize execution rate limiter.
 
-        :param max_requests: max requests per window
-        :param window_sec: window duration in seconds
+        :param max_requests: max requests per sliding window
+        :param window_sec: sliding window duration in seconds
+        :param backend: counter storage, in-process memory by default
 
         :return: None
         """
         self.max_requests = max_requests
         self.window_sec = window_sec
-        self._buckets: dict[str, list[float]] = {}
+        self.backend = backend or InMemoryRateLimitBackend()
 
-    def check(self, key: str) -> None:
+    async def check(self, key: str) -> None:
         """
         Enforce rate limit for the given key.
 
-        Buckets are stored in memory and designed for a single-process runtime,
-        which keeps MVP behavior simple and predictable.
+        Counting is delegated to the backend, so the effective limit is the
+        configured one whether counters live in one process, one host, or a
+        shared database. Backends estimate a sliding window from two fixed
+        windows, so a burst split across a window boundary is still limited.
 
-        :param key: rate limit key
+        :param key: rate limit key, prefixed with the caller kind, e.g. ``user:<id>``
 
         :return: None
         """
-        now = time.time()
-        window_start = now - self.window_sec
-        bucket = self._buckets.get(key) or []
-        bucket = [timestamp for timestamp in bucket if timestamp >= window_start]
+        hits = await self.backend.hit(key=f"execution:{key}", window_sec=self.window_sec)
 
-        if len(bucket) >= self.max_requests:
+        if hits > self.max_requests:
+            EXECUTION_RATE_LIMIT_REJECTIONS.inc(labels=(key.split(":", 1)[0],))
             raise ExecutionRateLimited
-
-        bucket.append(now)
-        self._buckets[key] = bucket
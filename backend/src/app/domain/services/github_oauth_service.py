@@ -1,3 +1,4 @@
+import asyncio
 from urllib.parse import urlencode
 
 import httpx
@@ -24,17 +25,24 @@ class GithubOAuthService:
     Handles GitHub OAuth authentication flow.
     """
 
-    def __init__(self, user_repository: UserRepository, auth_manager: AuthManager) -> None:
+    def __init__(
+            self,
+            user_repository: UserRepository,
+            auth_manager: AuthManager,
+            http_client: httpx.AsyncClient,
+    ) -> None:
         """
         Initialize GitHub OAuth service.
 
         :param user_repository: user repository
         :param auth_manager: auth manager
+        :param http_client: pooled HTTP client for GitHub calls
 
         :return: None
         """
         self.user_repository = user_repository
         self.auth_manager = auth_manager
+        self.http_client = http_client
 
     def build_authorize_url(self, state: str, code_challenge: str) -> str:
         """
@@ -69,8 +77,10 @@ class GithubOAuthService:
             code=code,
             code_verifier=code_verifier,
         )
-        github_user = await self._fetch_user(access_token=token.access_token)
-        email = await self._fetch_primary_email(access_token=token.access_token)
+        github_user, email = await asyncio.gather(
+            self._fetch_user(access_token=token.access_token),
+            self._fetch_primary_email(access_token=token.access_token),
+        )
         user = await self._get_or_create_user(
             github_id=github_user.id,
             username=github_user.login,
@@ -80,6 +90,7 @@ class GithubOAuthService:
         return self.auth_manager.generate_jwt(
             input_data={
                 "sub": user.username,
+                "uid": str(user.id),
                 "role": user.role.value,
             },
         )
@@ -103,12 +114,11 @@ class GithubOAuthService:
         )
         headers = self._build_token_headers()
 
-        async with httpx.AsyncClient(timeout=10.0) as client:
-            response = await client.post(
-                url=settings.github.token_url,
-                data=data,
-                headers=headers,
-            )
+        response = await self.http_client.post(
+            url=settings.github.token_url,
+            data=data,
+            headers=headers,
+        )
 
         if response.status_code != 200:
             raise OAuthTokenExchangeError(
@@ -132,11 +142,10 @@ class GithubOAuthService:
         """
         headers = self._build_api_headers(access_token=access_token)
 
-        async with httpx.AsyncClient(timeout=10.0) as client:
-            response = await client.get(
-                url=settings.github.user_url,
-                headers=headers,
-            )
+        response = await self.http_client.get(
+            url=settings.github.user_url,
+            headers=headers,
+        )
 
         if response.status_code != 200:
             raise OAuthUserFetchError(detail="Failed to fetch GitHub user profile.")
@@ -153,11 +162,10 @@ class GithubOAuthService:
         """
         headers = self._build_api_headers(access_token=access_token)
 
-        async with httpx.AsyncClient(timeout=10.0) as client:
-            response = await client.get(
-                url=settings.github.emails_url,
-                headers=headers,
-            )
+        response = await self.http_client.get(
+            url=settings.github.emails_url,
+            headers=headers,
+        )
 
         if response.status_code != 200:
             raise OAuthEmailFetchError(detail="Failed to fetch GitHub email list.")
@@ -0,0 +1,43 @@
+from collections.abc import Callable
+from uuid import UUID
+
+LessonChangeListener = Callable[[list[UUID] | None], None]
+
+
+class LessonChangeHub:
+    """
+    Notifies in-process caches when lesson content changes.
+
+    Writers publish after committing, so listeners never observe a change
+    that could still be rolled back.
+    """
+
+    def __init__(self) -> None:
+        """
+        Initialize lesson change hub.
+
+        :return: None
+        """
+        self._listeners: list[LessonChangeListener] = []
+
+    def subscribe(self, listener: LessonChangeListener) -> None:
+        """
+        Register a listener for lesson changes.
+
+        :param listener: callable receiving changed lesson ids, or None when
+          any lesson may have changed
+
+        :return: None
+        """
+        self._listeners.append(listener)
+
+    def publish(self, lesson_ids: list[UUID] | None = None) -> None:
+        """
+        Notify listeners about changed lessons.
+
+        :param lesson_ids: changed lesson ids, or None for a full invalidation
+
+        :return: None
+        """
+        for listener in self._listeners:
+            listener(lesson_ids)
@@ -0,0 +1,137 @@
+import time
+from uuid import UUID
+
+from src.app.domain.lesson_order import lesson_order_key
+from src.app.domain.models.dto.lesson import LessonIndexEntryDTO
+from src.app.domain.models.dto.progress import ProgressSectionDTO, ProgressSummaryDTO
+from src.app.domain.repositories.lesson_repository import LessonRepository
+
+
+class LessonOrderIndex:
+    """
+    Ordered lesson outline grouped by top-level section.
+    """
+
+    def __init__(self, entries: list[LessonIndexEntryDTO]) -> None:
+        """
+        Initialize lesson order index.
+
+        :param entries: lesson index entries in any order
+
+        :return: None
+        """
+        self.entries = sorted(entries, key=lambda entry: lesson_order_key(entry.order))
+        self.sections: dict[str, list[LessonIndexEntryDTO]] = {}
+        self.section_titles: dict[str, str] = {}
+
+        for entry in self.entries:
+            section = entry.order.split(".", 1)[0]
+            self.sections.setdefault(section, []).append(entry)
+
+            if entry.order == section:
+                self.section_titles[section] = entry.name
+
+    def summarize(self, completed_ids: set[UUID]) -> ProgressSummaryDTO:
+        """
+        Build a progress summary for the given completed lessons.
+
+        Completed ids that are no longer in the index are ignored, so stale
+        progress rows never inflate the counters.
+
+        :param completed_ids: completed lesson ids
+
+        :return: progress summary
+        """
+        sections = []
+        completed_total = 0
+
+        for section, entries in self.sections.items():
+            completed = sum(1 for entry in entries if entry.id in completed_ids)
+            completed_total += completed
+            sections.append(
+                ProgressSectionDTO(
+                    section=section,
+                    title=self.section_titles.get(section),
+                    completed=completed,
+                    total=len(entries),
+                ),
+            )
+
+        next_lesson = next(
+            (entry for entry in self.entries if entry.id not in completed_ids),
+            None,
+        )
+
+        return ProgressSummaryDTO(
+            completed=completed_total,
+            total=len(self.entries),
+            sections=sections,
+            next_lesson=next_lesson,
+        )
+
+
+class LessonOrderIndexCache:
+    """
+    Process-wide cache of the lesson order index.
+
+    The index only changes when lessons are written, so it is rebuilt lazily
+    after a lesson change notification instead of on every request. Change
+    notifications only reach this process; the TTL bounds how long another
+    worker may serve an index from before a change.
+    """
+
+    def __init__(self, ttl_sec: float) -> None:
+        """
+        Initialize lesson order index cache.
+
+        :param ttl_sec: index lifetime, a non-positive value disables caching
+
+        :return: None
+        """
+        self.ttl_sec = ttl_sec
+        self._index: LessonOrderIndex | None = None
+        self._expires_at = 0.0
+        self._version = 0
+        self.hits = 0
+        self.misses = 0
+
+    async def get(self, repository: LessonRepository) -> LessonOrderIndex:
+        """
+        Get the cached index, building it from a projection query when stale.
+
+        :param repository: lesson repository
+
+        :return: lesson order index
+        """
+        index = self._index
+
+        if index is not None and self._expires_at > time.monotonic():
+            self.hits += 1
+            return index
+
+        self.misses += 1
+        version = self._version
+        rows = await repository.get_index_entries()
+        index = LessonOrderIndex(entries=rows)
+
+        if version == self._version and self.ttl_sec > 0:
+            self._index = index
+            self._expires_at = time.monotonic() + self.ttl_sec
+
+        return index
+
+    def invalidate(self, lesson_ids: list[UUID] | None = None) -> None:
+        """
+        Drop the cached index.
+
+        Bumping the version keeps a rebuild that started before the change
+        from storing a stale index.
+
+        :param lesson_ids: changed lesson ids, unused because any change can
+          move lessons between sections
+
+        :return: None
+        """
+        _ = lesson_ids
+        self._version += 1
+        self._index = None
@@ -1,57 +1,103 @@
 from uuid import UUID
 
-from src.app.domain.models.db.lesson_progress import LessonProgress
+from src.app.domain.models.dto.progress import ProgressSummaryDTO
 from src.app.domain.repositories.lesson_progress_repository import LessonProgressRepository
+from src.app.domain.services.lesson_order_index import LessonOrderIndex
+from src.app.domain.services.progress_write_queue import ProgressWriteQueue
 
 
 class LessonProgressService:
-    def __init__(self, progress_repository: LessonProgressRepository) -> None:
+    def __init__(
+            self,
+            progress_repository: LessonProgressRepository,
+            write_queue: ProgressWriteQueue | None = None,
+    ) -> None:
         """
         Initialize lesson progress service.
 
         :param progress_repository: progress repository
+        :param write_queue: optional write-behind queue for completions
 
         :return: None
         """
         self.repository = progress_repository
+        self.write_queue = write_queue
 
     async def mark_completed(self, user_id: UUID, lesson_id: UUID) -> None:
         """
         Mark lesson completed for user.
 
         The operation is idempotent to avoid duplicate progress rows when
-        clients retry successful execution submissions.
+        clients retry successful execution submissions. It is a single
+        statement, so concurrent submissions cannot race into the unique
+        constraint.
 
         :param user_id: user id
         :param lesson_id: lesson id
 
         :return: None
         """
-        exists = await self.repository.exists(
+        await self.repository.add_if_missing(
             user_id=user_id,
             lesson_id=lesson_id,
         )
+        await self.repository.session.commit()
+
+    async def record_completion(self, user_id: UUID, lesson_id: UUID) -> None:
+        """
+        Record lesson completion from an accepted submission.
+
+        When the write-behind queue is running the pair is buffered and
+        written in the next batch; otherwise it is written immediately.
+
+        :param user_id: user id
+        :param lesson_id: lesson id
 
-        if exists:
+        :return: None
+        """
+
+        if self.write_queue is not None and self.write_queue.is_running:
+            self.write_queue.enqueue(user_id=user_id, lesson_id=lesson_id)
             return
 
-        progress = LessonProgress(
-            user_id=user_id,
-            lesson_id=lesson_id,
-        )
-        await self.repository.add(model=progress)
-        await self.repository.session.commit()
+        await self.mark_completed(user_id=user_id, lesson_id=lesson_id)
 
     async def get_completed_lesson_ids(self, user_id: UUID) -> list[UUID]:
         """
         Get completed lesson ids for user.
 
+        Completions still waiting in the write-behind queue are appended, so
+        users see their progress before the batch is flushed.
+
         :param user_id: user id
 
         :return: list of lesson ids
         """
+        lesson_ids = await self.repository.get_completed_lesson_ids(user_id=user_id)
+
+        if self.write_queue is None:
+            return lesson_ids
 
-        return await self.repository.get_completed_lesson_ids(user_id=user_id)
+        stored = set(lesson_ids)
+        pending = self.write_queue.pending_for(user_id=user_id) - stored
+
+        return lesson_ids + sorted(pending)
+
+    async def get_summary(self, user_id: UUID, lesson_index: LessonOrderIndex) -> ProgressSummaryDTO:
+        """
+        Get per-section completion counters and the next lesson for user.
+
+        The lesson outline comes from the cached index, so the only query is
+        the user's completed id list.
+
+        :param user_id: user id
+        :param lesson_index: lesson order index
+
+        :return: progress summary
+        """
+        completed_ids = await self.get_completed_lesson_ids(user_id=user_id)
+
+        return lesson_index.summarize(completed_ids=set(completed_ids))
 
     async def reset_progress(self, user_id: UUID) -> int:
         """
@@ -64,6 +110,10 @@ class LessonProgressService:
 
         :return: number of deleted rows
         """
+
+        if self.write_queue is not None:
+            await self.write_queue.forget_user(user_id=user_id)
+
         deleted = await self.repository.reset_for_user(user_id=user_id)
         await self.repository.session.commit()
 
@@ -0,0 +1,440 @@
+import asyncio
+import bisect
+import heapq
+import html
+import math
+import re
+import time
+from array import array
+from uuid import UUID
+
+from src.app.domain.models.dto.lesson import LessonSearchDocumentDTO, LessonSearchHitDTO
+from src.app.domain.repositories.lesson_repository import LessonRepository
+
+BM25_K1 = 1.2
+BM25_B = 0.75
+NAME_WEIGHT = 4
+QUESTION_WEIGHT = 2
+CASE_LABEL_WEIGHT = 2
+BODY_WEIGHT = 1
+MAX_TERM_FREQUENCY = 0xFFFF
+
+MIN_PREFIX_LENGTH = 2
+MAX_PREFIX_EXPANSIONS = 50
+PREFIX_MATCH_FACTOR = 0.8
+
+SNIPPET_LENGTH = 160
+SNIPPET_LEAD = 50
+
+_TOKEN_RE = re.compile(r"\w+")
+_FENCE_LINE_RE = re.compile(r"^\s*(?:`{3,}|~{3,}).*$", re.MULTILINE)
+_LINK_RE = re.compile(r"\[([^\]]*)\]\([^)]*\)")
+_MARKUP_RE = re.compile(r"^\s{0,3}(?:#{1,6}|>|[-*+]|\d+[.)])\s+|[`*]", re.MULTILINE)
+_WHITESPACE_RE = re.compile(r"\s+")
+
+
+def tokenize(text: str) -> list[str]:
+    """
+    Split text into lowercase word terms.
+
+    :param text: text to split
+
+    :return: terms in text order
+    """
+
+    return [token.casefold() for token in _TOKEN_RE.findall(text)]
+
+
+class LessonSearchIndex:
+    """
+    BM25 ranked inverted index over lesson names, theory, quiz prompts and case labels.
+
+    Postings are kept per term as two parallel arrays of document numbers and
+    field-weighted term frequencies, which is several times smaller than
+    lists of tuples. Documents are numbered in insertion order, so appending
+    a document keeps every posting sorted. Removing one leaves a tombstone
+    that is skipped at query time; postings are compacted once tombstones
+    outnumber live documents.
+    """
+
+    def __init__(self) -> None:
+        """
+        Initialize lesson search index.
+
+        :return: None
+        """
+        self._reset()
+
+    def _reset(self) -> None:
+        self._documents: list[LessonSearchDocumentDTO | None] = []
+        self._snippet_texts: list[str] = []
+        self._document_terms: list[tuple[str, ...]] = []
+        self._document_lengths = array("I")
+        self._document_numbers: dict[UUID, int] = {}
+        self._postings: dict[str, tuple[array, array]] = {}
+        self._document_frequencies: dict[str, int] = {}
+        self._vocabulary: list[str] = []
+        self._vocabulary_stale = False
+        self._total_length = 0
+
+    def __len__(self) -> int:
+        """
+        Count indexed lessons.
+
+        :return: number of live documents
+        """
+
+        return len(self._document_numbers)
+
+    def upsert(self, document: LessonSearchDocumentDTO) -> None:
+        """
+        Index a lesson, replacing its previous version.
+
+        :param document: lesson search document
+
+        :return: None
+        """
+        self.remove(lesson_id=document.id)
+
+        frequencies: dict[str, int] = {}
+        fields = [
+            (document.name, NAME_WEIGHT),
+            (document.body_markdown, BODY_WEIGHT),
+            *((prompt, QUESTION_WEIGHT) for prompt in document.question_prompts),
+            *((label, CASE_LABEL_WEIGHT) for label in document.case_labels),
+        ]
+
+        for text, weight in fields:
+            for term in tokenize(text=text):
+                frequencies[term] = frequencies.get(term, 0) + weight
+
+        number = len(self._documents)
+        self._documents.append(document)
+        self._snippet_texts.append(_snippet_text(document=document))
+        self._document_terms.append(tuple(frequencies))
+        length = sum(frequencies.values())
+        self._document_lengths.append(length)
+        self._document_numbers[document.id] = number
+        self._total_length += length
+
+        for term, frequency in frequencies.items():
+            postings = self._postings.get(term)
+
+            if postings is None:
+                postings = (array("I"), array("H"))
+                self._postings[term] = postings
+                self._vocabulary_stale = True
+
+            postings[0].append(number)
+            postings[1].append(min(frequency, MAX_TERM_FREQUENCY))
+            self._document_frequencies[term] = self._document_frequencies.get(term, 0) + 1
+
+    def remove(self, lesson_id: UUID) -> None:
+        """
+        Drop a lesson from the index, if it is indexed.
+
+        :param lesson_id: lesson id
+
+        :return: None
+        """
+        number = self._document_numbers.pop(lesson_id, None)
+
+        if number is None:
+            return
+
+        self._documents[number] = None
+        self._snippet_texts[number] = ""
+        self._total_length -= self._document_lengths[number]
+
+        for term in self._document_terms[number]:
+            self._document_frequencies[term] -= 1
+
+        self._document_terms[number] = ()
+
+        if len(self._documents) - len(self._document_numbers) > max(len(self._document_numbers), 16):
+            self._compact()
+
+    def search(self, query: str, limit: int) -> list[LessonSearchHitDTO]:
+        """
+        Rank lessons against a query.
+
+        Every query term also matches indexed terms it is a prefix of, at a
+        slightly lower weight, so partially typed words find results. Scores
+        of the query terms add up, so lessons matching more of them rank
+        higher.
+
+        :param query: search text
+        :param limit: max hits
+
+        :return: hits ordered by descending score
+        """
+        query_terms = list(dict.fromkeys(tokenize(text=query)))
+
+        if not query_terms or not self._document_numbers:
+            return []
+
+        average_length = self._total_length / len(self._document_numbers) or 1.0
+        scores: dict[int, float] = {}
+        matched_terms: set[str] = set()
+
+        for query_term in query_terms:
+            best_scores: dict[int, float] = {}
+
+            for term, factor in self._expand(query_term=query_term):
+                matched_terms.add(term)
+                idf = self._idf(term=term)
+                numbers, frequencies = self._postings[term]
+
+                for number, frequency in zip(numbers, frequencies, strict=True):
+                    if self._documents[number] is None:
+                        continue
+
+                    length_norm = 1 - BM25_B + BM25_B * self._document_lengths[number] / average_length
+                    score = factor * idf * frequency * (BM25_K1 + 1) / (frequency + BM25_K1 * length_norm)
+
+                    if score > best_scores.get(number, 0.0):
+                        best_scores[number] = score
+
+            for number, score in best_scores.items():
+                scores[number] = scores.get(number, 0.0) + score
+
+        ranked = heapq.nlargest(limit, scores.items(), key=lambda item: item[1])
+
+        return [self._build_hit(number=number, score=score, matched_terms=matched_terms) for number, score in ranked]
+
+    def _expand(self, query_term: str) -> list[tuple[str, float]]:
+        expansions = []
+
+        if self._document_frequencies.get(query_term):
+            expansions.append((query_term, 1.0))
+
+        if len(query_term) < MIN_PREFIX_LENGTH:
+            return expansions
+
+        vocabulary = self._get_vocabulary()
+        position = bisect.bisect_right(vocabulary, query_term)
+
+        while position < len(vocabulary) and len(expansions) < MAX_PREFIX_EXPANSIONS:
+            term = vocabulary[position]
+
+            if not term.startswith(query_term):
+                break
+
+            if self._document_frequencies.get(term):
+                expansions.append((term, PREFIX_MATCH_FACTOR))
+
+            position += 1
+
+        return expansions
+
+    def _get_vocabulary(self) -> list[str]:
+        if self._vocabulary_stale:
+            self._vocabulary = sorted(self._postings)
+            self._vocabulary_stale = False
+
+        return self._vocabulary
+
+    def _idf(self, term: str) -> float:
+        document_frequency = self._document_frequencies[term]
+
+        return math.log(1 + (len(self._document_numbers) - document_frequency + 0.5) / (document_frequency + 0.5))
+
+    def _build_hit(self, number: int, score: float, matched_terms: set[str]) -> LessonSearchHitDTO:
+        document = self._documents[number]
+
+        return LessonSearchHitDTO(
+            id=document.id,
+            order=document.order,
+            slug=document.slug,
+            name=document.name,
+            score=round(score, 4),
+            snippet=highlight_snippet(text=self._snippet_texts[number], terms=matched_terms),
+        )
+
+    def _compact(self) -> None:
+        """
+        Renumber live documents and drop tombstones from the postings.
+
+        :return: None
+        """
+        live_documents = [document for document in self._documents if document is not None]
+        self._reset()
+
+        for document in live_documents:
+            self.upsert(document=document)
+
+
+class LessonSearchIndexCache:
+    """
+    Process-wide lesson search index kept current from lesson change notifications.
+
+    The first search builds the index from every lesson. After that, changed
+    lesson ids are collected and only those lessons are re-read and
+    re-indexed before the next search; a notification without ids rebuilds
+    the whole index. Notifications only reach this process, so the index is
+    also rebuilt once its TTL passes to pick up changes made by other workers.
+    """
+
+    def __init__(self, ttl_sec: float) -> None:
+        """
+        Initialize lesson search index cache.
+
+        :param ttl_sec: index lifetime, a non-positive value rebuilds on every search
+
+        :return: None
+        """
+        self.ttl_sec = ttl_sec
+        self._index = LessonSearchIndex()
+        self._built = False
+        self._expires_at = 0.0
+        self._version = 0
+        self._pending_ids: set[UUID] = set()
+        self._lock = asyncio.Lock()
+
+    async def get(self, repository: LessonRepository) -> LessonSearchIndex:
+        """
+        Get the index after applying pending lesson changes.
+
+        :param repository: lesson repository
+
+        :return: lesson search index
+        """
+
+        if self._is_current() and not self._pending_ids:
+            return self._index
+
+        async with self._lock:
+            if not self._is_current():
+                await self._rebuild(repository=repository)
+
+            if self._pending_ids:
+                await self._apply_pending(repository=repository)
+
+        return self._index
+
+    async def _rebuild(self, repository: LessonRepository) -> None:
+        """
+        Build a fresh index from every lesson.
+
+        Changes queued before the read are covered by it. If the read fails,
+        they stay queued and the index stays unbuilt, so the next search
+        retries.
+
+        :param repository: lesson repository
+
+        :return: None
+        """
+        version = self._version
+        covered_ids = set(self._pending_ids)
+        documents = await repository.get_search_documents()
+        index = LessonSearchIndex()
+
+        for document in documents:
+            index.upsert(document=document)
+
+        self._index = index
+        self._pending_ids -= covered_ids
+        self._built = version == self._version
+        self._expires_at = time.monotonic() + self.ttl_sec
+
+    def _is_current(self) -> bool:
+        """
+        Check whether the built index is still within its lifetime.
+
+        :return: True if no rebuild is needed
+        """
+
+        return self._built and self._expires_at > time.monotonic()
+
+    async def _apply_pending(self, repository: LessonRepository) -> None:
+        """
+        Re-read and re-index the queued lessons.
+
+        The ids are taken off the queue before the read, so a lesson changed
+        again meanwhile is queued anew, and put back if the read fails.
+
+        :param repository: lesson repository
+
+        :return: None
+        """
+        changed_ids = list(self._pending_ids)
+        self._pending_ids.clear()
+
+        try:
+            documents = await repository.get_search_documents(ids=changed_ids)
+        except BaseException:
+            self._pending_ids.update(changed_ids)
+            raise
+
+        for lesson_id in changed_ids:
+            self._index.remove(lesson_id=lesson_id)
+
+        for document in documents:
+            self._index.upsert(document=document)
+
+    def invalidate(self, lesson_ids: list[UUID] | None = None) -> None:
+        """
+        Queue changed lessons for re-indexing.
+
+        :param lesson_ids: changed lesson ids, or None to rebuild the index
+
+        :return: None
+        """
+
+        if lesson_ids is None:
+            self._version += 1
+            self._built = False
+            return
+
+        self._pending_ids.update(lesson_ids)
+
+
+def highlight_snippet(text: str, terms: set[str]) -> str:
+    """
+    Cut a window around the first matched term and mark the matches in it.
+
+    :param text: plain lesson text
+    :param terms: indexed terms matched by the query
+
+    :return: HTML-escaped snippet with matches wrapped in ``<mark>``
+    """
+    matches = [match for match in _TOKEN_RE.finditer(text) if match.group().casefold() in terms]
+    start = max(matches[0].start() - SNIPPET_LEAD, 0) if matches else 0
+
+    if start > 0:
+        space = text.find(" ", start, matches[0].start())
+        start = space + 1 if space != -1 else start
+
+    end = min(start + SNIPPET_LENGTH, len(text))
+
+    if end < len(text):
+        space = text.rfind(" ", start, end)
+        end = space if space > start else end
+
+    parts = ["…" if start > 0 else ""]
+    position = start
+
+    for match in matches:
+        if match.start() < start:
+            continue
+
+        if match.end() > end:
+            break
+
+        parts.append(html.escape(text[position:match.start()]))
+        parts.append(f"<mark>{html.escape(match.group())}</mark>")
+        position = match.end()
+
+    parts.append(html.escape(text[position:end]))
+    parts.append("…" if end < len(text) else "")
+
+    return "".join(parts)
+
+
+def _snippet_text(document: LessonSearchDocumentDTO) -> str:
+    body = _FENCE_LINE_RE.sub(" ", document.body_markdown)
+    body = _LINK_RE.sub(r"\1", body)
+    body = _MARKUP_RE.sub("", body)
+    text = " ".join([body, *document.question_prompts, *document.case_labels])
+
+    return _WHITESPACE_RE.sub(" ", text).strip()
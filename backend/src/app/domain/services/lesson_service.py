@@ -1,35 +1,85 @@
 from uuid import UUID
 
+from sqlalchemy.exc import IntegrityError
+
+from src.app.content.markdown import render_markdown
+from src.app.core.cache import LessonCache
 from src.app.core.exceptions.base_exc import NotFoundError
 from src.app.core.exceptions.lesson_exc import LessonOrderInvalid, LessonSlugConflict
 from src.app.domain.lesson_order import lesson_order_key, normalize_lesson_order
 from src.app.domain.models.db.lesson import Lesson
 from src.app.domain.models.dto.lesson import CreateLessonDTO, LessonDTO, UpdateLessonDTO
 from src.app.domain.repositories.lesson_repository import LessonRepository
+from src.app.domain.services.lesson_change_hub import LessonChangeHub
 
 
 class LessonService:
-    def __init__(self, lesson_repository: LessonRepository) -> None:
+    def __init__(
+            self,
+            lesson_repository: LessonRepository,
+            change_hub: LessonChangeHub | None = None,
+            lesson_cache: LessonCache | None = None,
+            cache_fill_repository: LessonRepository | None = None,
+    ) -> None:
         """
         Initialize lesson service.
 
         :param lesson_repository: lesson repository
+        :param change_hub: optional hub notified after lesson writes
+        :param lesson_cache: optional cache of lessons by id
+        :param cache_fill_repository: repository lesson cache misses are read
+          from, defaults to lesson_repository
 
         :return: None
         """
         self.repository = lesson_repository
+        self.change_hub = change_hub
+        self.lesson_cache = lesson_cache
+        self.cache_fill_repository = cache_fill_repository or lesson_repository
 
     async def get_by_id(self, id: UUID) -> LessonDTO:
         """
         Get lesson by id.
 
+        A cached lesson is returned without touching the repository, so its
+        session never checks out a connection. A lesson loaded while it was
+        being changed is returned but not cached.
+
         :param id: lesson id
 
         :return: lesson dto
         """
-        lesson = await self._require_lesson(id=id)
 
-        return lesson.to_dto()
+        if self.lesson_cache is not None:
+            cached = self.lesson_cache.get(lesson_id=id)
+
+            if cached is not None:
+                return cached
+
+            generation = self.lesson_cache.generation
+            lesson = (await self._require_lesson(id=id, repository=self.cache_fill_repository)).to_dto()
+            self.lesson_cache.set(lesson=lesson, generation=generation)
+
+            return lesson
+
+        return (await self._require_lesson(id=id)).to_dto()
+
+    async def get_theory_html(self, id: UUID) -> str:
+        """
+        Get lesson theory rendered to HTML.
+
+        Lessons written before theory was pre-rendered are rendered on the fly.
+
+        :param id: lesson id
+
+        :return: sanitized theory HTML
+        """
+        lesson = await self.get_by_id(id=id)
+
+        if lesson.body_html is not None:
+            return lesson.body_html
+
+        return render_markdown(source=lesson.body_markdown)
 
     async def get_by_slug(self, slug: str) -> LessonDTO:
         """
@@ -58,6 +108,24 @@ class LessonService:
 
         return [lesson.to_dto() for lesson in ordered_lessons]
 
+    async def get_page(self, limit: int, cursor: UUID | None = None) -> tuple[list[LessonDTO], UUID | None]:
+        """
+        Get one page of lessons in storage order.
+
+        Pages follow lesson ids rather than course order, which keeps every
+        page an index range scan; clients that need course order request the
+        full list instead.
+
+        :param limit: max lessons per page
+        :param cursor: last lesson id of the previous page
+
+        :return: lessons and the cursor of the next page, None on the last page
+        """
+        lessons = await self.repository.get_page(limit=limit, cursor=cursor)
+        next_cursor = lessons[-1].id if len(lessons) == limit else None
+
+        return [lesson.to_dto() for lesson in lessons], next_cursor
+
     async def create(self, schema: CreateLessonDTO) -> LessonDTO:
         """
         Create new lesson.
@@ -80,11 +148,13 @@ class LessonService:
 
         lesson = Lesson(
             **data,
+            body_html=render_markdown(source=schema.body_markdown),
         )
 
         await self.repository.add(model=lesson)
-        await self.repository.session.commit()
+        await self._commit_or_conflict(slug=schema.slug, exclude_id=None)
         await self.repository.session.refresh(instance=lesson)
+        self._publish_change(lesson_ids=[lesson.id])
 
         return lesson.to_dto()
 
@@ -110,6 +180,12 @@ class LessonService:
             )
 
         data = schema.model_dump(exclude_none=True)
+        # Manual edits diverge from the files, so the next sync must rewrite the row.
+        data["content_hash"] = None
+
+        if schema.body_markdown is not None:
+            data["body_html"] = render_markdown(source=schema.body_markdown)
+
         result = await self.repository.update(
             id=id,
             data=data,
@@ -122,8 +198,9 @@ class LessonService:
                 field_value=id,
             )
 
-        await self.repository.session.commit()
+        await self._commit_or_conflict(slug=schema.slug, exclude_id=id)
         await self.repository.session.refresh(instance=result)
+        self._publish_change(lesson_ids=[result.id])
 
         return result.to_dto()
 
@@ -147,9 +224,45 @@ class LessonService:
             )
 
         await self.repository.session.commit()
+        self._publish_change(lesson_ids=[id])
 
         return deleted
 
+    def _publish_change(self, lesson_ids: list[UUID]) -> None:
+        """
+        Notify lesson caches about committed changes.
+
+        :param lesson_ids: changed lesson ids
+
+        :return: None
+        """
+
+        if self.change_hub is not None:
+            self.change_hub.publish(lesson_ids=lesson_ids)
+
+    async def _commit_or_conflict(self, slug: str | None, exclude_id: UUID | None) -> None:
+        """
+        Commit a lesson write, reporting unique index violations as conflicts.
+
+        Slug and order checks run before the write, so two concurrent writers
+        can both pass them; the unique indexes then reject the later commit,
+        which is reported like a failed check instead of a server error.
+
+        :param slug: written slug, None if unchanged
+        :param exclude_id: written lesson id, None for a new lesson
+
+        :return: None
+        """
+        try:
+            await self.repository.session.commit()
+        except IntegrityError as e:
+            await self.repository.session.rollback()
+
+            if slug is not None:
+                await self._validate_slug_unique(slug=slug, exclude_id=exclude_id)
+
+            raise LessonOrderInvalid from e
+
     async def _validate_slug_unique(self, slug: str, exclude_id: UUID | None) -> None:
         """
         Validate lesson slug uniqueness.
@@ -180,18 +293,10 @@ class LessonService:
         """
         normalized_order = normalize_lesson_order(value=order)
 
-        lessons = await self.repository.get_all()
-        orders = []
-
-        for lesson in lessons:
-            if exclude_id is not None and lesson.id == exclude_id:
-                continue
-            orders.append(lesson.order)
-
-        if normalized_order in orders:
+        if await self.repository.order_exists(order=normalized_order, exclude_id=exclude_id):
             raise LessonOrderInvalid
 
-    async def _require_lesson(self, id: UUID) -> Lesson:
+    async def _require_lesson(self, id: UUID, repository: LessonRepository | None = None) -> Lesson:
         """
         Resolve lesson by id or raise not found error.
 
@@ -199,10 +304,11 @@ class LessonService:
         duplicated not-found handling logic.
 
         :param id: lesson id
+        :param repository: repository to read from, defaults to the service one
 
         :return: lesson model
         """
-        lesson = await self.repository.get(id=id)
+        lesson = await (repository or self.repository).get(id=id)
 
         if lesson is None:
             raise NotFoundError(
@@ -1,41 +1,71 @@
 from uuid import UUID
 
-from src.app.content.models import LoadedLesson
-from src.app.domain.models.db.lesson import Lesson
-from src.app.domain.models.dto.lesson import CreateLessonDTO, LessonSyncDiffDTO, LessonSyncUpdateItemDTO
+from src.app.content.models import LessonSource, LoadedLesson
+from src.app.domain.models.dto.lesson import (
+    CreateLessonDTO,
+    LessonSyncDiffDTO,
+    LessonSyncStateDTO,
+    LessonSyncUpdateItemDTO,
+)
 
 
 class LessonSyncDiffBuilder:
+    @staticmethod
+    def select_changed(
+            sources: list[LessonSource],
+            existing_states: list[LessonSyncStateDTO],
+    ) -> list[LessonSource]:
+        """
+        Pick sources whose content hash differs from the stored one.
+
+        Only these sources need to be parsed.
+
+        :param sources: scanned lesson sources
+        :param existing_states: stored lesson sync states
+
+        :return: new or changed sources
+        """
+        stored_hashes = {state.slug: state.content_hash for state in existing_states}
+
+        return [source for source in sources if stored_hashes.get(source.slug) != source.content_hash]
+
     def build(
             self,
+            sources: list[LessonSource],
             loaded_lessons: list[LoadedLesson],
-            existing_lessons: list[Lesson],
+            existing_states: list[LessonSyncStateDTO],
             *,
             delete_missing: bool,
     ) -> LessonSyncDiffDTO:
-        existing_by_slug = {lesson.slug: lesson for lesson in existing_lessons}
+        existing_by_slug = {state.slug: state for state in existing_states}
+        loaded_by_slug = {lesson.slug: lesson for lesson in loaded_lessons}
         create_payloads: list[CreateLessonDTO] = []
         update_payloads: list[LessonSyncUpdateItemDTO] = []
+        content_hashes: dict[str, str] = {}
         unchanged = 0
         seen_slugs = set()
 
-        for loaded in loaded_lessons:
-            seen_slugs.add(loaded.slug)
-            payload = CreateLessonDTO.model_validate(obj=loaded.model_dump(exclude={"source_dir"}))
-            existing = existing_by_slug.get(loaded.slug)
-            if existing is None:
-                create_payloads.append(payload)
+        for source in sources:
+            seen_slugs.add(source.slug)
+            existing = existing_by_slug.get(source.slug)
+            if existing is not None and existing.content_hash == source.content_hash:
+                unchanged += 1
                 continue
 
-            if self._is_same_payload(existing=existing, payload=payload):
-                unchanged += 1
+            loaded = loaded_by_slug[source.slug]
+            payload = CreateLessonDTO.model_validate(
+                obj=loaded.model_dump(exclude={"source_dir", "content_hash"}),
+            )
+            content_hashes[source.slug] = source.content_hash
+            if existing is None:
+                create_payloads.append(payload)
                 continue
 
             update_payloads.append(LessonSyncUpdateItemDTO(lesson_id=existing.id, payload=payload))
 
         delete_ids: list[UUID] = []
         if delete_missing:
-            for existing in existing_lessons:
+            for existing in existing_states:
                 if existing.slug in seen_slugs:
                     continue
                 delete_ids.append(existing.id)
@@ -44,17 +74,7 @@ class LessonSyncDiffBuilder:
             create_payloads=create_payloads,
             update_payloads=update_payloads,
             delete_ids=delete_ids,
+            content_hashes=content_hashes,
             unchanged=unchanged,
-            total=len(loaded_lessons),
-        )
-
-    @staticmethod
-    def _is_same_payload(existing: Lesson, payload: CreateLessonDTO) -> bool:
-        return (
-                existing.order == payload.order
-                and existing.name == payload.name
-                and existing.body_markdown == payload.body_markdown
-                and existing.code_editor_default == payload.code_editor_default
-                and existing.cases == [case.model_dump() for case in payload.cases]
-                and existing.questions == [question.model_dump() for question in payload.questions]
+            total=len(sources),
         )
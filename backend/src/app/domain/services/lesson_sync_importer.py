@@ -1,46 +1,78 @@
-from src.app.domain.models.db.lesson import Lesson
-from src.app.domain.models.dto.lesson import LessonSyncDiffDTO, LessonSyncResultDTO
+import asyncio
+import time
+from collections.abc import AsyncIterator
+from uuid import UUID, uuid4
+
+from src.app.content.markdown import render_markdown
+from src.app.domain.models.dto.lesson import (
+    LessonSyncDiffDTO,
+    LessonSyncEventDTO,
+    LessonSyncResultDTO,
+    LessonSyncUpdateItemDTO,
+)
+from src.app.domain.models.enums.lesson_sync import LessonSyncAction, LessonSyncEvent
+from src.app.domain.repositories.base_repository import BULK_CHUNK_SIZE
 from src.app.domain.repositories.lesson_repository import LessonRepository
+from src.app.domain.services.lesson_change_hub import LessonChangeHub
 
 
 class LessonSyncImporter:
-    def __init__(self, lesson_repository: LessonRepository) -> None:
+    def __init__(
+            self,
+            lesson_repository: LessonRepository,
+            change_hub: LessonChangeHub | None = None,
+    ) -> None:
         """
         Initialize lesson sync importer.
 
         :param lesson_repository: lesson repository
+        :param change_hub: optional hub notified after sync writes
 
         :return: None
         """
         self.repository = lesson_repository
+        self.change_hub = change_hub
 
     async def apply(self, diff: LessonSyncDiffDTO) -> LessonSyncResultDTO:
         """
         Apply sync diff to database.
 
         This service executes persistence side effects while keeping orchestration
-        and diff computation outside of repository writes.
+        and diff computation outside of repository writes. Each phase is one
+        set-based statement per chunk rather than a round trip per lesson, and
+        all phases share one transaction.
 
         :param diff: sync diff
 
-        :return: sync result
+        :return: sync result with per-phase timings
         """
-        for payload in diff.create_payloads:
-            lesson = Lesson(**payload.model_dump())
-            await self.repository.add(model=lesson)
+        timings_ms: dict[str, float] = {}
 
-        for update_item in diff.update_payloads:
-            await self.repository.update(
-                id=update_item.lesson_id,
-                data=update_item.payload.model_dump(),
-            )
+        started = time.perf_counter()
+        deleted = await self.repository.delete_many(ids=diff.delete_ids)
+        timings_ms["delete"] = elapsed_ms(started=started)
 
-        deleted = 0
-        for lesson_id in diff.delete_ids:
-            if await self.repository.delete(id=lesson_id):
-                deleted += 1
+        started = time.perf_counter()
+        await self._park_moved_orders(update_payloads=diff.update_payloads)
+        await self.repository.update_many(rows=await asyncio.to_thread(self._build_update_rows, diff=diff))
+        timings_ms["update"] = elapsed_ms(started=started)
+
+        started = time.perf_counter()
+        created_rows = await asyncio.to_thread(self._build_create_rows, diff=diff)
+        await self.repository.add_many(rows=created_rows)
+        timings_ms["insert"] = elapsed_ms(started=started)
 
+        started = time.perf_counter()
         await self.repository.session.commit()
+        timings_ms["commit"] = elapsed_ms(started=started)
+
+        self._publish(
+            lesson_ids=[
+                *(row["id"] for row in created_rows),
+                *(item.lesson_id for item in diff.update_payloads),
+                *diff.delete_ids,
+            ],
+        )
 
         return LessonSyncResultDTO(
             created=len(diff.create_payloads),
@@ -49,8 +81,194 @@ class LessonSyncImporter:
             unchanged=diff.unchanged,
             total=diff.total,
             dry_run=False,
+            timings_ms=timings_ms,
+        )
+
+    async def apply_in_chunks(
+            self,
+            diff: LessonSyncDiffDTO,
+            chunk_size: int = BULK_CHUNK_SIZE,
+    ) -> AsyncIterator[LessonSyncEventDTO]:
+        """
+        Apply sync diff committing every chunk, yielding an event per written lesson.
+
+        Used for streamed imports, where one long transaction would hold locks
+        for the whole run. A run that stops midway leaves unwritten rows with
+        their old content hash, so the next sync picks them up again. Order
+        changes are written together in one transaction before the update
+        chunks, so readers never see a parked order or a duplicate one. The
+        last event carries the sync result.
+
+        :param diff: sync diff
+        :param chunk_size: max lessons written per transaction
+
+        :return: async iterator of written and completed events
+        """
+        timings_ms = {"delete": 0.0, "update": 0.0, "insert": 0.0}
+        deleted = 0
+
+        for chunk in _chunks(items=diff.delete_ids, size=chunk_size):
+            started = time.perf_counter()
+            deleted += await self.repository.delete_many(ids=chunk)
+            await self._commit_chunk(lesson_ids=chunk)
+            timings_ms["delete"] += elapsed_ms(started=started)
+
+            for lesson_id in chunk:
+                yield LessonSyncEventDTO(
+                    event=LessonSyncEvent.WRITTEN,
+                    action=LessonSyncAction.DELETE,
+                    lesson_id=lesson_id,
+                )
+
+        started = time.perf_counter()
+        await self._move_orders(update_payloads=diff.update_payloads)
+        timings_ms["update"] += elapsed_ms(started=started)
+
+        update_rows = await asyncio.to_thread(self._build_update_rows, diff=diff)
+
+        for chunk in _chunks(items=update_rows, size=chunk_size):
+            started = time.perf_counter()
+            await self.repository.update_many(rows=chunk)
+            await self._commit_chunk(lesson_ids=[row["id"] for row in chunk])
+            timings_ms["update"] += elapsed_ms(started=started)
+
+            for row in chunk:
+                yield LessonSyncEventDTO(
+                    event=LessonSyncEvent.WRITTEN,
+                    action=LessonSyncAction.UPDATE,
+                    slug=row["slug"],
+                    lesson_id=row["id"],
+                )
+
+        create_rows = await asyncio.to_thread(self._build_create_rows, diff=diff)
+
+        for chunk in _chunks(items=create_rows, size=chunk_size):
+            started = time.perf_counter()
+            await self.repository.add_many(rows=chunk)
+            await self._commit_chunk(lesson_ids=[row["id"] for row in chunk])
+            timings_ms["insert"] += elapsed_ms(started=started)
+
+            for row in chunk:
+                yield LessonSyncEventDTO(
+                    event=LessonSyncEvent.WRITTEN,
+                    action=LessonSyncAction.CREATE,
+                    slug=row["slug"],
+                    lesson_id=row["id"],
+                )
+
+        yield LessonSyncEventDTO(
+            event=LessonSyncEvent.COMPLETED,
+            result=LessonSyncResultDTO(
+                created=len(diff.create_payloads),
+                updated=len(diff.update_payloads),
+                deleted=deleted,
+                unchanged=diff.unchanged,
+                total=diff.total,
+                dry_run=False,
+                timings_ms={phase: round(value, 2) for phase, value in timings_ms.items()},
+            ),
         )
 
+    async def _commit_chunk(self, lesson_ids: list[UUID]) -> None:
+        """
+        Commit one chunk and notify the change hub about it.
+
+        :param lesson_ids: ids written in the chunk
+
+        :return: None
+        """
+        await self.repository.session.commit()
+        self._publish(lesson_ids=lesson_ids)
+
+    def _publish(self, lesson_ids: list[UUID]) -> None:
+        """
+        Notify the change hub about written lessons, if any.
+
+        :param lesson_ids: written lesson ids
+
+        :return: None
+        """
+
+        if self.change_hub is not None and lesson_ids:
+            self.change_hub.publish(lesson_ids=lesson_ids)
+
+    @staticmethod
+    def _build_update_rows(diff: LessonSyncDiffDTO) -> list[dict]:
+        # The diff only carries lessons whose content hash changed, so theory
+        # is rendered once per edit rather than on every sync. Callers build
+        # rows in a worker thread to keep rendering off the event loop.
+        return [
+            {
+                **item.payload.model_dump(),
+                "id": item.lesson_id,
+                "body_html": render_markdown(source=item.payload.body_markdown),
+                "content_hash": diff.content_hashes.get(item.payload.slug),
+            }
+            for item in diff.update_payloads
+        ]
+
+    @staticmethod
+    def _build_create_rows(diff: LessonSyncDiffDTO) -> list[dict]:
+        return [
+            {
+                **payload.model_dump(),
+                "id": uuid4(),
+                "body_html": render_markdown(source=payload.body_markdown),
+                "content_hash": diff.content_hashes.get(payload.slug),
+            }
+            for payload in diff.create_payloads
+        ]
+
+    async def _move_orders(self, update_payloads: list[LessonSyncUpdateItemDTO]) -> None:
+        """
+        Write every order change in one committed transaction.
+
+        Parked orders are never committed on their own, since readers cannot
+        sort them. Moved lessons keep their old content hash until their
+        update chunk is written, so an aborted run still re-syncs them.
+
+        :param update_payloads: sync update items
+
+        :return: None
+        """
+        moved_ids = set(await self._park_moved_orders(update_payloads=update_payloads))
+
+        if not moved_ids:
+            return
+
+        await self.repository.update_many(
+            rows=[
+                {"id": item.lesson_id, "order": item.payload.order}
+                for item in update_payloads
+                if item.lesson_id in moved_ids
+            ],
+        )
+        await self._commit_chunk(lesson_ids=list(moved_ids))
+
+    async def _park_moved_orders(self, update_payloads: list[LessonSyncUpdateItemDTO]) -> list[UUID]:
+        """
+        Move lessons whose order changes out of the way before updating.
+
+        Orders are unique, so swapping two lessons or reusing an order freed
+        by another update would otherwise conflict mid-flush.
+
+        :param update_payloads: sync update items
+
+        :return: ids of the parked lessons
+        """
+        stored_orders = await self.repository.get_orders(
+            ids=[item.lesson_id for item in update_payloads],
+        )
+        moved_ids = [
+            item.lesson_id
+            for item in update_payloads
+            if stored_orders.get(item.lesson_id, item.payload.order) != item.payload.order
+        ]
+
+        await self.repository.park_orders(ids=moved_ids)
+
+        return moved_ids
+
     @staticmethod
     def preview(diff: LessonSyncDiffDTO) -> LessonSyncResultDTO:
         """
@@ -69,3 +287,28 @@ class LessonSyncImporter:
             total=diff.total,
             dry_run=True,
         )
+
+
+def elapsed_ms(started: float) -> float:
+    """
+    Get milliseconds elapsed since a perf_counter reading.
+
+    :param started: perf_counter value at phase start
+
+    :return: elapsed milliseconds rounded to 0.01
+    """
+
+    return round((time.perf_counter() - started) * 1000, 2)
+
+
+def _chunks[T](items: list[T], size: int) -> list[list[T]]:
+    """
+    Split items into consecutive chunks.
+
+    :param items: items to split
+    :param size: max chunk length
+
+    :return: chunks
+    """
+
+    return [items[start:start + size] for start in range(0, len(items), size)]
@@ -1,8 +1,19 @@
-from src.app.content import LessonsLoader
-from src.app.domain.models.dto.lesson import LessonSyncResultDTO
+import asyncio
+import time
+from collections.abc import AsyncIterator
+
+from src.app.content import LessonSource, LessonsLoader, LoadedLesson
+from src.app.domain.models.dto.lesson import (
+    LessonSyncDiffDTO,
+    LessonSyncEventDTO,
+    LessonSyncResultDTO,
+    LessonSyncStateDTO,
+)
+from src.app.domain.models.enums.lesson_sync import LessonSyncAction, LessonSyncEvent
+from src.app.domain.repositories.base_repository import BULK_CHUNK_SIZE
 from src.app.domain.repositories.lesson_repository import LessonRepository
 from src.app.domain.services.lesson_sync_diff_builder import LessonSyncDiffBuilder
-from src.app.domain.services.lesson_sync_importer import LessonSyncImporter
+from src.app.domain.services.lesson_sync_importer import LessonSyncImporter, elapsed_ms
 
 
 class LessonSyncService:
@@ -39,21 +50,151 @@ class LessonSyncService:
 
         When delete_missing is enabled, the database is treated as a projection
         of the repository content and obsolete rows are removed automatically.
+        Lessons whose content hash matches the stored one are not parsed.
 
         :param delete_missing: delete lessons not present in files
         :param dry_run: preview sync result without writes
 
-        :return: sync counters
+        :return: sync counters and per-phase timings in milliseconds
         """
-        loaded_lessons = self.loader.load()
-        existing_lessons = await self.repository.get_all()
+        timings_ms: dict[str, float] = {}
+        sources = await self._scan(timings_ms=timings_ms)
+        existing_states, changed_sources = await self._compare(sources=sources, timings_ms=timings_ms)
+        loaded_lessons = await self._parse(sources=changed_sources, timings_ms=timings_ms)
         diff = self.diff_builder.build(
+            sources=sources,
             loaded_lessons=loaded_lessons,
-            existing_lessons=existing_lessons,
+            existing_states=existing_states,
             delete_missing=delete_missing,
         )
 
         if dry_run:
-            return self.importer.preview(diff=diff)
+            result = self.importer.preview(diff=diff)
+        else:
+            result = await self.importer.apply(diff=diff)
+
+        return result.model_copy(update={"timings_ms": {**timings_ms, **result.timings_ms}})
+
+    async def stream(
+            self,
+            *,
+            delete_missing: bool = True,
+            dry_run: bool = False,
+            chunk_size: int = BULK_CHUNK_SIZE,
+    ) -> AsyncIterator[LessonSyncEventDTO]:
+        """
+        Sync lessons from files to database, yielding progress as it goes.
+
+        Emits one event after the scan, one per parsed lesson, one per planned
+        change and one per written lesson. Lessons are parsed off the event
+        loop chunk_size at a time, with their events sent after each batch,
+        and writes are committed every chunk_size lessons. The last event
+        carries the sync result.
+
+        :param delete_missing: delete lessons not present in files
+        :param dry_run: preview sync result without writes
+        :param chunk_size: max lessons parsed per batch and written per transaction
+
+        :return: async iterator of sync events
+        """
+        timings_ms: dict[str, float] = {}
+        sources = await self._scan(timings_ms=timings_ms)
+        yield LessonSyncEventDTO(event=LessonSyncEvent.SCANNED, count=len(sources))
+
+        existing_states, changed_sources = await self._compare(sources=sources, timings_ms=timings_ms)
+        loaded_lessons: list[LoadedLesson] = []
+        started = time.perf_counter()
+
+        for start in range(0, len(changed_sources), chunk_size):
+            batch = await asyncio.to_thread(self.loader.load_sources, sources=changed_sources[start:start + chunk_size])
+            loaded_lessons.extend(batch)
+
+            for lesson in batch:
+                yield LessonSyncEventDTO(
+                    event=LessonSyncEvent.LOADED,
+                    slug=lesson.slug,
+                    elapsed_ms=round(self.loader.last_load_timings.get(lesson.slug, 0.0), 2),
+                )
+
+        timings_ms["parse"] = elapsed_ms(started=started)
+
+        diff = self.diff_builder.build(
+            sources=sources,
+            loaded_lessons=loaded_lessons,
+            existing_states=existing_states,
+            delete_missing=delete_missing,
+        )
+        for event in self._diff_events(diff=diff):
+            yield event
+
+        if dry_run:
+            result = self.importer.preview(diff=diff)
+        else:
+            result = None
+            async for event in self.importer.apply_in_chunks(diff=diff, chunk_size=chunk_size):
+                if event.result is not None:
+                    result = event.result
+                    continue
+                yield event
+
+        if result is not None:
+            yield LessonSyncEventDTO(
+                event=LessonSyncEvent.COMPLETED,
+                result=result.model_copy(update={"timings_ms": {**timings_ms, **result.timings_ms}}),
+            )
+
+    async def _scan(self, timings_ms: dict[str, float]) -> list[LessonSource]:
+        started = time.perf_counter()
+        sources = await asyncio.to_thread(self.loader.scan)
+        timings_ms["scan"] = elapsed_ms(started=started)
+
+        return sources
+
+    async def _compare(
+            self,
+            sources: list[LessonSource],
+            timings_ms: dict[str, float],
+    ) -> tuple[list[LessonSyncStateDTO], list[LessonSource]]:
+        started = time.perf_counter()
+        existing_states = await self.repository.get_sync_states()
+        changed_sources = self.diff_builder.select_changed(sources=sources, existing_states=existing_states)
+        timings_ms["compare"] = elapsed_ms(started=started)
+
+        return existing_states, changed_sources
+
+    async def _parse(self, sources: list[LessonSource], timings_ms: dict[str, float]) -> list[LoadedLesson]:
+        started = time.perf_counter()
+        loaded_lessons = await asyncio.to_thread(self.loader.load_sources, sources=sources)
+        timings_ms["parse"] = elapsed_ms(started=started)
+
+        return loaded_lessons
 
-        return await self.importer.apply(diff=diff)
+    @staticmethod
+    def _diff_events(diff: LessonSyncDiffDTO) -> list[LessonSyncEventDTO]:
+        return [
+            *(
+                LessonSyncEventDTO(
+                    event=LessonSyncEvent.DIFFED,
+                    action=LessonSyncAction.CREATE,
+                    slug=payload.slug,
+                )
+                for payload in diff.create_payloads
+            ),
+            *(
+                LessonSyncEventDTO(
+                    event=LessonSyncEvent.DIFFED,
+                    action=LessonSyncAction.UPDATE,
+                    slug=item.payload.slug,
+                    lesson_id=item.lesson_id,
+                )
+                for item in diff.update_payloads
+            ),
+            *(
+                LessonSyncEventDTO(
+                    event=LessonSyncEvent.DIFFED,
+                    action=LessonSyncAction.DELETE,
+                    lesson_id=lesson_id,
+                )
+                for lesson_id in diff.delete_ids
+            ),
+        ]
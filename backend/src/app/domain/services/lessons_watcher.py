@@ -0,0 +1,309 @@
+import asyncio
+import contextlib
+import fcntl
+import logging
+import os
+import time
+from collections.abc import AsyncIterator
+from pathlib import Path
+
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from src.app.content import LessonsLoader
+from src.app.domain.models.dto.lesson import LessonSyncResultDTO
+from src.app.domain.repositories.lesson_repository import LessonRepository
+from src.app.domain.services.lesson_change_hub import LessonChangeHub
+from src.app.domain.services.lesson_sync_diff_builder import LessonSyncDiffBuilder
+from src.app.domain.services.lesson_sync_importer import LessonSyncImporter
+from src.app.domain.services.lesson_sync_service import LessonSyncService
+
+try:
+    from watchfiles import awatch
+except ImportError:  # pragma: no cover - depends on the optional "watch" extra
+    awatch = None
+
+logger = logging.getLogger(__name__)
+
+type FilesSnapshot = dict[str, tuple[int, int]]
+
+
+class LessonsWatcher:
+    """
+    Syncs lessons shortly after files under the lessons directory change.
+
+    Changes come from inotify through watchfiles when it is installed, or
+    from polling file stats otherwise. Bursts of edits are debounced into
+    one sync. The loader keeps its manifest between runs, so each sync
+    hashes and parses only the directories that were touched, and the
+    importer notifies the change hub so lesson caches are invalidated.
+
+    Every uvicorn worker runs the lifespan, so with a lock path only the
+    worker holding an exclusive lock on that file watches. After a reload
+    that wrote lessons it stamps a new version into the lock file; the
+    other workers poll that file, invalidate their own lesson caches when
+    the version changes and take over the watch if the lock is released.
+    Workers must share the lock file, so this covers one host; lesson
+    writes made through the API still rely on the cache TTLs.
+    """
+
+    def __init__(
+            self,
+            loader: LessonsLoader,
+            session_factory: async_sessionmaker[AsyncSession],
+            change_hub: LessonChangeHub,
+            debounce_ms: int,
+            poll_interval_ms: int,
+            *,
+            force_polling: bool = False,
+            lock_path: Path | None = None,
+    ) -> None:
+        """
+        Initialize lessons watcher.
+
+        :param loader: long-lived lessons loader
+        :param session_factory: database session factory
+        :param change_hub: hub notified about synced lessons
+        :param debounce_ms: quiet period that ends a burst of changes
+        :param poll_interval_ms: stat polling interval when inotify is unavailable,
+          and lock file polling interval of workers that do not watch
+        :param force_polling: poll even if watchfiles is installed
+        :param lock_path: file locked by the one process allowed to watch
+
+        :return: None
+        """
+        self.loader = loader
+        self.session_factory = session_factory
+        self.change_hub = change_hub
+        self.debounce_ms = debounce_ms
+        self.poll_interval_ms = poll_interval_ms
+        self.use_polling = force_polling or awatch is None
+        self.lock_path = lock_path
+        self._lock_fd: int | None = None
+        self._task: asyncio.Task[None] | None = None
+
+    @property
+    def is_running(self) -> bool:
+        """
+        Check whether the watch loop is running.
+
+        :return: True if file changes are being watched
+        """
+
+        return self._task is not None and not self._task.done()
+
+    @property
+    def is_watching(self) -> bool:
+        """
+        Check whether this process is the one syncing file changes.
+
+        :return: True if running and holding the watch lock, if any
+        """
+
+        return self.is_running and (self.lock_path is None or self._lock_fd is not None)
+
+    def start(self) -> None:
+        """
+        Start watching the lessons directory, or following the process that holds the watch lock.
+
+        :return: None
+        """
+
+        if self.is_running:
+            return
+
+        self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        """
+        Stop watching.
+
+        :return: None
+        """
+
+        if self._task is None:
+            return
+
+        self._task.cancel()
+
+        with contextlib.suppress(asyncio.CancelledError):
+            await self._task
+
+        self._task = None
+        self._release_lock()
+
+    def _acquire_lock(self) -> bool:
+        fd = os.open(self.lock_path, os.O_RDWR | os.O_CREAT, 0o600)
+
+        try:
+            fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+        except BlockingIOError:
+            os.close(fd)
+            return False
+
+        self._lock_fd = fd
+
+        return True
+
+    def _read_version(self) -> bytes:
+        with contextlib.suppress(FileNotFoundError):
+            return self.lock_path.read_bytes()
+
+        return b""
+
+    def _write_version(self) -> None:
+        if self._lock_fd is None:
+            return
+
+        os.pwrite(self._lock_fd, f"{time.time_ns():020d}".encode(), 0)
+
+    def _release_lock(self) -> None:
+        if self._lock_fd is None:
+            return
+
+        fcntl.flock(self._lock_fd, fcntl.LOCK_UN)
+        os.close(self._lock_fd)
+        self._lock_fd = None
+
+    async def sync(self) -> LessonSyncResultDTO:
+        """
+        Sync lessons in a fresh session.
+
+        :return: sync result
+        """
+        async with self.session_factory() as session:
+            repository = LessonRepository(session=session)
+            service = LessonSyncService(
+                loader=self.loader,
+                lesson_repository=repository,
+                diff_builder=LessonSyncDiffBuilder(),
+                importer=LessonSyncImporter(lesson_repository=repository, change_hub=self.change_hub),
+            )
+
+            return await service.sync(delete_missing=True)
+
+    async def _run(self) -> None:
+        """
+        Watch once the watch lock is held, following the lock holder until then.
+
+        :return: None
+        """
+
+        if self.lock_path is not None and not self._acquire_lock():
+            logger.info("Lessons watch lock %s is held by another process, following its reloads", self.lock_path)
+            await self._follow()
+            logger.info("Lessons watch lock %s acquired, watching", self.lock_path)
+
+        await self._watch()
+
+    async def _follow(self) -> None:
+        """
+        Invalidate lesson caches whenever the lock holder stamps a new version.
+
+        Returns once the lock is acquired, for example after the holder
+        stopped. A reload may have been missed in between, so caches are
+        invalidated once more on takeover.
+
+        :return: None
+        """
+        seen = await asyncio.to_thread(self._read_version)
+
+        while True:
+            await asyncio.sleep(self.poll_interval_ms / 1000)
+
+            if self._acquire_lock():
+                self.change_hub.publish(lesson_ids=None)
+                return
+
+            version = await asyncio.to_thread(self._read_version)
+
+            if version != seen:
+                seen = version
+                self.change_hub.publish(lesson_ids=None)
+
+    async def _watch(self) -> None:
+        """
+        Sync after every settled batch of changes.
+
+        A failed sync, for example on a half-saved yaml file, is logged and
+        retried on the next change.
+
+        :return: None
+        """
+        changes = self._poll_changes() if self.use_polling else self._watch_changes()
+
+        async for _ in changes:
+            try:
+                result = await self.sync()
+            except Exception:
+                logger.exception("Lessons hot reload failed")
+                continue
+
+            if result.created or result.updated or result.deleted:
+                self._write_version()
+                logger.info(
+                    "Lessons reloaded: %s created, %s updated, %s deleted",
+                    result.created,
+                    result.updated,
+                    result.deleted,
+                )
+
+    async def _watch_changes(self) -> AsyncIterator[None]:
+        """
+        Yield once per debounced batch of inotify events.
+
+        :return: async iterator of change notifications
+        """
+        async for _ in awatch(self.loader.root_dir, debounce=self.debounce_ms):
+            yield
+
+    async def _poll_changes(self) -> AsyncIterator[None]:
+        """
+        Yield once per batch of stat changes that stayed quiet for the debounce period.
+
+        :return: async iterator of change notifications
+        """
+        previous = await asyncio.to_thread(self._snapshot)
+
+        while True:
+            await asyncio.sleep(self.poll_interval_ms / 1000)
+            current = await asyncio.to_thread(self._snapshot)
+
+            if current == previous:
+                continue
+
+            while True:
+                await asyncio.sleep(self.debounce_ms / 1000)
+                settled = await asyncio.to_thread(self._snapshot)
+
+                if settled == current:
+                    break
+
+                current = settled
+
+            previous = current
+            yield
+
+    def _snapshot(self) -> FilesSnapshot:
+        """
+        Collect (mtime_ns, size) of every file under the lessons directory.
+
+        :return: file stats by path
+        """
+        snapshot: FilesSnapshot = {}
+        pending = [self.loader.root_dir]
+
+        while pending:
+            directory = pending.pop()
+
+            # Files can vanish between listing and stat while an editor saves.
+            with contextlib.suppress(FileNotFoundError), os.scandir(directory) as entries:
+                for entry in entries:
+                    if entry.is_dir(follow_symlinks=False):
+                        pending.append(Path(entry.path))
+                        continue
+
+                    with contextlib.suppress(FileNotFoundError):
+                        stat = entry.stat()
+                        snapshot[entry.path] = (stat.st_mtime_ns, stat.st_size)
+
+        return snapshot
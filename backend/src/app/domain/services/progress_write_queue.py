@@ -0,0 +1,244 @@
+import asyncio
+import contextlib
+import logging
+from uuid import UUID
+
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from src.app.domain.repositories.lesson_progress_repository import LessonProgressRepository
+
+logger = logging.getLogger(__name__)
+
+
+class ProgressWriteQueue:
+    """
+    Buffers lesson completions in memory and writes them in batches.
+
+    Accepted submissions only touch a dict, so database latency stays off the
+    execution response. Pending pairs are exposed as a read overlay, which
+    keeps progress reads in the same process consistent before a flush lands.
+    """
+
+    def __init__(
+            self,
+            session_factory: async_sessionmaker[AsyncSession],
+            flush_interval_ms: int,
+            max_batch: int,
+    ) -> None:
+        """
+        Initialize progress write queue.
+
+        :param session_factory: database session factory
+        :param flush_interval_ms: max delay before pending pairs are written
+        :param max_batch: pending pair count that triggers an early flush
+
+        :return: None
+        """
+        self.session_factory = session_factory
+        self.flush_interval_ms = flush_interval_ms
+        self.max_batch = max_batch
+        self._pending: dict[UUID, set[UUID]] = {}
+        self._in_flight: dict[UUID, set[UUID]] = {}
+        self._pending_count = 0
+        self._flush_lock = asyncio.Lock()
+        self._wakeup = asyncio.Event()
+        self._stopping = False
+        self._task: asyncio.Task[None] | None = None
+
+    @property
+    def is_running(self) -> bool:
+        """
+        Check whether the flush loop is running.
+
+        :return: True if enqueued pairs will be flushed
+        """
+
+        return self._task is not None and not self._task.done()
+
+    def start(self) -> None:
+        """
+        Start the background flush loop.
+
+        :return: None
+        """
+
+        if self.is_running:
+            return
+
+        self._flush_lock = asyncio.Lock()
+        self._wakeup = asyncio.Event()
+        self._stopping = False
+        self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        """
+        Stop the flush loop and write everything still pending.
+
+        The loop is asked to exit rather than cancelled, so a batch that is
+        being written when shutdown starts is allowed to finish.
+
+        :return: None
+        """
+
+        if self._task is not None:
+            self._stopping = True
+            self._wakeup.set()
+
+            with contextlib.suppress(asyncio.CancelledError):
+                await self._task
+
+            self._task = None
+
+        await self.flush()
+
+    def enqueue(self, user_id: UUID, lesson_id: UUID) -> None:
+        """
+        Buffer one completed lesson.
+
+        Repeated pairs collapse into one pending row.
+
+        :param user_id: user id
+        :param lesson_id: lesson id
+
+        :return: None
+        """
+        lesson_ids = self._pending.setdefault(user_id, set())
+
+        if lesson_id in lesson_ids:
+            return
+
+        lesson_ids.add(lesson_id)
+        self._pending_count += 1
+
+        if self._pending_count >= self.max_batch:
+            self._wakeup.set()
+
+    def pending_for(self, user_id: UUID) -> set[UUID]:
+        """
+        Get lesson ids completed by user but not yet committed.
+
+        :param user_id: user id
+
+        :return: pending lesson ids
+        """
+
+        return self._pending.get(user_id, set()) | self._in_flight.get(user_id, set())
+
+    async def forget_user(self, user_id: UUID) -> None:
+        """
+        Drop pending pairs for user and wait for any in-flight write.
+
+        Progress reset calls this before deleting rows, so a batch that was
+        already being written cannot resurrect progress after the reset.
+
+        :param user_id: user id
+
+        :return: None
+        """
+        dropped = self._pending.pop(user_id, set())
+        self._pending_count -= len(dropped)
+
+        async with self._flush_lock:
+            return
+
+    async def flush(self) -> None:
+        """
+        Write all pending pairs in one multi-row insert.
+
+        When the batch fails, rows are retried one by one, so a single row
+        whose lesson was deleted meanwhile cannot block the rest. Rows that
+        fail for other reasons are put back for the next flush.
+
+        :return: None
+        """
+        async with self._flush_lock:
+            if not self._pending:
+                return
+
+            self._in_flight = self._pending
+            self._pending = {}
+            self._pending_count = 0
+            pairs = [
+                (user_id, lesson_id)
+                for user_id, lesson_ids in self._in_flight.items()
+                for lesson_id in lesson_ids
+            ]
+
+            try:
+                await self._write(pairs=pairs)
+            except asyncio.CancelledError:
+                # Whether the batch committed is unknown; inserts skip existing
+                # rows, so putting it back for the next flush is safe.
+                self._restore_in_flight()
+                raise
+            except Exception:
+                logger.exception("Progress batch write failed, retrying rows one by one")
+                await self._write_individually(pairs=pairs)
+            finally:
+                self._in_flight = {}
+
+    async def _run(self) -> None:
+        """
+        Flush on the configured interval or as soon as the batch fills up.
+
+        :return: None
+        """
+        interval_sec = self.flush_interval_ms / 1000
+
+        while not self._stopping:
+            with contextlib.suppress(TimeoutError):
+                await asyncio.wait_for(self._wakeup.wait(), timeout=interval_sec)
+
+            self._wakeup.clear()
+
+            if self._stopping:
+                return
+
+            try:
+                await self.flush()
+            except Exception:
+                logger.exception("Progress flush failed")
+
+    def _restore_in_flight(self) -> None:
+        """
+        Move in-flight pairs back to pending.
+
+        :return: None
+        """
+        in_flight = self._in_flight
+        self._in_flight = {}
+
+        for user_id, lesson_ids in in_flight.items():
+            for lesson_id in lesson_ids:
+                self.enqueue(user_id=user_id, lesson_id=lesson_id)
+
+    async def _write(self, pairs: list[tuple[UUID, UUID]]) -> None:
+        """
+        Insert pairs in one transaction.
+
+        :param pairs: (user_id, lesson_id) pairs
+
+        :return: None
+        """
+        async with self.session_factory() as session:
+            repository = LessonProgressRepository(session=session)
+            await repository.add_many_if_missing(pairs=pairs)
+            await session.commit()
+
+    async def _write_individually(self, pairs: list[tuple[UUID, UUID]]) -> None:
+        """
+        Insert pairs one per transaction after a failed batch.
+
+        :param pairs: (user_id, lesson_id) pairs
+
+        :return: None
+        """
+        for user_id, lesson_id in pairs:
+            try:
+                await self._write(pairs=[(user_id, lesson_id)])
+            except IntegrityError:
+                logger.warning("Dropping progress for missing user %s or lesson %s", user_id, lesson_id)
+            except Exception:
+                logger.exception("Progress write failed, keeping row for next flush")
+                self.enqueue(user_id=user_id, lesson_id=lesson_id)
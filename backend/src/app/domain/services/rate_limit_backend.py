@@ -0,0 +1,322 @@
+import asyncio
+import fcntl
+import hashlib
+import mmap
+import os
+import struct
+import time
+from abc import ABC, abstractmethod
+from pathlib import Path
+
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from src.app.domain.repositories.rate_limit_counter_repository import RateLimitCounterRepository
+
+# key fingerprint, window index, hits, previous window hits
+SHARED_SLOT = struct.Struct("<QqQQ")
+SHARED_MAX_PROBES = 16
+MEMORY_PRUNE_THRESHOLD = 10_000
+
+
+def current_window_position(window_sec: int) -> tuple[int, float]:
+    """
+    Resolve the fixed window number and the elapsed share of that window.
+
+    Wall-clock time is shared by every worker on every node, so all backends
+    agree on window boundaries without coordination.
+
+    :param window_sec: window duration in seconds
+
+    :return: window number and elapsed fraction in ``[0, 1)``
+    """
+    position = time.time() / window_sec
+    window_index = int(position)
+
+    return window_index, position - window_index
+
+
+def sliding_window_hits(hits: int, previous_hits: int, elapsed: float) -> float:
+    """
+    Estimate hits in the sliding window that ends now.
+
+    The previous fixed window is weighted by the part of it still covered by
+    the sliding window, so a burst at the end of one window still counts
+    right after the boundary instead of letting twice the limit through.
+
+    :param hits: hits in the current fixed window
+    :param previous_hits: hits in the previous fixed window
+    :param elapsed: elapsed fraction of the current fixed window
+
+    :return: estimated hits in the sliding window
+    """
+    return hits + previous_hits * (1 - elapsed)
+
+
+def roll_window(
+        stored_window: int,
+        hits: int,
+        previous_hits: int,
+        window_index: int,
+) -> tuple[int, int]:
+    """
+    Count one hit against a stored counter pair.
+
+    :param stored_window: window number the counters belong to
+    :param hits: stored hits of that window
+    :param previous_hits: stored hits of the window before it
+    :param window_index: current window number
+
+    :return: current and previous window hits, including this hit
+    """
+    if stored_window == window_index:
+        return hits + 1, previous_hits
+
+    if stored_window == window_index - 1:
+        return 1, hits
+
+    return 1, 0
+
+
+class RateLimitBackend(ABC):
+    @abstractmethod
+    async def hit(self, key: str, window_sec: int) -> float:
+        """
+        Count one hit for key and estimate hits in the sliding window.
+
+        Backends keep counters for the current and the previous fixed window
+        and combine them with ``sliding_window_hits``. The interface lets the
+        limiter stay storage-agnostic, so the same policy works in one
+        process, across workers, or across nodes.
+
+        :param key: rate limit key
+        :param window_sec: window duration in seconds
+
+        :return: estimated hits in the sliding window, including this one
+        """
+        raise NotImplementedError
+
+
+class InMemoryRateLimitBackend(RateLimitBackend):
+    def __init__(self) -> None:
+        """
+        Initialize in-process rate limit backend.
+
+        :return: None
+        """
+        self._counters: dict[str, tuple[int, int, int]] = {}
+
+    async def hit(self, key: str, window_sec: int) -> float:
+        """
+        Count one hit in process memory.
+
+        Counters are only visible to the current process, so this backend fits
+        single-worker deployments and tests.
+
+        :param key: rate limit key
+        :param window_sec: window duration in seconds
+
+        :return: estimated hits in the sliding window
+        """
+        window_index, elapsed = current_window_position(window_sec=window_sec)
+        hits, previous_hits = roll_window(
+            *self._counters.get(key, (window_index, 0, 0)),
+            window_index=window_index,
+        )
+        self._counters[key] = (window_index, hits, previous_hits)
+
+        if len(self._counters) > MEMORY_PRUNE_THRESHOLD:
+            self._prune(window_index=window_index)
+
+        return sliding_window_hits(hits=hits, previous_hits=previous_hits, elapsed=elapsed)
+
+    def _prune(self, window_index: int) -> None:
+        """
+        Drop counters that no longer reach into the sliding window.
+
+        :param window_index: current window number
+
+        :return: None
+        """
+        self._counters = {
+            key: counter
+            for key, counter in self._counters.items()
+            if counter[0] >= window_index - 1
+        }
+
+
+class SharedMemoryRateLimitBackend(RateLimitBackend):
+    def __init__(self, path: Path, slots: int = 4096) -> None:
+        """
+        Initialize host-wide rate limit backend.
+
+        Every uvicorn worker maps the same file, so counters are shared by all
+        processes on one host. A file lock serializes updates between them,
+        and an asyncio lock serializes coroutines of one worker, which share
+        the same file description and would otherwise share the file lock.
+
+        :param path: shared counters file
+        :param slots: number of counter slots
+
+        :return: None
+        """
+        self.path = path
+        self.slots = slots
+        size = SHARED_SLOT.size * slots
+
+        self._fd = os.open(path, os.O_RDWR | os.O_CREAT, 0o600)
+        fcntl.flock(self._fd, fcntl.LOCK_EX)
+        try:
+            if os.fstat(self._fd).st_size < size:
+                os.ftruncate(self._fd, size)
+        finally:
+            fcntl.flock(self._fd, fcntl.LOCK_UN)
+
+        self._map = mmap.mmap(self._fd, size)
+        self._lock = asyncio.Lock()
+
+    async def hit(self, key: str, window_sec: int) -> float:
+        """
+        Count one hit in the shared counters file.
+
+        The critical section is a handful of struct reads and writes, so the
+        file lock is held for microseconds and never awaits. Only waiting for
+        a lock held by another worker leaves the event loop.
+
+        :param key: rate limit key
+        :param window_sec: window duration in seconds
+
+        :return: estimated hits in the sliding window
+        """
+        fingerprint = self._fingerprint(key=key)
+
+        async with self._lock:
+            await self._acquire_file_lock()
+            try:
+                window_index, elapsed = current_window_position(window_sec=window_sec)
+                hits, previous_hits = self._increment(
+                    fingerprint=fingerprint,
+                    window_index=window_index,
+                )
+            finally:
+                fcntl.flock(self._fd, fcntl.LOCK_UN)
+
+        return sliding_window_hits(hits=hits, previous_hits=previous_hits, elapsed=elapsed)
+
+    def close(self) -> None:
+        """
+        Unmap the counters file.
+
+        :return: None
+        """
+        self._map.close()
+        os.close(self._fd)
+
+    async def _acquire_file_lock(self) -> None:
+        """
+        Take the counters file lock without blocking the event loop.
+
+        The uncontended case is a non-blocking syscall; a lock held by another
+        worker is awaited in a thread.
+
+        :return: None
+        """
+        try:
+            fcntl.flock(self._fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+        except BlockingIOError:
+            await asyncio.to_thread(fcntl.flock, self._fd, fcntl.LOCK_EX)
+
+    def _increment(self, fingerprint: int, window_index: int) -> tuple[int, int]:
+        """
+        Increment the slot for fingerprint using linear probing.
+
+        Slots older than the previous window are reused first, then slots of
+        the previous window, so the table never needs explicit cleanup. When
+        every probed slot is live, the home slot is evicted, which can only
+        under-count and therefore never blocks a request wrongly.
+
+        :param fingerprint: key fingerprint
+        :param window_index: current window number
+
+        :return: current and previous window hits
+        """
+        home = fingerprint % self.slots
+        stale_offset: int | None = None
+        previous_offset: int | None = None
+
+        for probe in range(min(SHARED_MAX_PROBES, self.slots)):
+            offset = ((home + probe) % self.slots) * SHARED_SLOT.size
+            stored_fingerprint, stored_window, hits, previous_hits = SHARED_SLOT.unpack_from(
+                self._map,
+                offset,
+            )
+
+            if stored_fingerprint == fingerprint:
+                hits, previous_hits = roll_window(
+                    stored_window=stored_window,
+                    hits=hits,
+                    previous_hits=previous_hits,
+                    window_index=window_index,
+                )
+                SHARED_SLOT.pack_into(self._map, offset, fingerprint, window_index, hits, previous_hits)
+
+                return hits, previous_hits
+
+            if stale_offset is None and (stored_fingerprint == 0 or stored_window < window_index - 1):
+                stale_offset = offset
+            elif previous_offset is None and stored_window == window_index - 1:
+                previous_offset = offset
+
+        reusable_offset = next(
+            offset
+            for offset in (stale_offset, previous_offset, home * SHARED_SLOT.size)
+            if offset is not None
+        )
+        SHARED_SLOT.pack_into(self._map, reusable_offset, fingerprint, window_index, 1, 0)
+
+        return 1, 0
+
+    @staticmethod
+    def _fingerprint(key: str) -> int:
+        """
+        Build a process-independent non-zero key fingerprint.
+
+        :param key: rate limit key
+
+        :return: 64-bit fingerprint
+        """
+        digest = hashlib.blake2b(key.encode("utf-8"), digest_size=8).digest()
+
+        return int.from_bytes(digest, "little") or 1
+
+
+class DatabaseRateLimitBackend(RateLimitBackend):
+    def __init__(self, session_factory: async_sessionmaker[AsyncSession]) -> None:
+        """
+        Initialize database rate limit backend.
+
+        :param session_factory: database session factory
+
+        :return: None
+        """
+        self.session_factory = session_factory
+
+    async def hit(self, key: str, window_sec: int) -> float:
+        """
+        Count one hit with an atomic database upsert.
+
+        Counters live in the shared database, so limits hold across every
+        worker on every node.
+
+        :param key: rate limit key
+        :param window_sec: window duration in seconds
+
+        :return: estimated hits in the sliding window
+        """
+        window_index, elapsed = current_window_position(window_sec=window_sec)
+
+        async with self.session_factory() as session:
+            repository = RateLimitCounterRepository(session=session)
+            hits, previous_hits = await repository.increment(key=key, window_index=window_index)
+            await session.commit()
+
+        return sliding_window_hits(hits=hits, previous_hits=previous_hits, elapsed=elapsed)
@@ -7,22 +7,31 @@ from src.app.core.exceptions.user_exc import (
     UserEmailAlreadyExists,
 )
 from src.app.core.security.auth_manager import AuthManager
+from src.app.core.security.user_cache import UserCache
 from src.app.domain.models.db.user import User
 from src.app.domain.models.dto.user import CreateUserDTO, UpdateUserDTO, UserDTO
 from src.app.domain.repositories import UserRepository
 
 
 class UserService:
-    def __init__(self, user_repository: UserRepository, auth_manager: AuthManager) -> None:
+    def __init__(
+            self,
+            user_repository: UserRepository,
+            auth_manager: AuthManager,
+            user_cache: UserCache | None = None,
+    ) -> None:
         """
         Initialize user service.
 
         :param user_repository: user repository
+        :param auth_manager: auth manager
+        :param user_cache: resolved user cache to invalidate on changes
 
         :return: None
         """
         self.repository = user_repository
         self.auth_manager = auth_manager
+        self.user_cache = user_cache
 
     async def get_by_id(self, id: UUID) -> UserDTO:
         """
@@ -60,9 +69,31 @@ class UserService:
 
         :return: user list
         """
-        users = await self.repository.get_all()
+        rows = await self.repository.get_all(columns=[User.id, User.username, User.email, User.role])
+
+        return [UserDTO.model_validate(obj=row, from_attributes=True) for row in rows]
+
+    async def get_page(self, limit: int, cursor: UUID | None = None) -> tuple[list[UserDTO], UUID | None]:
+        """
+        Get one page of users.
+
+        Only the columns exposed in the DTO are selected, so password hashes
+        never leave the database for a listing.
 
-        return [user.to_dto() for user in users]
+        :param limit: max users per page
+        :param cursor: last user id of the previous page
+
+        :return: users and the cursor of the next page, None on the last page
+        """
+        rows = await self.repository.get_page(
+            limit=limit,
+            cursor=cursor,
+            columns=[User.id, User.username, User.email, User.role],
+        )
+        users = [UserDTO.model_validate(obj=row, from_attributes=True) for row in rows]
+        next_cursor = users[-1].id if len(users) == limit else None
+
+        return users, next_cursor
 
     async def create(self, schema: CreateUserDTO) -> UserDTO:
         """
@@ -74,7 +105,7 @@ class UserService:
         """
         await self._validate_username_available(username=schema.username)
 
-        hashed_password = self.auth_manager.hash_password(password=schema.plain_password)
+        hashed_password = await self.auth_manager.hash_password_async(password=schema.plain_password)
         data = schema.model_dump()
 
         user = User(
@@ -109,6 +140,9 @@ class UserService:
 
         await self.repository.session.commit()
 
+        if self.user_cache is not None:
+            self.user_cache.invalidate_user_id(user_id=id)
+
         return deleted
 
     async def update_me(self, id: UUID, schema: UpdateUserDTO) -> UserDTO:
@@ -121,6 +155,7 @@ class UserService:
         :return: updated user dto
         """
         user = await self._require_user(id=id)
+        previous_username = user.username
         data = await self._build_update_data(
             user=user,
             schema=schema,
@@ -129,22 +164,18 @@ class UserService:
         if not data:
             return user.to_dto()
 
-        updated = await self.repository.update(
-            id=id,
-            data=data,
-        )
-
-        if updated is None:
-            raise NotFoundError(
-                entity_type_str='User',
-                field_name='id',
-                field_value=id,
-            )
+        # The user is already loaded and stays fresh after commit, so it is
+        # updated in place instead of being selected and refreshed again.
+        for key, value in data.items():
+            setattr(user, key, value)
 
         await self.repository.session.commit()
-        await self.repository.session.refresh(instance=updated)
 
-        return updated.to_dto()
+        if self.user_cache is not None:
+            self.user_cache.invalidate(username=previous_username)
+            self.user_cache.invalidate(username=user.username)
+
+        return user.to_dto()
 
     async def _validate_username_available(self, username: str) -> None:
         """
@@ -205,7 +236,7 @@ class UserService:
             user=user,
             new_email=data.get("email"),
         )
-        self._enrich_password_change(
+        await self._enrich_password_change(
             user=user,
             schema=schema,
             data=data,
@@ -255,7 +286,7 @@ class UserService:
         if existing is not None and existing.id != user.id:
             raise UserEmailAlreadyExists(email=new_email)
 
-    def _enrich_password_change(
+    async def _enrich_password_change(
             self,
             user: User,
             schema: UpdateUserDTO,
@@ -288,7 +319,7 @@ class UserService:
         if hashed_password is None:
             raise InvalidCredentials
 
-        is_password_correct = self.auth_manager.verify_password_against_hash(
+        is_password_correct = await self.auth_manager.verify_password_against_hash_async(
             plain_password=current_password,
             hashed_password=hashed_password,
         )
@@ -296,4 +327,4 @@ class UserService:
         if not is_password_correct:
             raise InvalidCredentials
 
-        data["hashed_password"] = self.auth_manager.hash_password(password=new_password)
+        data["hashed_password"] = await self.auth_manager.hash_password_async(password=new_password)
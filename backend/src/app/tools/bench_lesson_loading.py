@@ -0,0 +1,121 @@
+import argparse
+import json
+import statistics
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+from src.app.content.loader import LessonsLoader
+from src.app.content.validator import LessonsContentValidator
+
+LESSONS_PER_SECTION = 100
+
+CASES_TEMPLATE = """cases:
+  - name: visible_case
+    label: visible case
+    hidden: false
+    script: |
+      assert User(name="{slug}").name == "{slug}"
+  - name: hidden_case
+    label: hidden case
+    hidden: true
+    script: |
+      ok = True
+"""
+
+QUIZ_TEMPLATE = """questions:
+  - prompt: Which lesson is this?
+    options:
+      - {slug}
+      - something else
+    correct_option: 0
+"""
+
+
+def generate_lessons(root_dir: Path, count: int) -> None:
+    """
+    Write synthetic lessons nested in sections of LESSONS_PER_SECTION.
+
+    :param root_dir: lessons root directory
+    :param count: lesson count
+
+    :return: None
+    """
+    for index in range(count):
+        section, position = divmod(index, LESSONS_PER_SECTION)
+        slug = f"lesson-{section + 1}-{position + 1}"
+        lesson_dir = root_dir / f"{section + 1:02d}-section-{section + 1}" / f"{position + 1:03d}-{slug}"
+        lesson_dir.mkdir(parents=True)
+        (lesson_dir / "lesson.yaml").write_text(f"title: Lesson {section + 1}.{position + 1}\n", encoding="utf-8")
+        (lesson_dir / "theory.md").write_text(f"# {slug}\n\n" + "Some theory text.\n" * 40, encoding="utf-8")
+        (lesson_dir / "starter.py").write_text("class User:\n    pass\n", encoding="utf-8")
+        (lesson_dir / "cases.yaml").write_text(CASES_TEMPLATE.format(slug=slug), encoding="utf-8")
+        (lesson_dir / "quiz.yaml").write_text(QUIZ_TEMPLATE.format(slug=slug), encoding="utf-8")
+
+
+def measure_load(root_dir: Path, workers: int) -> dict[str, float | int | str]:
+    """
+    Scan and parse all lessons once.
+
+    :param root_dir: lessons root directory
+    :param workers: parsing processes
+
+    :return: benchmark summary
+    """
+    loader = LessonsLoader(root_dir=root_dir, validator=LessonsContentValidator(), workers=workers)
+
+    started = time.perf_counter()
+    sources = loader.scan()
+    scanned = time.perf_counter()
+    lessons = loader.load_sources(sources=sources)
+    finished = time.perf_counter()
+
+    timings = sorted(loader.last_load_timings.values())
+    slowest_slug = max(loader.last_load_timings, key=loader.last_load_timings.__getitem__)
+
+    return {
+        "mode": "parallel" if workers > 1 else "serial",
+        "workers": workers,
+        "lessons": len(lessons),
+        "scan_sec": round(scanned - started, 3),
+        "parse_sec": round(finished - scanned, 3),
+        "lesson_p50_ms": round(statistics.median(timings), 3),
+        "lesson_p99_ms": round(timings[int(len(timings) * 0.99)], 3),
+        "lesson_max_ms": round(timings[-1], 3),
+        "slowest_lesson": slowest_slug,
+    }
+
+
+def parse_args() -> argparse.Namespace:
+    """
+    Parse command-line arguments.
+
+    :return: parsed arguments
+    """
+    parser = argparse.ArgumentParser(description="Compare serial and parallel lesson loading.")
+    parser.add_argument("--lessons", type=int, default=5000)
+    parser.add_argument("--workers", type=int, default=4)
+
+    return parser.parse_args()
+
+
+def main() -> None:
+    """
+    Run benchmark command-line entrypoint.
+
+    :return: None
+    """
+    args = parse_args()
+
+    with tempfile.TemporaryDirectory(prefix="lessons-bench-") as tmp_dir:
+        root_dir = Path(tmp_dir)
+        generate_lessons(root_dir=root_dir, count=args.lessons)
+
+        for workers in (1, args.workers):
+            summary = measure_load(root_dir=root_dir, workers=workers)
+            sys.stdout.write(f"{json.dumps(summary)}\n")
+
+
+if __name__ == "__main__":
+    main()
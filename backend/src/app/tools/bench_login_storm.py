@@ -0,0 +1,140 @@
+import argparse
+import asyncio
+import json
+import statistics
+import sys
+import time
+
+from passlib.context import CryptContext
+
+from src.app.core.security.auth_manager import AuthManager
+from src.app.core.security.password_executor import PasswordHashExecutor
+
+HEARTBEAT_INTERVAL_SEC = 0.005
+
+
+async def measure_loop_lag(stop: asyncio.Event, samples: list[float]) -> None:
+    """
+    Record how late a periodic wakeup fires while the storm runs.
+
+    :param stop: event that ends sampling
+    :param samples: output list of lag values in milliseconds
+
+    :return: None
+    """
+    while not stop.is_set():
+        started = time.perf_counter()
+        await asyncio.sleep(HEARTBEAT_INTERVAL_SEC)
+        samples.append((time.perf_counter() - started - HEARTBEAT_INTERVAL_SEC) * 1000)
+
+
+async def run_storm(
+        *,
+        auth_manager: AuthManager,
+        hashed_password: str,
+        logins: int,
+        offload: bool,
+) -> dict[str, float | int | str]:
+    """
+    Run concurrent login verifications and report event loop lag.
+
+    :param auth_manager: auth manager under test
+    :param hashed_password: stored password hash
+    :param logins: concurrent login count
+    :param offload: verify in the hashing pool instead of on the loop
+
+    :return: benchmark summary
+    """
+
+    async def login() -> bool:
+        if offload:
+            return await auth_manager.verify_login_password(
+                plain_password="password",
+                hashed_password=hashed_password,
+            )
+
+        return auth_manager.verify_password_against_hash(
+            plain_password="password",
+            hashed_password=hashed_password,
+        )
+
+    stop = asyncio.Event()
+    samples: list[float] = []
+    heartbeat = asyncio.create_task(measure_loop_lag(stop=stop, samples=samples))
+    await asyncio.sleep(0)
+
+    started = time.perf_counter()
+    await asyncio.gather(*(login() for _ in range(logins)))
+    elapsed = time.perf_counter() - started
+
+    stop.set()
+    await heartbeat
+    samples.sort()
+
+    return {
+        "mode": "offload" if offload else "inline",
+        "logins": logins,
+        "elapsed_sec": round(elapsed, 3),
+        "heartbeats": len(samples),
+        "lag_p50_ms": round(statistics.median(samples), 2) if samples else 0.0,
+        "lag_p99_ms": round(samples[int(len(samples) * 0.99)], 2) if samples else 0.0,
+        "lag_max_ms": round(samples[-1], 2) if samples else 0.0,
+    }
+
+
+def parse_args() -> argparse.Namespace:
+    """
+    Parse command-line arguments.
+
+    :return: parsed arguments
+    """
+    parser = argparse.ArgumentParser(description="Measure event loop lag during a login storm.")
+    parser.add_argument("--logins", type=int, default=50)
+    parser.add_argument("--workers", type=int, default=4)
+    parser.add_argument("--login-concurrency", type=int, default=2)
+    parser.add_argument("--scheme", default="bcrypt", help="passlib hash scheme")
+
+    return parser.parse_args()
+
+
+async def run_benchmark(args: argparse.Namespace) -> list[dict[str, float | int | str]]:
+    """
+    Run the storm inline and offloaded with the same password hash.
+
+    :param args: parsed arguments
+
+    :return: benchmark summaries
+    """
+    executor = PasswordHashExecutor(
+        max_workers=args.workers,
+        max_concurrent_logins=args.login_concurrency,
+    )
+    auth_manager = AuthManager(context=CryptContext(schemes=[args.scheme]), executor=executor)
+    hashed_password = auth_manager.hash_password(password="password")
+
+    try:
+        return [
+            await run_storm(
+                auth_manager=auth_manager,
+                hashed_password=hashed_password,
+                logins=args.logins,
+                offload=offload,
+            )
+            for offload in (False, True)
+        ]
+    finally:
+        executor.shutdown()
+
+
+def main() -> None:
+    """
+    Run benchmark command-line entrypoint.
+
+    :return: None
+    """
+    for summary in asyncio.run(run_benchmark(args=parse_args())):
+        sys.stdout.write(f"{json.dumps(summary)}\n")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,11 +1,14 @@
+import argparse
 import asyncio
 import json
 import sys
 from pathlib import Path
 
 from src.app.content.loader import LessonsLoader
+from src.app.content.manifest import LessonsManifest
 from src.app.content.validator import LessonsContentValidator
-from src.app.core.dependencies.db import session_factory
+from src.app.core.dependencies.db import DATABASE, session_factory
+from src.app.core.dependencies.services.lesson_sync import get_lessons_parse_cache
 from src.app.domain.repositories.lesson_repository import LessonRepository
 from src.app.domain.services.lesson_sync_diff_builder import LessonSyncDiffBuilder
 from src.app.domain.services.lesson_sync_importer import LessonSyncImporter
@@ -13,30 +16,72 @@ from src.app.domain.services.lesson_sync_service import LessonSyncService
 from src.cfg.cfg import settings
 
 
-async def run_sync() -> dict[str, int | bool]:
+async def run_sync(*, progress: bool = False) -> dict[str, int | bool]:
     """
     Run lessons sync from files to database.
 
+    The database engine is opened for the run and disposed afterwards.
+    With progress enabled, sync events are printed as JSON lines while the
+    sync runs and writes are committed in chunks.
+
+    :param progress: print streamed sync events
+
     :return: sync counters
     """
-    async with session_factory() as session:
-        repository = LessonRepository(session=session)
+    root_dir = await asyncio.to_thread(Path(settings.lessons_dir).resolve)
+    DATABASE.open()
+
+    try:
+        async with session_factory() as session:
+            repository = LessonRepository(session=session)
+
+            loader = LessonsLoader(
+                root_dir=root_dir,
+                validator=LessonsContentValidator(),
+                manifest=LessonsManifest(path=Path(settings.lessons_manifest_path)),
+                workers=settings.lessons_load_workers,
+                parse_cache=get_lessons_parse_cache(),
+            )
+
+            service = LessonSyncService(
+                loader=loader,
+                lesson_repository=repository,
+                diff_builder=LessonSyncDiffBuilder(),
+                importer=LessonSyncImporter(lesson_repository=repository),
+            )
+
+            if not progress:
+                result = await service.sync(delete_missing=True)
 
-        loader = LessonsLoader(
-            root_dir=Path(settings.lessons_dir),
-            validator=LessonsContentValidator(),
-        )
+                return result.model_dump()
 
-        service = LessonSyncService(
-            loader=loader,
-            lesson_repository=repository,
-            diff_builder=LessonSyncDiffBuilder(),
-            importer=LessonSyncImporter(lesson_repository=repository),
-        )
+            summary: dict[str, int | bool] = {}
+            async for event in service.stream(delete_missing=True):
+                if event.result is not None:
+                    summary = event.result.model_dump()
+                    continue
 
-        result = await service.sync(delete_missing=True)
+                sys.stdout.write(f"{event.model_dump_json(exclude_none=True)}\n")
+
+            return summary
+    finally:
+        await DATABASE.dispose()
+
+
+def parse_args() -> argparse.Namespace:
+    """
+    Parse command-line arguments.
+
+    :return: parsed arguments
+    """
+    parser = argparse.ArgumentParser(description="Sync lessons from files to the database.")
+    parser.add_argument(
+        "--progress",
+        action="store_true",
+        help="print a JSON line per scanned, parsed, planned and written lesson",
+    )
 
-        return result.model_dump()
+    return parser.parse_args()
 
 
 def main() -> None:
@@ -45,7 +90,8 @@ def main() -> None:
 
     :return: None
     """
-    result = asyncio.run(run_sync())
+    args = parse_args()
+    result = asyncio.run(run_sync(progress=args.progress))
     sys.stdout.write(f"{json.dumps(result)}\n")
 
 
@@ -1,6 +1,8 @@
 from pydantic import Field, computed_field
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
+from src.app.domain.models.enums.execution import RateLimitBackendKind
+
 
 class Database(BaseSettings):
     host: str = Field(alias="DB_HOST")
@@ -9,17 +11,41 @@ class Database(BaseSettings):
     database: str = Field(alias="DB_NAME")
     username: str = Field(alias="DB_USERNAME")
     password: str = Field(alias="DB_PASSWORD")
+    pool_size: int = Field(default=10, alias="DB_POOL_SIZE")
+    max_overflow: int = Field(default=20, alias="DB_MAX_OVERFLOW")
+    pool_timeout_sec: float = Field(default=10.0, alias="DB_POOL_TIMEOUT_SEC")
+    # Below MySQL's default wait_timeout of 8 hours, and below the idle
+    # timeouts of most proxies and load balancers.
+    pool_recycle_sec: int = Field(default=1800, alias="DB_POOL_RECYCLE_SEC")
+    pool_pre_ping: bool = Field(default=True, alias="DB_POOL_PRE_PING")
+    replica_host: str | None = Field(default=None, alias="DB_REPLICA_HOST")
+    replica_port: int | None = Field(default=None, alias="DB_REPLICA_PORT")
 
     @computed_field
     @property
     def url(self) -> str:
         return f"mysql+aiomysql://{self.username}:{self.password}@{self.host}:{self.port}/{self.database}"
 
+    @computed_field
+    @property
+    def replica_url(self) -> str | None:
+        if self.replica_host is None:
+            return None
+
+        port = self.replica_port or self.port
+
+        return f"mysql+aiomysql://{self.username}:{self.password}@{self.replica_host}:{port}/{self.database}"
+
 
 class Auth(BaseSettings):
     jwt_secret_key: str = Field(alias="JWT_SECRET_KEY")
     jwt_algorithm: str = Field(alias='JWT_ALGORITHM')
     jwt_lifespan: int = Field(alias='JWT_LIFESPAN')  # in minutes
+    user_cache_ttl_sec: float = Field(default=30.0, alias="AUTH_USER_CACHE_TTL_SEC")
+    user_cache_max_size: int = Field(default=10_000, alias="AUTH_USER_CACHE_MAX_SIZE")
+    trust_token_claims: bool = Field(default=False, alias="AUTH_TRUST_TOKEN_CLAIMS")
+    hash_workers: int = Field(default=4, alias="AUTH_HASH_WORKERS")
+    login_hash_concurrency: int = Field(default=2, alias="AUTH_LOGIN_HASH_CONCURRENCY")
 
 
 class GithubOAuth(BaseSettings):
@@ -34,6 +60,13 @@ class GithubOAuth(BaseSettings):
     emails_url: str = Field(alias="GITHUB_EMAILS_URL")
 
 
+class HttpClientSettings(BaseSettings):
+    timeout_sec: float = Field(default=10.0, alias="HTTP_CLIENT_TIMEOUT_SEC")
+    max_connections: int = Field(default=100, alias="HTTP_CLIENT_MAX_CONNECTIONS")
+    max_keepalive_connections: int = Field(default=20, alias="HTTP_CLIENT_MAX_KEEPALIVE_CONNECTIONS")
+    keepalive_expiry_sec: float = Field(default=30.0, alias="HTTP_CLIENT_KEEPALIVE_EXPIRY_SEC")
+
+
 class ExecutionSettings(BaseSettings):
     piston_url: str = Field(alias="PISTON_URL")
     language: str = Field(alias="PISTON_LANGUAGE")
@@ -55,6 +88,35 @@ class ExecutionSettings(BaseSettings):
     http_timeout_ms: int = Field(alias="PISTON_HTTP_TIMEOUT_MS")
     rate_limit_window_sec: int = Field(alias="EXECUTION_RATE_LIMIT_WINDOW_SEC")
     rate_limit_max: int = Field(alias="EXECUTION_RATE_LIMIT_MAX")
+    rate_limit_backend: RateLimitBackendKind = Field(
+        default=RateLimitBackendKind.MEMORY,
+        alias="EXECUTION_RATE_LIMIT_BACKEND",
+    )
+    rate_limit_shm_path: str = Field(
+        default="/tmp/pydantic-quest-rate-limit.bin",
+        alias="EXECUTION_RATE_LIMIT_SHM_PATH",
+    )
+    rate_limit_shm_slots: int = Field(default=4096, alias="EXECUTION_RATE_LIMIT_SHM_SLOTS")
+
+
+class ProgressSettings(BaseSettings):
+    write_behind_enabled: bool = Field(default=False, alias="PROGRESS_WRITE_BEHIND_ENABLED")
+    flush_interval_ms: int = Field(default=200, alias="PROGRESS_FLUSH_INTERVAL_MS")
+    flush_max_batch: int = Field(default=500, alias="PROGRESS_FLUSH_MAX_BATCH")
+
+
+class ObservabilitySettings(BaseSettings):
+    stage_timing_enabled: bool = Field(default=False, alias="OBSERVABILITY_STAGE_TIMING_ENABLED")
+    metrics_enabled: bool = Field(default=False, alias="OBSERVABILITY_METRICS_ENABLED")
+    metrics_multiprocess_dir: str | None = Field(default=None, alias="OBSERVABILITY_METRICS_MULTIPROCESS_DIR")
+    metrics_flush_interval_sec: float = Field(default=5.0, alias="OBSERVABILITY_METRICS_FLUSH_INTERVAL_SEC")
+    loop_monitor_enabled: bool = Field(default=False, alias="OBSERVABILITY_LOOP_MONITOR_ENABLED")
+    loop_monitor_interval_ms: int = Field(default=100, alias="OBSERVABILITY_LOOP_MONITOR_INTERVAL_MS")
+    loop_monitor_stall_threshold_ms: int = Field(
+        default=250,
+        alias="OBSERVABILITY_LOOP_MONITOR_STALL_THRESHOLD_MS",
+    )
+    slow_query_threshold_ms: float = Field(default=200.0, alias="OBSERVABILITY_SLOW_QUERY_THRESHOLD_MS")
 
 
 class Settings(BaseSettings):
@@ -66,9 +128,27 @@ class Settings(BaseSettings):
     database: Database = Field(default_factory=Database)
     auth: Auth = Field(default_factory=Auth)
     github: GithubOAuth = Field(default_factory=GithubOAuth)
+    http_client: HttpClientSettings = Field(default_factory=HttpClientSettings)
     execution: ExecutionSettings = Field(default_factory=ExecutionSettings)
+    progress: ProgressSettings = Field(default_factory=ProgressSettings)
+    observability: ObservabilitySettings = Field(default_factory=ObservabilitySettings)
     frontend_url: str = Field(alias="FRONTEND_URL")
     lessons_dir: str = Field(default="lessons", alias="LESSONS_DIR")
+    lessons_manifest_path: str = Field(
+        default="/tmp/pydantic-quest-lessons-manifest.json",
+        alias="LESSONS_MANIFEST_PATH",
+    )
+    lessons_load_workers: int = Field(default=1, alias="LESSONS_LOAD_WORKERS")
+    lessons_parse_cache_dir: str | None = Field(default=None, alias="LESSONS_PARSE_CACHE_DIR")
+    lessons_watch_enabled: bool = Field(default=False, alias="LESSONS_WATCH_ENABLED")
+    lessons_watch_debounce_ms: int = Field(default=300, alias="LESSONS_WATCH_DEBOUNCE_MS")
+    lessons_watch_poll_interval_ms: int = Field(default=500, alias="LESSONS_WATCH_POLL_INTERVAL_MS")
+    lessons_watch_lock_path: str = Field(
+        default="/tmp/pydantic-quest-lessons-watch.lock",
+        alias="LESSONS_WATCH_LOCK_PATH",
+    )
+    lessons_cache_ttl_sec: float = Field(default=300.0, alias="LESSONS_CACHE_TTL_SEC")
+    lessons_cache_max_size: int = Field(default=1_000, alias="LESSONS_CACHE_MAX_SIZE")
 
 
 settings = Settings()
@@ -2,6 +2,7 @@ from __future__ import annotations
 
 import os
 from collections.abc import AsyncGenerator, Awaitable, Callable
+from contextlib import AbstractContextManager
 from pathlib import Path
 
 import httpx
@@ -54,6 +55,7 @@ TEST_ENV_DEFAULTS = {
     "PISTON_HTTP_TIMEOUT_MS": "5000",
     "EXECUTION_RATE_LIMIT_WINDOW_SEC": "60",
     "EXECUTION_RATE_LIMIT_MAX": "20",
+    "OBSERVABILITY_METRICS_ENABLED": "true",
     "LESSONS_DIR": str(Path(__file__).resolve().parents[2] / "lessons"),
 }
 
@@ -63,14 +65,25 @@ for key, value in TEST_ENV_DEFAULTS.items():
 from main import app
 from src.app.core.dependencies.db import get_session
 from src.app.core.dependencies.security.crypt_context import get_crypt_context
+from src.app.core.dependencies.security.user_cache import get_user_cache
+from src.app.core.dependencies.services.lesson_cache import get_lesson_cache
+from src.app.core.dependencies.services.lesson_change_hub import get_lesson_change_hub
+from src.app.core.dependencies.services.lesson_order_index import get_lesson_order_index_cache
+from src.app.core.dependencies.services.lesson_search import get_lesson_search_index_cache
 from src.app.core.dependencies.services.execution_rate_limiter import (
     get_execution_rate_limiter,
 )
+from src.app.core.observability import QueryStats, track_queries
+from src.app.core.cache import LessonCache
 from src.app.core.security.auth_manager import AuthManager
+from src.app.core.security.user_cache import UserCache
 from src.app.domain.models.db import Base
 from src.app.domain.models.db.user import User
 from src.app.domain.models.enums.role import UserRole
 from src.app.domain.services.execution_rate_limiter import ExecutionRateLimiter
+from src.app.domain.services.lesson_change_hub import LessonChangeHub
+from src.app.domain.services.lesson_order_index import LessonOrderIndexCache
+from src.app.domain.services.lesson_search_index import LessonSearchIndexCache
 
 
 @pytest.fixture(scope="session")
@@ -107,6 +120,11 @@ async def db_session(
         yield session
 
 
+@pytest.fixture
+def count_queries() -> Callable[[], AbstractContextManager[QueryStats]]:
+    return track_queries
+
+
 @pytest.fixture
 def auth_manager() -> AuthManager:
     return AuthManager(context=get_crypt_context())
@@ -180,6 +198,19 @@ async def client(
     app.dependency_overrides[get_session] = override_get_session
     rate_limiter = ExecutionRateLimiter(max_requests=100, window_sec=60)
     app.dependency_overrides[get_execution_rate_limiter] = lambda: rate_limiter
+    user_cache = UserCache(max_size=100, ttl_sec=60)
+    app.dependency_overrides[get_user_cache] = lambda: user_cache
+    lesson_change_hub = LessonChangeHub()
+    lesson_order_index_cache = LessonOrderIndexCache(ttl_sec=60)
+    lesson_change_hub.subscribe(listener=lesson_order_index_cache.invalidate)
+    lesson_cache = LessonCache(max_size=100, ttl_sec=60)
+    lesson_change_hub.subscribe(listener=lesson_cache.invalidate)
+    lesson_search_index_cache = LessonSearchIndexCache(ttl_sec=60)
+    lesson_change_hub.subscribe(listener=lesson_search_index_cache.invalidate)
+    app.dependency_overrides[get_lesson_change_hub] = lambda: lesson_change_hub
+    app.dependency_overrides[get_lesson_cache] = lambda: lesson_cache
+    app.dependency_overrides[get_lesson_order_index_cache] = lambda: lesson_order_index_cache
+    app.dependency_overrides[get_lesson_search_index_cache] = lambda: lesson_search_index_cache
 
     transport = httpx.ASGITransport(app=app)
     async with httpx.AsyncClient(transport=transport, base_url="http://test") as test_client:
@@ -1,8 +1,11 @@
 from pathlib import Path
 
 import pytest
+import yaml
 
 from src.app.content.loader import LessonsLoader
+from src.app.content.manifest import LessonsManifest
+from src.app.content.parse_cache import LessonsParseCache
 from src.app.content.validator import LessonsContentValidator
 
 
@@ -202,3 +205,97 @@ def test_loader_rejects_duplicate_order_in_directories(tmp_path: Path) -> None:
 
     with pytest.raises(ValueError, match="duplicate lesson order inferred from directories"):
         loader.load()
+
+
+def test_loader_scan_reuses_manifest_hash_for_unchanged_files(
+        tmp_path: Path,
+        monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    root_dir = tmp_path / "lessons"
+    root_dir.mkdir(parents=True)
+    _write_valid_lesson(root_dir=root_dir, relative_dir="01-first", title="First")
+    second_dir = _write_valid_lesson(root_dir=root_dir, relative_dir="02-second", title="Second")
+    manifest_path = tmp_path / "manifest.json"
+    first_scan = LessonsLoader(
+        root_dir=root_dir,
+        validator=LessonsContentValidator(),
+        manifest=LessonsManifest(path=manifest_path),
+    ).scan()
+
+    (second_dir / "starter.py").write_text("print('changed starter')\n", encoding="utf-8")
+    loader = LessonsLoader(
+        root_dir=root_dir,
+        validator=LessonsContentValidator(),
+        manifest=LessonsManifest(path=manifest_path),
+    )
+    hashed_dirs: list[str] = []
+    original_hash = loader._hash_lesson_dir
+
+    def _record_hash(lesson_dir: Path) -> str:
+        hashed_dirs.append(lesson_dir.name)
+        return original_hash(lesson_dir=lesson_dir)
+
+    monkeypatch.setattr(loader, "_hash_lesson_dir", _record_hash)
+
+    second_scan = loader.scan()
+
+    assert hashed_dirs == ["02-second"]
+    assert second_scan[0].content_hash == first_scan[0].content_hash
+    assert second_scan[1].content_hash != first_scan[1].content_hash
+
+
+def test_loader_parallel_mode_matches_serial_order(tmp_path: Path) -> None:
+    root_dir = tmp_path / "lessons"
+    root_dir.mkdir(parents=True)
+    for section in range(1, 4):
+        for position in range(1, 7):
+            _write_valid_lesson(
+                root_dir=root_dir,
+                relative_dir=f"0{section}-section-{section}/0{position}-lesson-{section}-{position}",
+                title=f"Lesson {section}.{position}",
+            )
+    serial_loader = LessonsLoader(root_dir=root_dir, validator=LessonsContentValidator())
+    parallel_loader = LessonsLoader(root_dir=root_dir, validator=LessonsContentValidator(), workers=2)
+
+    serial_lessons = serial_loader.load()
+    parallel_lessons = parallel_loader.load()
+
+    assert parallel_lessons == serial_lessons
+    assert [lesson.order for lesson in parallel_lessons][:3] == ["1.1", "1.2", "1.3"]
+    assert set(parallel_loader.last_load_timings) == {lesson.slug for lesson in serial_lessons}
+
+
+def test_loader_parse_cache_skips_yaml_for_unchanged_files(
+        tmp_path: Path,
+        monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    root_dir = tmp_path / "lessons"
+    root_dir.mkdir(parents=True)
+    lesson_dir = _write_valid_lesson(root_dir=root_dir, relative_dir="01-lesson-1", title="Cached")
+    parse_cache = LessonsParseCache(cache_dir=tmp_path / "parse-cache")
+    first_lessons = LessonsLoader(
+        root_dir=root_dir,
+        validator=LessonsContentValidator(),
+        parse_cache=parse_cache,
+    ).load()
+    parsed_files: list[str] = []
+    original_load = yaml.load
+
+    def _record_load(stream: str, Loader: type) -> object:  # noqa: N803
+        parsed_files.append(stream)
+        return original_load(stream=stream, Loader=Loader)
+
+    monkeypatch.setattr(yaml, "load", _record_load)
+    loader = LessonsLoader(root_dir=root_dir, validator=LessonsContentValidator(), parse_cache=parse_cache)
+
+    cached_lessons = loader.load()
+
+    assert parsed_files == []
+    assert cached_lessons == first_lessons
+
+    (lesson_dir / "lesson.yaml").write_text("title: Renamed lesson\n", encoding="utf-8")
+
+    reloaded_lessons = loader.load()
+
+    assert parsed_files == ["title: Renamed lesson\n"]
+    assert reloaded_lessons[0].name == "Renamed lesson"
@@ -0,0 +1,194 @@
+import copy
+from collections.abc import AsyncGenerator, Callable
+from contextlib import AbstractContextManager
+from pathlib import Path
+from uuid import UUID
+
+import httpx
+import pytest
+from sqlalchemy import func, select, text
+from sqlalchemy.exc import OperationalError
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession
+
+from main import app
+from src.app.core.db import SharedDatabaseEngine
+from src.app.core.dependencies import db
+from src.app.core.observability import QueryStats
+from src.app.core.observability.registry import DB_POOL_CHECKOUT_TIMEOUTS
+from src.app.core.security.auth_manager import AuthManager
+from src.app.domain.models.db import Base
+from src.app.domain.models.db.lesson import Lesson
+from src.app.domain.models.db.user import User
+from src.app.domain.models.enums.role import UserRole
+
+
+LESSON_ID = UUID("00000000-0000-0000-0000-000000000047")
+
+
+def build_sqlite_database(path: Path) -> SharedDatabaseEngine:
+    return SharedDatabaseEngine(
+        url=f"sqlite+aiosqlite:///{path}",
+        pool_size=1,
+        max_overflow=0,
+        pool_timeout_sec=0.05,
+        pool_recycle_sec=60,
+        pool_pre_ping=True,
+    )
+
+
+async def test_shared_engine_binds_session_factory_and_reports_pool(tmp_path: Path) -> None:
+    database = build_sqlite_database(path=tmp_path / "pool.db")
+
+    assert database.pool_status() == {}
+
+    engine = database.open()
+    assert database.open() is engine
+
+    async with database.session_factory() as session:
+        assert await session.scalar(text("SELECT 1")) == 1
+
+    assert database.pool_status() == {"checked_out": 0, "idle": 1, "overflow": 0, "size": 1, "limit": 1}
+
+    timeouts_before = DB_POOL_CHECKOUT_TIMEOUTS.values.get((), 0)
+
+    async with engine.connect():
+        assert database.pool_status()["checked_out"] == 1
+
+        with pytest.raises(PoolTimeoutError):
+            await engine.connect().start()
+
+    assert DB_POOL_CHECKOUT_TIMEOUTS.values[()] == timeouts_before + 1
+
+    await database.dispose()
+
+    assert not database.is_open
+
+
+async def test_read_endpoints_use_replica_and_writes_use_primary(
+        client: httpx.AsyncClient,
+        auth_manager: AuthManager,
+        tmp_path: Path,
+        monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    primary = build_sqlite_database(path=tmp_path / "primary.db")
+    replica = build_sqlite_database(path=tmp_path / "replica.db")
+
+    for database, name in ((primary, "Primary lesson"), (replica, "Replica lesson")):
+        async with database.open().begin() as conn:
+            await conn.run_sync(Base.metadata.create_all)
+
+        async with database.session_factory() as session:
+            session.add(Lesson(id=LESSON_ID, order="1", slug="lesson-1", name=name, body_markdown="body"))
+            await session.commit()
+
+    async with primary.session_factory() as session:
+        session.add(User(username="admin", hashed_password="hashed", role=UserRole.ADMIN))
+        await session.commit()
+
+    token = auth_manager.generate_jwt(input_data={"sub": "admin", "role": UserRole.ADMIN.value})
+
+    async def override_get_session() -> AsyncGenerator[AsyncSession]:
+        async with primary.session_factory() as session:
+            yield session
+
+    app.dependency_overrides[db.get_session] = override_get_session
+    monkeypatch.setattr(db, "DATABASE_REPLICA", replica)
+
+    read_response = await client.get("/api/v1/lessons/by_slug/lesson-1")
+    write_response = await client.post(
+        "/api/v1/lessons/create",
+        json={"name": "Lesson 2", "order": "2", "slug": "lesson-2", "body_markdown": "body"},
+        headers={"Authorization": f"Bearer {token}"},
+    )
+
+    assert read_response.json()["name"] == "Replica lesson"
+    assert write_response.status_code == 200
+
+    for database, expected_lessons in ((primary, 2), (replica, 1)):
+        async with database.session_factory() as session:
+            assert await session.scalar(select(func.count()).select_from(Lesson)) == expected_lessons
+
+        await database.dispose()
+
+
+async def test_caches_rebuilt_after_a_change_read_from_primary(
+        client: httpx.AsyncClient,
+        auth_manager: AuthManager,
+        tmp_path: Path,
+        monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    primary = build_sqlite_database(path=tmp_path / "primary.db")
+    replica = build_sqlite_database(path=tmp_path / "replica.db")
+
+    for database in (primary, replica):
+        async with database.open().begin() as conn:
+            await conn.run_sync(Base.metadata.create_all)
+
+        async with database.session_factory() as session:
+            session.add(Lesson(id=LESSON_ID, order="1", slug="lesson-1", name="Lesson 1", body_markdown="body"))
+            await session.commit()
+
+    async with primary.session_factory() as session:
+        session.add(User(username="admin", hashed_password="hashed", role=UserRole.ADMIN))
+        await session.commit()
+
+    headers = {
+        "Authorization": f"Bearer {auth_manager.generate_jwt(input_data={'sub': 'admin', 'role': 'admin'})}",
+    }
+
+    async def override_get_session() -> AsyncGenerator[AsyncSession]:
+        async with primary.session_factory() as session:
+            yield session
+
+    app.dependency_overrides[db.get_session] = override_get_session
+    monkeypatch.setattr(db, "DATABASE_REPLICA", replica)
+
+    warm_responses = [
+        await client.get(f"/api/v1/lessons/{LESSON_ID}"),
+        await client.get("/api/v1/lessons/search", params={"q": "lesson"}),
+        await client.get("/api/v1/users/me/progress/summary", headers=headers),
+    ]
+    # The replica has not caught up with either write yet.
+    update_response = await client.put(
+        f"/api/v1/lessons/{LESSON_ID}",
+        json={"name": "Lesson 1, edited"},
+        headers=headers,
+    )
+    create_response = await client.post(
+        "/api/v1/lessons/create",
+        json={"name": "Lesson 2", "order": "2", "slug": "lesson-2", "body_markdown": "body"},
+        headers=headers,
+    )
+
+    lesson_response = await client.get(f"/api/v1/lessons/{LESSON_ID}")
+    search_response = await client.get("/api/v1/lessons/search", params={"q": "lesson"})
+    summary_response = await client.get("/api/v1/users/me/progress/summary", headers=headers)
+
+    assert all(response.status_code == 200 for response in warm_responses)
+    assert (update_response.status_code, create_response.status_code) == (200, 200)
+    assert lesson_response.json()["name"] == "Lesson 1, edited"
+    assert {hit["name"] for hit in search_response.json()} == {"Lesson 1, edited", "Lesson 2"}
+    assert summary_response.json()["total"] == 2
+
+    for database in (primary, replica):
+        await database.dispose()
+
+
+async def test_query_tracker_leaves_no_state_on_connection_after_failed_statement(
+        async_engine: AsyncEngine,
+        count_queries: Callable[[], AbstractContextManager[QueryStats]],
+) -> None:
+    async with async_engine.connect() as conn:
+        info_before = copy.deepcopy(conn.info)
+
+        with pytest.raises(OperationalError):
+            await conn.execute(text("SELECT * FROM missing_table"))
+
+        with count_queries() as queries:
+            await conn.execute(text("SELECT 1"))
+
+        assert conn.info == info_before
+
+    assert queries.count == 1
+
@@ -1,14 +1,18 @@
 import json
+from uuid import uuid4
 
 import httpx
-from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession
 
 from main import app
+from src.app.core.dependencies.observability import get_execution_stage_timer
 from src.app.core.dependencies.services.code_analysis import get_code_analysis_service
 from src.app.core.dependencies.services.execution_rate_limiter import (
     get_execution_rate_limiter,
 )
 from src.app.core.dependencies.services.piston import get_piston_service
+from src.app.core.observability import HistogramFamily, StageTimer
 from src.app.domain.models.db.lesson import Lesson
 from src.app.domain.models.dto.execution.code_analysis_result import CodeAnalysisResultDTO
 from src.app.domain.models.dto.execution.runner_result import RunnerExecutionResultDTO
@@ -428,3 +432,76 @@ async def test_execution_runtime_error_without_stderr_is_invalid_output(
     assert response.status_code == 503
 
     app.dependency_overrides.pop(get_piston_service, None)
+
+
+async def test_execution_run_reports_stage_timings(
+        client: httpx.AsyncClient,
+        db_session: AsyncSession,
+) -> None:
+    lesson = Lesson(order="1", slug="lesson-1", name="Lesson 1", body_markdown="body", cases=CASES)
+    db_session.add(lesson)
+    await db_session.commit()
+    await db_session.refresh(lesson)
+
+    app.dependency_overrides[get_piston_service] = FakePistonService
+    request = {"lesson_id": str(lesson.id), "code": "class User: pass"}
+
+    untimed_response = await client.post("/api/v1/execute/run", json=request)
+
+    histograms = HistogramFamily(name="execution_stage_duration_ms", label_names=("stage",))
+    app.dependency_overrides[get_execution_stage_timer] = lambda: StageTimer(histograms=histograms)
+
+    timed_response = await client.post("/api/v1/execute/run", json=request)
+
+    assert "server-timing" not in untimed_response.headers
+    assert timed_response.status_code == 200
+    stages = [item.split(";")[0] for item in timed_response.headers["server-timing"].split(", ")]
+    assert stages == ["lesson_fetch", "validate", "build_source", "runner", "runner_wall", "parse"]
+    assert histograms.histograms[("runner_wall",)].sum == 5
+    assert all(histogram.count == 1 for histogram in histograms.histograms.values())
+
+
+async def test_execution_run_reports_stage_timings_on_errors(
+        client: httpx.AsyncClient,
+) -> None:
+    app.dependency_overrides[get_execution_stage_timer] = lambda: StageTimer(histograms=None)
+
+    response = await client.post(
+        "/api/v1/execute/run",
+        json={"lesson_id": str(uuid4()), "code": "class User: pass"},
+    )
+
+    assert response.status_code == 404
+    stages = [item.split(";")[0] for item in response.headers["server-timing"].split(", ")]
+    assert stages == ["lesson_fetch"]
+
+
+async def test_cached_anonymous_execution_checks_out_no_connection(
+        client: httpx.AsyncClient,
+        db_session: AsyncSession,
+        async_engine: AsyncEngine,
+) -> None:
+    lesson = Lesson(order="1", slug="lesson-1", name="Lesson 1", body_markdown="body", cases=CASES)
+    db_session.add(lesson)
+    await db_session.commit()
+    await db_session.refresh(lesson)
+
+    app.dependency_overrides[get_piston_service] = FakePistonService
+    request = {"lesson_id": str(lesson.id), "code": "class User: pass"}
+    checkouts = []
+
+    def count_checkout(*_args: object) -> None:
+        checkouts.append(1)
+
+    warm_response = await client.post("/api/v1/execute/run", json=request)
+    event.listen(async_engine.sync_engine.pool, "checkout", count_checkout)
+
+    try:
+        cached_response = await client.post("/api/v1/execute/run", json=request)
+    finally:
+        event.remove(async_engine.sync_engine.pool, "checkout", count_checkout)
+        app.dependency_overrides.pop(get_piston_service, None)
+
+    assert warm_response.status_code == 200
+    assert cached_response.json() == warm_response.json()
+    assert checkouts == []
@@ -0,0 +1,139 @@
+import asyncio
+import fcntl
+import os
+import threading
+from pathlib import Path
+from uuid import uuid4
+
+import pytest
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+from starlette.requests import Request
+
+from src.app.core.dependencies.security.execution import build_rate_limit_key
+from src.app.core.exceptions.execution_exc import ExecutionRateLimited
+from src.app.domain.models.dto.user import UserDTO
+from src.app.domain.models.enums.role import UserRole
+from src.app.domain.repositories.rate_limit_counter_repository import RateLimitCounterRepository
+from src.app.domain.services.execution_rate_limiter import ExecutionRateLimiter
+from src.app.domain.services.rate_limit_backend import (
+    DatabaseRateLimitBackend,
+    InMemoryRateLimitBackend,
+    SharedMemoryRateLimitBackend,
+)
+
+
+def _build_request(host: str) -> Request:
+    return Request(scope={"type": "http", "client": (host, 1234), "headers": []})
+
+
+async def test_in_memory_limiter_rejects_over_limit() -> None:
+    limiter = ExecutionRateLimiter(max_requests=2, window_sec=3600, backend=InMemoryRateLimitBackend())
+
+    await limiter.check(key="ip:1.1.1.1")
+    await limiter.check(key="ip:1.1.1.1")
+
+    with pytest.raises(ExecutionRateLimited):
+        await limiter.check(key="ip:1.1.1.1")
+
+    await limiter.check(key="ip:2.2.2.2")
+
+
+async def test_limiter_counts_previous_window_after_boundary(monkeypatch: pytest.MonkeyPatch) -> None:
+    limiter = ExecutionRateLimiter(max_requests=2, window_sec=60, backend=InMemoryRateLimitBackend())
+
+    monkeypatch.setattr("time.time", lambda: 119.0)
+    await limiter.check(key="ip:1.1.1.1")
+    await limiter.check(key="ip:1.1.1.1")
+
+    monkeypatch.setattr("time.time", lambda: 121.0)
+    with pytest.raises(ExecutionRateLimited):
+        await limiter.check(key="ip:1.1.1.1")
+
+    monkeypatch.setattr("time.time", lambda: 181.0)
+    await limiter.check(key="ip:1.1.1.1")
+
+
+async def test_shared_memory_backend_counts_across_instances(tmp_path: Path) -> None:
+    path = tmp_path / "rate-limit.bin"
+    first_worker = SharedMemoryRateLimitBackend(path=path, slots=64)
+    second_worker = SharedMemoryRateLimitBackend(path=path, slots=64)
+
+    assert await first_worker.hit(key="user:a", window_sec=3600) == 1
+    assert await second_worker.hit(key="user:a", window_sec=3600) == 2
+    assert await first_worker.hit(key="user:a", window_sec=3600) == 3
+    assert await second_worker.hit(key="user:b", window_sec=3600) == 1
+
+    first_worker.close()
+    second_worker.close()
+
+
+async def test_shared_memory_backend_reuses_slots_when_table_is_full(tmp_path: Path) -> None:
+    backend = SharedMemoryRateLimitBackend(path=tmp_path / "rate-limit.bin", slots=4)
+
+    for index in range(10):
+        assert await backend.hit(key=f"ip:{index}", window_sec=3600) == 1
+
+    backend.close()
+
+
+def _lock_file_briefly(path: Path) -> threading.Timer:
+    fd = os.open(path, os.O_RDWR)
+    fcntl.flock(fd, fcntl.LOCK_EX)
+    release = threading.Timer(0.3, lambda: os.close(fd))
+    release.start()
+
+    return release
+
+
+async def test_shared_memory_backend_waits_for_lock_off_the_loop(tmp_path: Path) -> None:
+    path = tmp_path / "rate-limit.bin"
+    backend = SharedMemoryRateLimitBackend(path=path, slots=64)
+    release = _lock_file_briefly(path=path)
+    ticks = 0
+
+    async def tick() -> None:
+        nonlocal ticks
+        while True:
+            ticks += 1
+            await asyncio.sleep(0.01)
+
+    ticker = asyncio.create_task(tick())
+    assert await backend.hit(key="user:a", window_sec=3600) == 1
+    ticker.cancel()
+    release.join()
+    backend.close()
+
+    assert ticks > 5
+
+
+async def test_database_backend_counts_with_upsert(
+        session_factory: async_sessionmaker[AsyncSession],
+) -> None:
+    backend = DatabaseRateLimitBackend(session_factory=session_factory)
+    key = f"user:{uuid4()}"
+
+    assert await backend.hit(key=key, window_sec=3600) == 1
+    assert await backend.hit(key=key, window_sec=3600) == 2
+
+
+async def test_database_counter_resets_on_new_window(
+        session_factory: async_sessionmaker[AsyncSession],
+) -> None:
+    key = f"user:{uuid4()}"
+
+    async with session_factory() as session:
+        repository = RateLimitCounterRepository(session=session)
+
+        assert await repository.increment(key=key, window_index=10) == (1, 0)
+        assert await repository.increment(key=key, window_index=10) == (2, 0)
+        assert await repository.increment(key=key, window_index=11) == (1, 2)
+        assert await repository.increment(key=key, window_index=13) == (1, 0)
+        await session.commit()
+
+
+def test_rate_limit_key_prefers_user_id() -> None:
+    user = UserDTO(id=uuid4(), username="alice", email=None, role=UserRole.USER)
+    request = _build_request(host="10.0.0.1")
+
+    assert build_rate_limit_key(request=request, user=user) == f"user:{user.id}"
+    assert build_rate_limit_key(request=request, user=None) == "ip:10.0.0.1"
@@ -1,5 +1,10 @@
 from __future__ import annotations
 
+import asyncio
+import contextlib
+from collections.abc import AsyncGenerator
+
+import httpx
 import pytest
 from sqlalchemy.ext.asyncio import AsyncSession
 
@@ -26,43 +31,34 @@ class FakeAuthManager:
         return "jwt-token"
 
 
-class FakeResponse:
-    def __init__(self, status_code: int, payload: object | None) -> None:
-        self.status_code = status_code
-        self._payload = payload
-
-    def json(self) -> object:
-        if self._payload is None:
-            message = "invalid json"
-            raise ValueError(message)
-
-        return self._payload
-
+class FakeGithub:
+    def __init__(self) -> None:
+        self.responses: dict[tuple[str, str], tuple[int, object]] = {}
+        self.in_flight = 0
+        self.peak_in_flight = 0
+        self.hold_until_in_flight: int | None = None
+        self.all_in_flight = asyncio.Event()
+        self.client = httpx.AsyncClient(transport=httpx.MockTransport(handler=self._handle))
 
-class FakeClient:
-    def __init__(self, responses: dict[tuple[str, str], FakeResponse]) -> None:
-        self.responses = responses
+    async def _handle(self, request: httpx.Request) -> httpx.Response:
+        url = str(request.url.copy_with(query=None))
+        status_code, payload = self.responses[(request.method, url)]
 
-    async def post(self, url: str, *, data: dict, headers: dict) -> FakeResponse:
-        _ = (data, headers)
+        self.in_flight += 1
+        self.peak_in_flight = max(self.peak_in_flight, self.in_flight)
 
-        return self.responses[("POST", url)]
+        try:
+            if self.hold_until_in_flight is not None and request.method == "GET":
+                if self.in_flight >= self.hold_until_in_flight:
+                    self.all_in_flight.set()
 
-    async def get(self, url: str, *, headers: dict) -> FakeResponse:
-        _ = headers
+                # Sequential requests never reach the target, so do not hang on them.
+                with contextlib.suppress(TimeoutError):
+                    await asyncio.wait_for(self.all_in_flight.wait(), timeout=1.0)
+        finally:
+            self.in_flight -= 1
 
-        return self.responses[("GET", url)]
-
-    async def __aenter__(self) -> FakeClient:
-        return self
-
-    async def __aexit__(
-            self,
-            _exc_type: type[BaseException] | None,
-            _exc: BaseException | None,
-            _tb: object | None,
-    ) -> None:
-        return None
+        return httpx.Response(status_code=status_code, json=payload)
 
 
 @pytest.fixture
@@ -78,41 +74,44 @@ def configured_settings(monkeypatch: pytest.MonkeyPatch) -> None:
     monkeypatch.setattr(settings.github, "allow_signup", True)
 
 
-def _install_fake_client(
-        monkeypatch: pytest.MonkeyPatch,
-        responses: dict[tuple[str, str], FakeResponse],
-) -> None:
-    monkeypatch.setattr(
-        "src.app.domain.services.github_oauth_service.httpx.AsyncClient",
-        lambda **_: FakeClient(responses),
+@pytest.fixture
+async def fake_github() -> AsyncGenerator[FakeGithub]:
+    github = FakeGithub()
+
+    yield github
+
+    await github.client.aclose()
+
+
+def _install_success_responses(github: FakeGithub, github_id: int, *, verified: bool = True) -> None:
+    github.responses = {
+        ("POST", settings.github.token_url): (200, {"access_token": "token"}),
+        ("GET", settings.github.user_url): (200, {"id": github_id, "login": "octo"}),
+        ("GET", settings.github.emails_url): (
+            200,
+            [{"email": "octo@example.com", "primary": True, "verified": verified}],
+        ),
+    }
+
+
+def _build_service(repository: UserRepository, github: FakeGithub) -> GithubOAuthService:
+    return GithubOAuthService(
+        user_repository=repository,
+        auth_manager=FakeAuthManager(),
+        http_client=github.client,
     )
 
 
 async def test_github_oauth_authenticate_success(
         configured_settings: None,
         db_session: AsyncSession,
-        monkeypatch: pytest.MonkeyPatch,
+        fake_github: FakeGithub,
 ) -> None:
     _ = configured_settings
-
-    responses = {
-        ("POST", settings.github.token_url): FakeResponse(
-            status_code=200,
-            payload={"access_token": "token"},
-        ),
-        ("GET", settings.github.user_url): FakeResponse(
-            status_code=200,
-            payload={"id": 123, "login": "octo"},
-        ),
-        ("GET", settings.github.emails_url): FakeResponse(
-            status_code=200,
-            payload=[{"email": "octo@example.com", "primary": True, "verified": True}],
-        ),
-    }
-    _install_fake_client(monkeypatch, responses)
+    _install_success_responses(github=fake_github, github_id=123)
 
     repository = UserRepository(session=db_session)
-    service = GithubOAuthService(user_repository=repository, auth_manager=FakeAuthManager())
+    service = _build_service(repository=repository, github=fake_github)
     token = await service.authenticate(code="code", code_verifier="verifier")
 
     assert token == "jwt-token"
@@ -121,10 +120,26 @@ async def test_github_oauth_authenticate_success(
     assert created.username == "octo"
 
 
+async def test_github_oauth_fetches_user_and_email_concurrently(
+        configured_settings: None,
+        db_session: AsyncSession,
+        fake_github: FakeGithub,
+) -> None:
+    _ = configured_settings
+    fake_github.hold_until_in_flight = 2
+    _install_success_responses(github=fake_github, github_id=321)
+
+    service = _build_service(repository=UserRepository(session=db_session), github=fake_github)
+    await service.authenticate(code="code", code_verifier="verifier")
+
+    assert fake_github.all_in_flight.is_set()
+    assert fake_github.peak_in_flight == 2
+
+
 async def test_github_oauth_account_conflict(
         configured_settings: None,
         db_session: AsyncSession,
-        monkeypatch: pytest.MonkeyPatch,
+        fake_github: FakeGithub,
 ) -> None:
     _ = configured_settings
 
@@ -138,24 +153,8 @@ async def test_github_oauth_account_conflict(
     db_session.add(existing)
     await db_session.commit()
 
-    responses = {
-        ("POST", settings.github.token_url): FakeResponse(
-            status_code=200,
-            payload={"access_token": "token"},
-        ),
-        ("GET", settings.github.user_url): FakeResponse(
-            status_code=200,
-            payload={"id": 999, "login": "octo"},
-        ),
-        ("GET", settings.github.emails_url): FakeResponse(
-            status_code=200,
-            payload=[{"email": "octo@example.com", "primary": True, "verified": True}],
-        ),
-    }
-    _install_fake_client(monkeypatch, responses)
-
-    repository = UserRepository(session=db_session)
-    service = GithubOAuthService(user_repository=repository, auth_manager=FakeAuthManager())
+    _install_success_responses(github=fake_github, github_id=999)
+    service = _build_service(repository=UserRepository(session=db_session), github=fake_github)
 
     with pytest.raises(OAuthAccountConflict):
         await service.authenticate(code="code", code_verifier="verifier")
@@ -164,28 +163,12 @@ async def test_github_oauth_account_conflict(
 async def test_github_oauth_email_not_verified(
         configured_settings: None,
         db_session: AsyncSession,
-        monkeypatch: pytest.MonkeyPatch,
+        fake_github: FakeGithub,
 ) -> None:
     _ = configured_settings
+    _install_success_responses(github=fake_github, github_id=456, verified=False)
 
-    responses = {
-        ("POST", settings.github.token_url): FakeResponse(
-            status_code=200,
-            payload={"access_token": "token"},
-        ),
-        ("GET", settings.github.user_url): FakeResponse(
-            status_code=200,
-            payload={"id": 456, "login": "octo"},
-        ),
-        ("GET", settings.github.emails_url): FakeResponse(
-            status_code=200,
-            payload=[{"email": "octo@example.com", "primary": True, "verified": False}],
-        ),
-    }
-    _install_fake_client(monkeypatch, responses)
-
-    repository = UserRepository(session=db_session)
-    service = GithubOAuthService(user_repository=repository, auth_manager=FakeAuthManager())
+    service = _build_service(repository=UserRepository(session=db_session), github=fake_github)
 
     with pytest.raises(OAuthEmailNotVerifiedError):
         await service.authenticate(code="code", code_verifier="verifier")
@@ -201,34 +184,32 @@ async def test_github_oauth_email_not_verified(
 async def test_github_oauth_token_errors(
         configured_settings: None,
         db_session: AsyncSession,
-        monkeypatch: pytest.MonkeyPatch,
+        fake_github: FakeGithub,
         status_code: int,
         payload: dict,
         expected_exc: type[Exception],
 ) -> None:
     _ = configured_settings
-    responses = {
-        ("POST", settings.github.token_url): FakeResponse(
-            status_code=status_code,
-            payload=payload,
-        ),
+    fake_github.responses = {
+        ("POST", settings.github.token_url): (status_code, payload),
     }
-    _install_fake_client(monkeypatch, responses)
 
-    repository = UserRepository(session=db_session)
-    service = GithubOAuthService(user_repository=repository, auth_manager=FakeAuthManager())
+    service = _build_service(repository=UserRepository(session=db_session), github=fake_github)
 
     with pytest.raises(expected_exc):
         await service.authenticate(code="code", code_verifier="verifier")
 
 
-def test_github_oauth_missing_config(monkeypatch: pytest.MonkeyPatch) -> None:
+async def test_github_oauth_missing_config(
+        monkeypatch: pytest.MonkeyPatch,
+        fake_github: FakeGithub,
+) -> None:
     monkeypatch.setattr(settings.github, "client_id", None)
     monkeypatch.setattr(settings.github, "client_secret", None)
     monkeypatch.setattr(settings.github, "redirect_uri", None)
 
     with pytest.raises(OAuthConfigError):
-        GithubOAuthService(
-            user_repository=UserRepository(session=None),
-            auth_manager=FakeAuthManager(),
+        _build_service(
+            repository=UserRepository(session=None),
+            github=fake_github,
         ).build_authorize_url(state="state", code_challenge="challenge")
@@ -0,0 +1,63 @@
+from src.app.content.markdown import highlight_python, render_markdown
+
+
+def test_render_markdown_renders_lesson_blocks() -> None:
+    source = "\n".join(
+        [
+            "## Fields",
+            "",
+            "Use `Field(gt=0)` with **care**,",
+            "see [docs](https://docs.pydantic.dev).",
+            "",
+            "1. first",
+            "2. second",
+            "",
+            "> note",
+            "",
+            "```python",
+            "def f(): return 1",
+            "```",
+            "",
+            "```expected",
+            "a < b",
+            "```",
+        ],
+    )
+
+    assert render_markdown(source=source) == "\n".join(
+        [
+            "<h2>Fields</h2>",
+            "<p>Use <code>Field(gt=0)</code> with <strong>care</strong>,",
+            'see <a href="https://docs.pydantic.dev">docs</a>.</p>',
+            "<ol>",
+            "<li>first</li>",
+            "<li>second</li>",
+            "</ol>",
+            "<blockquote>",
+            "<p>note</p>",
+            "</blockquote>",
+            '<pre><code class="hljs language-python"><span class="hljs-keyword">def</span> '
+            '<span class="hljs-title">f</span>(): <span class="hljs-keyword">return</span> '
+            '<span class="hljs-number">1</span></code></pre>',
+            '<div class="callout"><p>Expected output:</p><pre><code>a &lt; b</code></pre></div>',
+        ],
+    )
+
+
+def test_render_markdown_escapes_html_and_unsafe_links() -> None:
+    rendered = render_markdown(source='<img src=x onerror="alert(1)"> [click](javascript:void) `<b>`')
+
+    assert "<img" not in rendered
+    assert "javascript" not in rendered
+    assert rendered == (
+        "<p>&lt;img src=x onerror=\"alert(1)\"&gt; click <code>&lt;b&gt;</code></p>"
+    )
+
+
+def test_highlight_python_keeps_strings_and_comments_whole() -> None:
+    highlighted = highlight_python(code='x = "# not a comment"  # if <b>')
+
+    assert highlighted == (
+        'x = <span class="hljs-string">"# not a comment"</span>  '
+        '<span class="hljs-comment"># if &lt;b&gt;</span>'
+    )
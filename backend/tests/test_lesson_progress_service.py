@@ -1,5 +1,10 @@
-from sqlalchemy import func, select
-from sqlalchemy.ext.asyncio import AsyncSession
+import asyncio
+from uuid import uuid4
+
+import pytest
+from sqlalchemy import event, func, select, text
+from sqlalchemy.engine import Connection
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
 
 from src.app.domain.models.db.lesson import Lesson
 from src.app.domain.models.db.lesson_progress import LessonProgress
@@ -7,6 +12,7 @@ from src.app.domain.models.db.user import User
 from src.app.domain.models.enums.role import UserRole
 from src.app.domain.repositories.lesson_progress_repository import LessonProgressRepository
 from src.app.domain.services.lesson_progress_service import LessonProgressService
+from src.app.domain.services.progress_write_queue import ProgressWriteQueue
 
 
 async def _create_user(db_session: AsyncSession, username: str) -> User:
@@ -52,6 +58,29 @@ async def test_mark_completed_is_idempotent(db_session: AsyncSession) -> None:
     assert count == 1
 
 
+async def test_mark_completed_uses_single_statement(db_session: AsyncSession) -> None:
+    repository = LessonProgressRepository(session=db_session)
+    service = LessonProgressService(progress_repository=repository)
+    user = await _create_user(db_session=db_session, username="progress_user")
+    lesson = await _create_lesson(db_session=db_session, order="1", slug="lesson-1")
+    await service.mark_completed(user_id=user.id, lesson_id=lesson.id)
+    statements: list[str] = []
+
+    def _record(_conn: Connection, _cursor: object, statement: str, *_args: object) -> None:
+        statements.append(statement)
+
+    sync_engine = db_session.get_bind()
+    event.listen(sync_engine, "before_cursor_execute", _record)
+
+    try:
+        await service.mark_completed(user_id=user.id, lesson_id=lesson.id)
+    finally:
+        event.remove(sync_engine, "before_cursor_execute", _record)
+
+    assert len(statements) == 1
+    assert statements[0].startswith("INSERT INTO lesson_progress")
+
+
 async def test_get_completed_lesson_ids_returns_only_requested_user(db_session: AsyncSession) -> None:
     repository = LessonProgressRepository(session=db_session)
     service = LessonProgressService(progress_repository=repository)
@@ -86,3 +115,142 @@ async def test_reset_progress_deletes_only_requested_user_rows(db_session: Async
     assert deleted == 1
     assert user_1_ids == []
     assert user_2_ids == [lesson_2.id]
+
+
+async def _count_progress_rows(session_factory: async_sessionmaker[AsyncSession]) -> int:
+    async with session_factory() as session:
+        return await session.scalar(select(func.count(LessonProgress.id))) or 0
+
+
+async def test_write_behind_overlays_pending_progress_until_flush(
+        db_session: AsyncSession,
+        session_factory: async_sessionmaker[AsyncSession],
+) -> None:
+    queue = ProgressWriteQueue(session_factory=session_factory, flush_interval_ms=60_000, max_batch=100)
+    service = LessonProgressService(
+        progress_repository=LessonProgressRepository(session=db_session),
+        write_queue=queue,
+    )
+    user = await _create_user(db_session=db_session, username="progress_user")
+    lesson = await _create_lesson(db_session=db_session, order="1", slug="lesson-1")
+    queue.start()
+
+    await service.record_completion(user_id=user.id, lesson_id=lesson.id)
+    await service.record_completion(user_id=user.id, lesson_id=lesson.id)
+
+    assert await _count_progress_rows(session_factory=session_factory) == 0
+    assert await service.get_completed_lesson_ids(user_id=user.id) == [lesson.id]
+
+    await queue.stop()
+
+    assert await _count_progress_rows(session_factory=session_factory) == 1
+    assert queue.pending_for(user_id=user.id) == set()
+
+
+async def test_write_behind_flushes_full_batch_and_skips_missing_lessons(
+        db_session: AsyncSession,
+        session_factory: async_sessionmaker[AsyncSession],
+        caplog: pytest.LogCaptureFixture,
+) -> None:
+    await db_session.execute(text("PRAGMA foreign_keys=ON"))
+    queue = ProgressWriteQueue(session_factory=session_factory, flush_interval_ms=60_000, max_batch=2)
+    user = await _create_user(db_session=db_session, username="progress_user")
+    lesson = await _create_lesson(db_session=db_session, order="1", slug="lesson-1")
+    queue.start()
+
+    queue.enqueue(user_id=user.id, lesson_id=lesson.id)
+    queue.enqueue(user_id=user.id, lesson_id=uuid4())
+
+    for _ in range(100):
+        if not queue.pending_for(user_id=user.id):
+            break
+        await asyncio.sleep(0.01)
+
+    await queue.stop()
+    await db_session.execute(text("PRAGMA foreign_keys=OFF"))
+
+    assert await _count_progress_rows(session_factory=session_factory) == 1
+    assert "Dropping progress" in caplog.text
+
+
+async def test_reset_progress_drops_pending_write_behind_rows(
+        db_session: AsyncSession,
+        session_factory: async_sessionmaker[AsyncSession],
+) -> None:
+    queue = ProgressWriteQueue(session_factory=session_factory, flush_interval_ms=60_000, max_batch=100)
+    service = LessonProgressService(
+        progress_repository=LessonProgressRepository(session=db_session),
+        write_queue=queue,
+    )
+    user = await _create_user(db_session=db_session, username="progress_user")
+    lesson = await _create_lesson(db_session=db_session, order="1", slug="lesson-1")
+    queue.start()
+
+    await service.record_completion(user_id=user.id, lesson_id=lesson.id)
+    await service.reset_progress(user_id=user.id)
+    await queue.stop()
+
+    assert await service.get_completed_lesson_ids(user_id=user.id) == []
+
+
+async def test_write_behind_stop_keeps_batch_that_is_being_written(
+        db_session: AsyncSession,
+        session_factory: async_sessionmaker[AsyncSession],
+        monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    queue = ProgressWriteQueue(session_factory=session_factory, flush_interval_ms=60_000, max_batch=1)
+    user = await _create_user(db_session=db_session, username="progress_user")
+    lesson = await _create_lesson(db_session=db_session, order="1", slug="lesson-1")
+    write_started = asyncio.Event()
+    release_write = asyncio.Event()
+    original_write = queue._write
+
+    async def _blocked_write(pairs: list[tuple]) -> None:
+        write_started.set()
+        await release_write.wait()
+        await original_write(pairs=pairs)
+
+    monkeypatch.setattr(queue, "_write", _blocked_write)
+    queue.start()
+    queue.enqueue(user_id=user.id, lesson_id=lesson.id)
+    await asyncio.wait_for(write_started.wait(), timeout=1)
+
+    stop_task = asyncio.create_task(queue.stop())
+    await asyncio.sleep(0.01)
+    release_write.set()
+    await stop_task
+
+    assert await _count_progress_rows(session_factory=session_factory) == 1
+
+
+async def test_write_behind_requeues_batch_when_write_is_cancelled(
+        db_session: AsyncSession,
+        session_factory: async_sessionmaker[AsyncSession],
+        monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    queue = ProgressWriteQueue(session_factory=session_factory, flush_interval_ms=60_000, max_batch=100)
+    user = await _create_user(db_session=db_session, username="progress_user")
+    lesson = await _create_lesson(db_session=db_session, order="1", slug="lesson-1")
+    write_started = asyncio.Event()
+    original_write = queue._write
+
+    async def _hanging_write(pairs: list[tuple]) -> None:
+        _ = pairs
+        write_started.set()
+        await asyncio.Event().wait()
+
+    monkeypatch.setattr(queue, "_write", _hanging_write)
+    queue.enqueue(user_id=user.id, lesson_id=lesson.id)
+    flush_task = asyncio.create_task(queue.flush())
+    await asyncio.wait_for(write_started.wait(), timeout=1)
+    flush_task.cancel()
+
+    with pytest.raises(asyncio.CancelledError):
+        await flush_task
+
+    assert queue.pending_for(user_id=user.id) == {lesson.id}
+
+    monkeypatch.setattr(queue, "_write", original_write)
+    await queue.flush()
+
+    assert await _count_progress_rows(session_factory=session_factory) == 1
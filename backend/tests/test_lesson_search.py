@@ -0,0 +1,148 @@
+import asyncio
+from uuid import UUID, uuid4
+
+import httpx
+import pytest
+
+from src.app.domain.models.dto.lesson import LessonSearchDocumentDTO
+from src.app.domain.services.lesson_search_index import LessonSearchIndex, LessonSearchIndexCache
+
+
+def _document(name: str, body: str, prompts: list[str] | None = None) -> LessonSearchDocumentDTO:
+    return LessonSearchDocumentDTO(
+        id=uuid4(),
+        order="1",
+        slug=name.lower().replace(" ", "-"),
+        name=name,
+        body_markdown=body,
+        question_prompts=prompts or [],
+    )
+
+
+class FlakySearchRepository:
+    def __init__(self, documents: list[LessonSearchDocumentDTO]) -> None:
+        self.documents = {document.id: document for document in documents}
+        self.failures = 0
+
+    async def get_search_documents(self, ids: list[UUID] | None = None) -> list[LessonSearchDocumentDTO]:
+        if self.failures:
+            self.failures -= 1
+            message = "database unavailable"
+            raise ConnectionError(message)
+
+        return [document for lesson_id, document in self.documents.items() if ids is None or lesson_id in ids]
+
+
+def test_search_index_ranks_with_bm25_and_prefixes() -> None:
+    index = LessonSearchIndex()
+    validators = _document(name="Field validators", body="Validators run after parsing.")
+    serialization = _document(name="Serialization", body="Dump models; `field_serializer` can use validators too.")
+    unrelated = _document(name="Dataclasses", body="Plain containers.", prompts=["What is a dataclass?"])
+    for document in (validators, serialization, unrelated):
+        index.upsert(document=document)
+
+    hits = index.search(query="validators", limit=10)
+
+    assert [hit.id for hit in hits] == [validators.id, serialization.id]
+    assert hits[0].score > hits[1].score
+    assert hits[0].snippet == "<mark>Validators</mark> run after parsing."
+    assert [hit.id for hit in index.search(query="datacl", limit=10)] == [unrelated.id]
+    assert index.search(query="nothing here", limit=10) == []
+
+
+def test_search_index_replaces_and_removes_documents() -> None:
+    index = LessonSearchIndex()
+    documents = [_document(name=f"Lesson {number}", body=f"topic{number}") for number in range(40)]
+    for document in documents:
+        index.upsert(document=document)
+
+    index.upsert(document=documents[0].model_copy(update={"body_markdown": "rewritten"}))
+    for document in documents[1:30]:
+        index.remove(lesson_id=document.id)
+
+    assert len(index) == 11
+    assert index.search(query="topic0", limit=10) == []
+    assert [hit.id for hit in index.search(query="rewritten", limit=10)] == [documents[0].id]
+    assert [hit.id for hit in index.search(query="topic35", limit=10)] == [documents[35].id]
+    assert index.search(query="topic5", limit=10) == []
+
+
+def test_highlighted_snippet_is_escaped() -> None:
+    index = LessonSearchIndex()
+    index.upsert(document=_document(name="Unions", body="Use <b>int | str</b> for unions of types."))
+
+    hits = index.search(query="unions", limit=1)
+
+    assert hits[0].snippet == "Use &lt;b&gt;int | str&lt;/b&gt; for <mark>unions</mark> of types."
+
+
+async def test_search_index_cache_keeps_queued_changes_when_a_read_fails() -> None:
+    document = _document(name="Validators", body="Validators run after parsing.")
+    repository = FlakySearchRepository(documents=[document])
+    cache = LessonSearchIndexCache(ttl_sec=60)
+
+    repository.failures = 1
+    with pytest.raises(ConnectionError):
+        await cache.get(repository=repository)
+    index = await cache.get(repository=repository)
+    assert [hit.id for hit in index.search(query="validators", limit=10)] == [document.id]
+
+    repository.documents[document.id] = document.model_copy(update={"body_markdown": "Rewritten theory."})
+    cache.invalidate(lesson_ids=[document.id])
+    repository.failures = 1
+    with pytest.raises(ConnectionError):
+        await cache.get(repository=repository)
+    index = await cache.get(repository=repository)
+
+    assert [hit.id for hit in index.search(query="rewritten", limit=10)] == [document.id]
+
+
+async def test_search_index_cache_rebuilds_after_ttl() -> None:
+    document = _document(name="Validators", body="Validators run after parsing.")
+    repository = FlakySearchRepository(documents=[document])
+    cache = LessonSearchIndexCache(ttl_sec=0.05)
+    await cache.get(repository=repository)
+
+    # Another worker rewrites the lesson; its change notification never reaches this cache.
+    repository.documents[document.id] = document.model_copy(update={"body_markdown": "Rewritten theory."})
+    index = await cache.get(repository=repository)
+    assert index.search(query="rewritten", limit=10) == []
+
+    await asyncio.sleep(0.06)
+    index = await cache.get(repository=repository)
+
+    assert [hit.id for hit in index.search(query="rewritten", limit=10)] == [document.id]
+
+
+async def test_search_endpoint_follows_lesson_changes(
+        client: httpx.AsyncClient,
+        admin_headers: dict[str, str],
+) -> None:
+    created = []
+    for order, name in (("1", "Strict mode"), ("2", "Custom types")):
+        response = await client.post(
+            "/api/v1/lessons/create",
+            json={"name": name, "order": order, "slug": f"lesson-{order}", "body_markdown": f"About {name}."},
+            headers=admin_headers,
+        )
+        created.append(response.json())
+
+    strict_hits = await client.get("/api/v1/lessons/search", params={"q": "stri"})
+
+    assert strict_hits.status_code == 200
+    assert [hit["slug"] for hit in strict_hits.json()] == ["lesson-1"]
+
+    await client.put(
+        f"/api/v1/lessons/{created[1]['id']}",
+        json={"body_markdown": "Annotated types can be strict as well."},
+        headers=admin_headers,
+    )
+    await client.delete(f"/api/v1/lessons/{created[0]['id']}", headers=admin_headers)
+    updated_hits = (await client.get("/api/v1/lessons/search", params={"q": "strict"})).json()
+
+    assert [hit["slug"] for hit in updated_hits] == ["lesson-2"]
+    assert "<mark>strict</mark>" in updated_hits[0]["snippet"]
+
+    invalid_response = await client.get("/api/v1/lessons/search", params={"q": ""})
+
+    assert invalid_response.status_code == 422
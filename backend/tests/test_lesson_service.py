@@ -0,0 +1,136 @@
+import asyncio
+from uuid import UUID
+
+import pytest
+from sqlalchemy import event, insert
+from sqlalchemy.engine import Connection
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.app.core.cache import LessonCache
+from src.app.core.exceptions.lesson_exc import LessonOrderInvalid, LessonSlugConflict
+from src.app.domain.models.db.lesson import Lesson
+from src.app.domain.models.dto.lesson import CreateLessonDTO
+from src.app.domain.repositories.lesson_repository import LessonRepository
+from src.app.domain.services.lesson_order_index import LessonOrderIndexCache
+from src.app.domain.services.lesson_service import LessonService
+
+LESSON_COUNT = 10_000
+
+
+def _lesson_payload(order: str, slug: str) -> CreateLessonDTO:
+    return CreateLessonDTO(
+        name=f"Lesson {order}",
+        order=order,
+        slug=slug,
+        body_markdown="body",
+        code_editor_default="",
+        cases=[],
+    )
+
+
+async def test_order_check_reads_only_the_order_key_at_10k_lessons(db_session: AsyncSession) -> None:
+    await db_session.execute(
+        insert(Lesson),
+        [
+            {"order": str(index), "slug": f"lesson-{index}", "body_markdown": "x" * 2_000}
+            for index in range(1, LESSON_COUNT + 1)
+        ],
+    )
+    await db_session.commit()
+    service = LessonService(lesson_repository=LessonRepository(session=db_session))
+    statements: list[str] = []
+
+    def _record(_conn: Connection, _cursor: object, statement: str, *_args: object) -> None:
+        statements.append(statement)
+
+    sync_engine = db_session.get_bind()
+    event.listen(sync_engine, "before_cursor_execute", _record)
+
+    try:
+        with pytest.raises(LessonOrderInvalid):
+            await service.create(schema=_lesson_payload(order="5000", slug="new-lesson"))
+    finally:
+        event.remove(sync_engine, "before_cursor_execute", _record)
+
+    order_statements = [statement for statement in statements if "lessons.\"order\" =" in statement]
+
+    assert len(statements) == 2
+    assert len(order_statements) == 1
+    assert order_statements[0].startswith("SELECT lessons.id \nFROM lessons")
+    assert "body_markdown" not in order_statements[0]
+
+
+async def test_create_reports_unique_index_races_as_conflicts(
+        db_session: AsyncSession,
+        monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    service = LessonService(lesson_repository=LessonRepository(session=db_session))
+    await service.create(schema=_lesson_payload(order="1", slug="lesson-1"))
+    original_validate_slug = service._validate_slug_unique
+    slug_checks = 0
+
+    async def _validate_order(order: str, exclude_id: object) -> None:
+        _ = order, exclude_id
+
+    async def _validate_slug_after_race(slug: str, exclude_id: object) -> None:
+        nonlocal slug_checks
+        slug_checks += 1
+
+        if slug_checks > 1:
+            await original_validate_slug(slug=slug, exclude_id=exclude_id)
+
+    # Checks that ran before a concurrent writer committed the same values.
+    monkeypatch.setattr(service, "_validate_order", _validate_order)
+    monkeypatch.setattr(service, "_validate_slug_unique", _validate_slug_after_race)
+
+    with pytest.raises(LessonOrderInvalid):
+        await service.create(schema=_lesson_payload(order="1", slug="lesson-2"))
+
+    slug_checks = 0
+
+    with pytest.raises(LessonSlugConflict):
+        await service.create(schema=_lesson_payload(order="2", slug="lesson-1"))
+
+    assert slug_checks == 2
+
+
+async def test_get_by_id_does_not_cache_lesson_changed_during_miss(
+        db_session: AsyncSession,
+        monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    repository = LessonRepository(session=db_session)
+    lesson_cache = LessonCache(max_size=10, ttl_sec=60)
+    service = LessonService(lesson_repository=repository, lesson_cache=lesson_cache)
+    lesson = await service.create(schema=_lesson_payload(order="1", slug="lesson-1"))
+    original_get = repository.get
+
+    async def _get_then_change(id: UUID) -> Lesson | None:
+        loaded = await original_get(id=id)
+        # A write to the lesson commits while the miss is being loaded.
+        lesson_cache.invalidate(lesson_ids=[id])
+        return loaded
+
+    monkeypatch.setattr(repository, "get", _get_then_change)
+
+    loaded = await service.get_by_id(id=lesson.id)
+
+    assert loaded.id == lesson.id
+    assert lesson_cache.get(lesson_id=lesson.id) is None
+
+
+async def test_order_index_cache_expires_changes_from_other_workers(db_session: AsyncSession) -> None:
+    repository = LessonRepository(session=db_session)
+    cache = LessonOrderIndexCache(ttl_sec=0.05)
+    service = LessonService(lesson_repository=repository, lesson_cache=LessonCache(max_size=10, ttl_sec=60))
+    await service.create(schema=_lesson_payload(order="1", slug="lesson-1"))
+
+    assert len((await cache.get(repository=repository)).entries) == 1
+
+    # Another worker adds a lesson; its change notification never reaches this cache.
+    await service.create(schema=_lesson_payload(order="2", slug="lesson-2"))
+
+    assert len((await cache.get(repository=repository)).entries) == 1
+
+    await asyncio.sleep(0.06)
+
+    assert len((await cache.get(repository=repository)).entries) == 2
@@ -136,3 +136,108 @@ async def test_create_lesson_rejects_blank_case_script(
     )
 
     assert response.status_code == 422
+
+
+async def test_progress_summary_groups_sections_and_tracks_lesson_changes(
+        client: httpx.AsyncClient,
+        admin_headers: dict[str, str],
+        user_headers: dict[str, str],
+) -> None:
+    lesson_ids = {}
+    for order in ("1", "1.1", "2"):
+        response = await client.post(
+            "/api/v1/lessons/create",
+            json=_lesson_payload(order=order, slug=f"lesson-{order}"),
+            headers=admin_headers,
+        )
+        lesson_ids[order] = response.json()["id"]
+
+    await client.post(f"/api/v1/users/me/progress/{lesson_ids['1']}", headers=user_headers)
+
+    response = await client.get("/api/v1/users/me/progress/summary", headers=user_headers)
+
+    assert response.status_code == 200
+    summary = response.json()
+    assert summary["completed"] == 1
+    assert summary["total"] == 3
+    assert summary["sections"] == [
+        {"section": "1", "title": "Lesson 1", "completed": 1, "total": 2},
+        {"section": "2", "title": "Lesson 2", "completed": 0, "total": 1},
+    ]
+    assert summary["next_lesson"]["id"] == lesson_ids["1.1"]
+
+    await client.post(
+        "/api/v1/lessons/create",
+        json=_lesson_payload(order="3", slug="lesson-3"),
+        headers=admin_headers,
+    )
+    response = await client.get("/api/v1/users/me/progress/summary", headers=user_headers)
+
+    assert response.json()["total"] == 4
+
+
+async def test_get_all_lessons_pages_when_limit_is_given(
+        client: httpx.AsyncClient,
+        admin_headers: dict[str, str],
+) -> None:
+    for order in ("1", "2", "3"):
+        await client.post(
+            "/api/v1/lessons/create",
+            json=_lesson_payload(order=order, slug=f"lesson-{order}"),
+            headers=admin_headers,
+        )
+
+    first_page = await client.get("/api/v1/lessons/get_all", params={"limit": 2})
+    cursor = first_page.headers["X-Next-Cursor"]
+    second_page = await client.get("/api/v1/lessons/get_all", params={"limit": 2, "cursor": cursor})
+    full_list = await client.get("/api/v1/lessons/get_all")
+
+    assert len(first_page.json()) == 2
+    assert len(second_page.json()) == 1
+    assert "X-Next-Cursor" not in second_page.headers
+    assert "X-Next-Cursor" not in full_list.headers
+    assert [lesson["order"] for lesson in full_list.json()] == ["1", "2", "3"]
+    assert not any("body_html" in lesson for lesson in full_list.json() + first_page.json())
+    assert {lesson["id"] for lesson in first_page.json() + second_page.json()} == {
+        lesson["id"] for lesson in full_list.json()
+    }
+
+
+async def test_lesson_theory_is_served_as_cacheable_html(
+        client: httpx.AsyncClient,
+        admin_headers: dict[str, str],
+) -> None:
+    payload = {**_lesson_payload(order="1", slug="lesson-1"), "body_markdown": "# Models\n\n<b>*typed*</b>"}
+    create_response = await client.post("/api/v1/lessons/create", json=payload, headers=admin_headers)
+    lesson = create_response.json()
+
+    assert lesson["body_html"] == "<h1>Models</h1>\n<p>&lt;b&gt;<em>typed</em>&lt;/b&gt;</p>"
+
+    theory_response = await client.get(f"/api/v1/lessons/{lesson['id']}/theory")
+
+    assert theory_response.status_code == 200
+    assert theory_response.headers["content-type"].startswith("text/html")
+    assert theory_response.text == lesson["body_html"]
+    assert theory_response.headers["cache-control"] == "no-cache"
+    etag = theory_response.headers["etag"]
+
+    not_modified_response = await client.get(
+        f"/api/v1/lessons/{lesson['id']}/theory",
+        headers={"If-None-Match": etag},
+    )
+
+    assert not_modified_response.status_code == 304
+    assert not_modified_response.content == b""
+
+    await client.put(
+        f"/api/v1/lessons/{lesson['id']}",
+        json={"body_markdown": "# Fields"},
+        headers=admin_headers,
+    )
+    changed_response = await client.get(
+        f"/api/v1/lessons/{lesson['id']}/theory",
+        headers={"If-None-Match": etag},
+    )
+
+    assert changed_response.status_code == 200
+    assert changed_response.text == "<h1>Fields</h1>"
@@ -1,14 +1,25 @@
+import asyncio
+import json
+from collections.abc import Callable
 from pathlib import Path
+from uuid import UUID
 
 import httpx
-from sqlalchemy.ext.asyncio import AsyncSession
+import pytest
+from sqlalchemy import event
+from sqlalchemy.engine import Connection
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
 
 from src.app.content.loader import LessonsLoader
+from src.app.content.markdown import render_markdown
 from src.app.content.validator import LessonsContentValidator
 from src.app.domain.repositories.lesson_repository import LessonRepository
+from src.app.domain.services import lesson_sync_importer
+from src.app.domain.services.lesson_change_hub import LessonChangeHub
 from src.app.domain.services.lesson_sync_diff_builder import LessonSyncDiffBuilder
 from src.app.domain.services.lesson_sync_importer import LessonSyncImporter
 from src.app.domain.services.lesson_sync_service import LessonSyncService
+from src.app.domain.services.lessons_watcher import LessonsWatcher
 
 
 def _write_lesson_files(root: Path, relative_dir: str, *, title: str) -> Path:
@@ -116,3 +127,431 @@ async def test_sync_lessons_deletes_missing(
     assert len(lessons) == 1
     assert lessons[0].slug == "lesson-two"
     assert lessons[0].order == "1"
+
+
+async def test_sync_lessons_swaps_orders_under_unique_index(
+        db_session: AsyncSession,
+        tmp_path: Path,
+) -> None:
+    root_dir = tmp_path / "lessons"
+    root_dir.mkdir(parents=True)
+    _write_lesson_files(root=root_dir, relative_dir="01-alpha", title="Alpha")
+    _write_lesson_files(root=root_dir, relative_dir="02-beta", title="Beta")
+
+    repository = LessonRepository(session=db_session)
+    service = LessonSyncService(
+        loader=LessonsLoader(root_dir=root_dir, validator=LessonsContentValidator()),
+        lesson_repository=repository,
+        diff_builder=LessonSyncDiffBuilder(),
+        importer=LessonSyncImporter(lesson_repository=repository),
+    )
+    await service.sync(delete_missing=True)
+
+    (root_dir / "01-alpha").rename(root_dir / "03-alpha")
+    (root_dir / "02-beta").rename(root_dir / "01-beta")
+    (root_dir / "03-alpha").rename(root_dir / "02-alpha")
+
+    result = await service.sync(delete_missing=True)
+
+    assert result.updated == 2
+    orders = {lesson.slug: lesson.order for lesson in await repository.get_all()}
+    assert orders == {"alpha": "2", "beta": "1"}
+
+
+async def test_sync_lessons_skips_parsing_unchanged_lessons(
+        db_session: AsyncSession,
+        tmp_path: Path,
+        monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    root_dir = tmp_path / "lessons"
+    root_dir.mkdir(parents=True)
+    _write_lesson_files(root=root_dir, relative_dir="01-alpha", title="Alpha")
+    beta_dir = _write_lesson_files(root=root_dir, relative_dir="02-beta", title="Beta")
+
+    repository = LessonRepository(session=db_session)
+    loader = LessonsLoader(root_dir=root_dir, validator=LessonsContentValidator())
+    service = LessonSyncService(
+        loader=loader,
+        lesson_repository=repository,
+        diff_builder=LessonSyncDiffBuilder(),
+        importer=LessonSyncImporter(lesson_repository=repository),
+    )
+    await service.sync(delete_missing=True)
+    parsed_dirs: list[str] = []
+    original_load_meta = loader._load_meta
+
+    def _record_load_meta(lesson_dir: Path) -> object:
+        parsed_dirs.append(lesson_dir.name)
+        return original_load_meta(lesson_dir=lesson_dir)
+
+    monkeypatch.setattr(loader, "_load_meta", _record_load_meta)
+    rendered_sources: list[str] = []
+
+    def _record_render(source: str) -> str:
+        rendered_sources.append(source)
+        return render_markdown(source=source)
+
+    monkeypatch.setattr(lesson_sync_importer, "render_markdown", _record_render)
+
+    unchanged_result = await service.sync(delete_missing=True)
+
+    assert unchanged_result.unchanged == 2
+    assert parsed_dirs == []
+    assert rendered_sources == []
+
+    (beta_dir / "theory.md").write_text("# Beta, revised\n", encoding="utf-8")
+    changed_result = await service.sync(delete_missing=True)
+
+    assert changed_result.updated == 1
+    assert changed_result.unchanged == 1
+    assert parsed_dirs == ["02-beta"]
+    assert rendered_sources == ["# Beta, revised"]
+    beta = await repository.get_by_slug(slug="beta")
+    assert beta is not None
+    assert beta.body_markdown == "# Beta, revised"
+    assert beta.body_html == "<h1>Beta, revised</h1>"
+    assert beta.content_hash is not None
+
+
+async def test_sync_lessons_writes_with_set_based_statements(
+        db_session: AsyncSession,
+        tmp_path: Path,
+) -> None:
+    root_dir = tmp_path / "lessons"
+    root_dir.mkdir(parents=True)
+    for index in range(1, 5):
+        _write_lesson_files(root=root_dir, relative_dir=f"0{index}-lesson-{index}", title=f"Lesson {index}")
+
+    repository = LessonRepository(session=db_session)
+    service = LessonSyncService(
+        loader=LessonsLoader(root_dir=root_dir, validator=LessonsContentValidator()),
+        lesson_repository=repository,
+        diff_builder=LessonSyncDiffBuilder(),
+        importer=LessonSyncImporter(lesson_repository=repository),
+    )
+    await service.sync(delete_missing=True)
+
+    for index in (1, 2):
+        (root_dir / f"0{index}-lesson-{index}" / "theory.md").write_text("# Revised\n", encoding="utf-8")
+    for path in (root_dir / "04-lesson-4").iterdir():
+        path.unlink()
+    (root_dir / "04-lesson-4").rmdir()
+    for index in (5, 6, 7):
+        _write_lesson_files(root=root_dir, relative_dir=f"0{index}-lesson-{index}", title=f"Lesson {index}")
+
+    statements: list[str] = []
+
+    def _record(_conn: Connection, _cursor: object, statement: str, *_args: object) -> None:
+        statements.append(statement.split(maxsplit=1)[0])
+
+    sync_engine = db_session.get_bind()
+    event.listen(sync_engine, "before_cursor_execute", _record)
+
+    try:
+        result = await service.sync(delete_missing=True)
+    finally:
+        event.remove(sync_engine, "before_cursor_execute", _record)
+
+    assert (result.created, result.updated, result.deleted, result.unchanged) == (3, 2, 1, 1)
+    assert statements.count("INSERT") == 1
+    assert statements.count("DELETE") == 1
+    assert statements.count("UPDATE") == 1
+    assert set(result.timings_ms) == {"scan", "compare", "parse", "delete", "update", "insert", "commit"}
+    assert len(await repository.get_all()) == 6
+
+
+async def test_lessons_watcher_hot_reloads_edited_lesson(
+        db_session: AsyncSession,
+        session_factory: async_sessionmaker[AsyncSession],
+        tmp_path: Path,
+) -> None:
+    root_dir = tmp_path / "lessons"
+    root_dir.mkdir(parents=True)
+    lesson_dir = _write_lesson_files(root=root_dir, relative_dir="01-alpha", title="Alpha")
+    change_hub = LessonChangeHub()
+    published: list[list[UUID] | None] = []
+    change_hub.subscribe(listener=published.append)
+    watcher = LessonsWatcher(
+        loader=LessonsLoader(root_dir=root_dir, validator=LessonsContentValidator()),
+        session_factory=session_factory,
+        change_hub=change_hub,
+        debounce_ms=20,
+        poll_interval_ms=20,
+        force_polling=True,
+    )
+    await watcher.sync()
+    published.clear()
+    watcher.start()
+    await asyncio.sleep(0.05)
+
+    try:
+        (lesson_dir / "theory.md").write_text("# Alpha, hot reloaded\n", encoding="utf-8")
+        for _ in range(100):
+            if published:
+                break
+            await asyncio.sleep(0.02)
+    finally:
+        await watcher.stop()
+
+    lesson = await LessonRepository(session=db_session).get_by_slug(slug="alpha")
+    assert lesson is not None
+    await db_session.refresh(lesson)
+    assert lesson.body_markdown == "# Alpha, hot reloaded"
+    assert published == [[lesson.id]]
+
+
+async def test_sync_lessons_stream_endpoint_emits_ndjson_events(
+        client: httpx.AsyncClient,
+        admin_headers: dict[str, str],
+) -> None:
+    async with client.stream(
+        "POST",
+        "/api/v1/lessons/sync_from_files/stream",
+        headers=admin_headers,
+    ) as response:
+        assert response.status_code == 200
+        assert response.headers["content-type"].startswith("application/x-ndjson")
+        events = [json.loads(line) async for line in response.aiter_lines() if line]
+
+    kinds = [event["event"] for event in events]
+    completed = events[-1]
+    assert kinds[0] == "scanned"
+    assert completed["event"] == "completed"
+    assert kinds.count("loaded") == events[0]["count"]
+    assert kinds.count("diffed") == kinds.count("written") == completed["result"]["created"]
+    assert {"scan", "parse", "insert"} <= set(completed["result"]["timings_ms"])
+
+    lessons_response = await client.get("/api/v1/lessons/get_all")
+    assert len(lessons_response.json()) == completed["result"]["created"]
+
+
+def _build_sync_service(
+        repository: LessonRepository,
+        loader: LessonsLoader,
+        change_hub: LessonChangeHub | None = None,
+) -> LessonSyncService:
+    return LessonSyncService(
+        loader=loader,
+        lesson_repository=repository,
+        diff_builder=LessonSyncDiffBuilder(),
+        importer=LessonSyncImporter(lesson_repository=repository, change_hub=change_hub),
+    )
+
+
+async def test_sync_lessons_stream_parses_and_commits_in_chunks(
+        db_session: AsyncSession,
+        tmp_path: Path,
+        monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    root_dir = tmp_path / "lessons"
+    for number in range(1, 6):
+        _write_lesson_files(root=root_dir, relative_dir=f"0{number}-lesson-{number}", title=f"Lesson {number}")
+
+    loader = LessonsLoader(root_dir=root_dir, validator=LessonsContentValidator())
+    load_sources = loader.load_sources
+    parsed_batches: list[int] = []
+
+    def _record_load_sources(sources: list) -> list:
+        parsed_batches.append(len(sources))
+        return load_sources(sources=sources)
+
+    monkeypatch.setattr(loader, "load_sources", _record_load_sources)
+    change_hub = LessonChangeHub()
+    published: list[list[UUID] | None] = []
+    change_hub.subscribe(listener=published.append)
+    service = _build_sync_service(
+        repository=LessonRepository(session=db_session),
+        loader=loader,
+        change_hub=change_hub,
+    )
+
+    events = [event async for event in service.stream(delete_missing=True, chunk_size=2)]
+
+    kinds = [event.event for event in events]
+    assert parsed_batches == [2, 2, 1]
+    assert [len(lesson_ids) for lesson_ids in published] == [2, 2, 1]
+    assert kinds.count("loaded") == kinds.count("written") == 5
+    assert events[-1].result.created == 5
+
+
+async def test_sync_lessons_stream_endpoint_reports_mid_stream_error_as_failed_event(
+        client: httpx.AsyncClient,
+        admin_headers: dict[str, str],
+        monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    async def _fail_add_many(_repository: LessonRepository, rows: list[dict[str, object]]) -> None:
+        message = f"lost connection writing {len(rows)} lessons"
+        raise RuntimeError(message)
+
+    monkeypatch.setattr(LessonRepository, "add_many", _fail_add_many)
+
+    async with client.stream(
+        "POST",
+        "/api/v1/lessons/sync_from_files/stream",
+        headers=admin_headers,
+    ) as response:
+        assert response.status_code == 200
+        events = [json.loads(line) async for line in response.aiter_lines() if line]
+
+    kinds = [event["event"] for event in events]
+    assert kinds[0] == "scanned"
+    assert "diffed" in kinds
+    assert "completed" not in kinds
+    assert kinds[-1] == "failed"
+    assert events[-1]["detail"].startswith("lost connection writing")
+
+
+async def test_sync_lessons_stream_resumes_after_partial_run(
+        db_session: AsyncSession,
+        tmp_path: Path,
+        monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    root_dir = tmp_path / "lessons"
+    for number in range(1, 6):
+        _write_lesson_files(root=root_dir, relative_dir=f"0{number}-lesson-{number}", title=f"Lesson {number}")
+
+    repository = LessonRepository(session=db_session)
+    service = _build_sync_service(
+        repository=repository,
+        loader=LessonsLoader(root_dir=root_dir, validator=LessonsContentValidator()),
+    )
+    add_many = LessonRepository.add_many
+    add_many_calls = 0
+
+    async def _fail_second_chunk(repository: LessonRepository, rows: list[dict[str, object]]) -> None:
+        nonlocal add_many_calls
+        add_many_calls += 1
+        if add_many_calls == 2:
+            message = "lost connection"
+            raise RuntimeError(message)
+        await add_many(repository, rows=rows)
+
+    monkeypatch.setattr(LessonRepository, "add_many", _fail_second_chunk)
+
+    with pytest.raises(RuntimeError, match="lost connection"):
+        async for _ in service.stream(delete_missing=True, chunk_size=2):
+            pass
+
+    await db_session.rollback()
+    monkeypatch.undo()
+    assert len(await repository.get_all()) == 2
+
+    result = await service.sync(delete_missing=True)
+
+    assert (result.created, result.updated, result.unchanged) == (3, 0, 2)
+    assert len(await repository.get_all()) == 5
+
+
+async def test_sync_lessons_stream_keeps_lessons_readable_after_failed_reorder(
+        client: httpx.AsyncClient,
+        db_session: AsyncSession,
+        tmp_path: Path,
+        monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    root_dir = tmp_path / "lessons"
+    root_dir.mkdir(parents=True)
+    _write_lesson_files(root=root_dir, relative_dir="01-alpha", title="Alpha")
+    _write_lesson_files(root=root_dir, relative_dir="02-beta", title="Beta")
+    _write_lesson_files(root=root_dir, relative_dir="03-gamma", title="Gamma")
+
+    repository = LessonRepository(session=db_session)
+    service = _build_sync_service(
+        repository=repository,
+        loader=LessonsLoader(root_dir=root_dir, validator=LessonsContentValidator()),
+    )
+    await service.sync(delete_missing=True)
+
+    (root_dir / "01-alpha").rename(root_dir / "04-alpha")
+    (root_dir / "02-beta").rename(root_dir / "01-beta")
+    (root_dir / "04-alpha").rename(root_dir / "02-alpha")
+    (root_dir / "03-gamma" / "theory.md").write_text("# Gamma, revised\n", encoding="utf-8")
+    update_many = LessonRepository.update_many
+    content_chunks = 0
+
+    async def _fail_second_content_chunk(repository: LessonRepository, rows: list[dict[str, object]]) -> None:
+        nonlocal content_chunks
+        if "slug" in rows[0]:
+            content_chunks += 1
+        if content_chunks == 2:
+            message = "lost connection"
+            raise RuntimeError(message)
+        await update_many(repository, rows=rows)
+
+    monkeypatch.setattr(LessonRepository, "update_many", _fail_second_content_chunk)
+
+    with pytest.raises(RuntimeError, match="lost connection"):
+        async for _ in service.stream(delete_missing=True, chunk_size=1):
+            pass
+
+    await db_session.rollback()
+    monkeypatch.undo()
+
+    response = await client.get("/api/v1/lessons/get_all")
+
+    assert response.status_code == 200
+    assert {lesson["slug"]: lesson["order"] for lesson in response.json()} == {
+        "alpha": "2",
+        "beta": "1",
+        "gamma": "3",
+    }
+
+    result = await service.sync(delete_missing=True)
+
+    assert result.updated >= 1
+    assert (await service.sync(delete_missing=True)).unchanged == 3
+
+
+async def test_lessons_watcher_watches_in_one_process_and_invalidates_the_others(
+        db_session: AsyncSession,
+        session_factory: async_sessionmaker[AsyncSession],
+        tmp_path: Path,
+) -> None:
+    _ = db_session
+    root_dir = tmp_path / "lessons"
+    root_dir.mkdir(parents=True)
+    change_hubs = [LessonChangeHub(), LessonChangeHub()]
+    published: list[list[list[UUID] | None]] = [[], []]
+    for change_hub, worker_published in zip(change_hubs, published, strict=True):
+        change_hub.subscribe(listener=worker_published.append)
+    watchers = [
+        LessonsWatcher(
+            loader=LessonsLoader(root_dir=root_dir, validator=LessonsContentValidator()),
+            session_factory=session_factory,
+            change_hub=change_hub,
+            debounce_ms=20,
+            poll_interval_ms=20,
+            force_polling=True,
+            lock_path=tmp_path / "watch.lock",
+        )
+        for change_hub in change_hubs
+    ]
+
+    async def _wait_until(condition: Callable[[], bool]) -> None:
+        for _ in range(100):
+            if condition():
+                return
+            await asyncio.sleep(0.02)
+
+    try:
+        watchers[0].start()
+        await asyncio.sleep(0.05)
+        watchers[1].start()
+        await asyncio.sleep(0.05)
+        assert watchers[0].is_watching
+        assert watchers[1].is_running
+        assert not watchers[1].is_watching
+
+        _write_lesson_files(root=root_dir, relative_dir="01-alpha", title="Alpha")
+        await _wait_until(lambda: bool(published[1]))
+
+        assert len(published[0]) == 1
+        assert published[0][0] is not None
+        assert published[1] == [None]
+
+        await watchers[0].stop()
+        await _wait_until(lambda: watchers[1].is_watching)
+        assert watchers[1].is_watching
+    finally:
+        for watcher in watchers:
+            await watcher.stop()
+
@@ -0,0 +1,137 @@
+import asyncio
+import json
+import subprocess
+import sys
+import threading
+import time
+from pathlib import Path
+
+import httpx
+
+from src.app.core.observability import LoopLagMonitor, MetricsExporter, MetricsRegistry, render_text
+
+
+def test_render_text_formats_counters_and_histograms() -> None:
+    registry = MetricsRegistry()
+    rejections = registry.counter(name="rejections_total", help_text="Rejections.", label_names=("caller",))
+    durations = registry.histogram(name="call_duration_ms", help_text="Calls.", label_names=("status",), buckets=(10, 100))
+
+    rejections.inc(labels=('ip "a"',))
+    durations.observe(value=5, labels=("accepted",))
+    durations.observe(value=50, labels=("accepted",))
+    durations.observe(value=500, labels=("accepted",))
+
+    lines = render_text(families=registry.collect()).splitlines()
+
+    assert "# TYPE rejections_total counter" in lines
+    assert 'rejections_total{caller="ip \\"a\\""} 1' in lines
+    assert "# TYPE call_duration_ms histogram" in lines
+    assert 'call_duration_ms_bucket{status="accepted",le="10"} 1' in lines
+    assert 'call_duration_ms_bucket{status="accepted",le="100"} 2' in lines
+    assert 'call_duration_ms_bucket{status="accepted",le="+Inf"} 3' in lines
+    assert 'call_duration_ms_sum{status="accepted"} 555' in lines
+    assert 'call_duration_ms_count{status="accepted"} 3' in lines
+
+
+def _exited_process_pid() -> int:
+    exited_worker = subprocess.Popen([sys.executable, "-c", ""])
+    exited_worker.wait()
+    return exited_worker.pid
+
+
+async def test_exporter_merges_worker_snapshots(tmp_path: Path) -> None:
+    registry = MetricsRegistry()
+    requests = registry.counter(name="requests_total", help_text="Requests.")
+    connections = registry.gauge(name="connections", help_text="Connections.")
+    requests.inc(amount=2)
+    connections.set(value=3)
+
+    exited_pid = _exited_process_pid()
+    exited_snapshot = [
+        {**requests.snapshot(), "samples": [{"labels": [], "value": 5}]},
+        {**connections.snapshot(), "samples": [{"labels": [], "value": 7}]},
+    ]
+    (tmp_path / f"{exited_pid}.json").write_text(
+        json.dumps({"pid": exited_pid, "families": exited_snapshot}),
+        encoding="utf-8",
+    )
+
+    exporter = MetricsExporter(registry=registry, multiprocess_dir=tmp_path, flush_interval_sec=60)
+    lines = (await exporter.render()).splitlines()
+
+    assert "requests_total 7" in lines
+    assert "connections 3" in lines
+
+
+async def test_exporter_keeps_flushing_after_a_failed_snapshot(tmp_path: Path) -> None:
+    registry = MetricsRegistry()
+    registry.counter(name="requests_total", help_text="Requests.").inc()
+    collect = registry.collect
+    calls = 0
+
+    def _fail_first_collect() -> list:
+        nonlocal calls
+        calls += 1
+        if calls == 1:
+            message = "collector failed"
+            raise RuntimeError(message)
+        return collect()
+
+    registry.collect = _fail_first_collect
+    exporter = MetricsExporter(registry=registry, multiprocess_dir=tmp_path, flush_interval_sec=0.01)
+    exporter.start()
+
+    try:
+        for _ in range(100):
+            if calls >= 3:
+                break
+            await asyncio.sleep(0.01)
+        flushes_before_stop = calls
+    finally:
+        await exporter.stop()
+
+    assert flushes_before_stop >= 3
+
+
+async def test_metrics_endpoint_reports_request_latency_by_route(client: httpx.AsyncClient) -> None:
+    await client.get("/health")
+
+    response = await client.get("/metrics")
+
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/plain; version=0.0.4")
+    assert 'http_request_duration_ms_count{method="GET",route="/health",status="200"}' in response.text
+    assert "# TYPE db_pool_connections gauge" in response.text
+    assert 'cache_hits_total{cache="user"}' in response.text
+
+
+async def test_loop_lag_monitor_captures_blocking_stack() -> None:
+    registry = MetricsRegistry()
+    stalls = registry.counter(name="stalls_total", help_text="Stalls.")
+    monitor = LoopLagMonitor(
+        interval_ms=10,
+        stall_threshold_ms=50,
+        lag_histograms=registry.histogram(name="lag_ms", help_text="Lag."),
+        stalls=stalls,
+    )
+    counting_threads: set[int] = set()
+    count_stall = stalls.inc
+
+    def block_the_loop() -> None:
+        time.sleep(0.3)
+
+    def record_thread() -> None:
+        counting_threads.add(threading.get_ident())
+        count_stall()
+
+    stalls.inc = record_thread
+    monitor.start()
+    await asyncio.sleep(0.05)
+    block_the_loop()
+    await asyncio.sleep(0.05)
+    await monitor.stop()
+
+    assert stalls.values[()] == 1
+    assert counting_threads == {threading.get_ident()}
+    assert "block_the_loop" in monitor.last_stall_stack
+    assert monitor.lag_histograms.histograms[()].sum >= 200
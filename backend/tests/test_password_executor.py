@@ -0,0 +1,97 @@
+import asyncio
+import threading
+import time
+
+from passlib.context import CryptContext
+
+from src.app.core.security.auth_manager import AuthManager
+from src.app.core.security.password_executor import PasswordHashExecutor
+
+
+def _build_auth_manager(executor: PasswordHashExecutor | None) -> AuthManager:
+    return AuthManager(context=CryptContext(schemes=["plaintext"]), executor=executor)
+
+
+async def test_executor_keeps_event_loop_responsive() -> None:
+    executor = PasswordHashExecutor(max_workers=2, max_concurrent_logins=2)
+    ticks = 0
+
+    async def heartbeat() -> None:
+        nonlocal ticks
+
+        while True:
+            await asyncio.sleep(0.001)
+            ticks += 1
+
+    def block() -> None:
+        time.sleep(0.05)
+
+    task = asyncio.create_task(heartbeat())
+    await executor.run(block)
+    task.cancel()
+    executor.shutdown()
+
+    assert ticks > 5
+
+
+async def test_executor_limits_concurrent_logins() -> None:
+    executor = PasswordHashExecutor(max_workers=4, max_concurrent_logins=2)
+    lock = threading.Lock()
+    active = 0
+    peak = 0
+
+    def verify() -> bool:
+        nonlocal active, peak
+
+        with lock:
+            active += 1
+            peak = max(peak, active)
+
+        time.sleep(0.02)
+
+        with lock:
+            active -= 1
+
+        return True
+
+    results = await asyncio.gather(*(executor.run_login(verify) for _ in range(6)))
+    executor.shutdown()
+
+    assert all(results)
+    assert peak == 2
+
+
+async def test_executor_reopens_after_shutdown() -> None:
+    executor = PasswordHashExecutor(max_workers=1, max_concurrent_logins=1)
+
+    def double(value: int) -> int:
+        return value * 2
+
+    assert await executor.run(double, value=1) == 2
+    executor.shutdown()
+
+    assert await executor.run(double, value=2) == 4
+    assert await executor.run_login(double, value=3) == 6
+    executor.shutdown()
+
+
+async def test_auth_manager_async_methods_match_sync_results() -> None:
+    executor = PasswordHashExecutor(max_workers=1, max_concurrent_logins=1)
+
+    for auth_manager in (_build_auth_manager(executor=executor), _build_auth_manager(executor=None)):
+        hashed_password = await auth_manager.hash_password_async(password="secret")
+
+        assert await auth_manager.verify_password_against_hash_async(
+            plain_password="secret",
+            hashed_password=hashed_password,
+        )
+        assert await auth_manager.verify_login_password(
+            plain_password="secret",
+            hashed_password=hashed_password,
+        )
+        assert not await auth_manager.verify_login_password(
+            plain_password="wrong",
+            hashed_password=hashed_password,
+        )
+
+    executor.shutdown()
@@ -0,0 +1,82 @@
+import threading
+
+import httpx
+
+from src.app.core.dependencies.observability import get_sampling_profiler
+
+
+async def test_profile_returns_collapsed_stacks(client: httpx.AsyncClient, admin_headers: dict[str, str]) -> None:
+    response = await client.get(
+        "/api/v1/admin/profile",
+        params={"seconds": 0.1, "interval_ms": 5, "include_idle": True},
+        headers=admin_headers,
+    )
+
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/plain")
+    lines = response.text.splitlines()
+    assert lines
+    assert all(line.rsplit(" ", 1)[1].isdigit() for line in lines)
+    assert any(line.startswith("MainThread;") for line in lines)
+    assert any(";[idle] " in line for line in lines)
+
+
+async def test_profile_leaves_out_idle_threads_by_default(
+        client: httpx.AsyncClient,
+        admin_headers: dict[str, str],
+) -> None:
+    done = threading.Event()
+
+    def _spin() -> None:
+        while not done.is_set():
+            sum(range(1_000))
+
+    busy_thread = threading.Thread(target=_spin, name="profile-busy-thread")
+    busy_thread.start()
+
+    try:
+        response = await client.get(
+            "/api/v1/admin/profile",
+            params={"seconds": 0.1, "interval_ms": 5},
+            headers=admin_headers,
+        )
+    finally:
+        done.set()
+        busy_thread.join()
+
+    lines = response.text.splitlines()
+    assert any(line.startswith("profile-busy-thread;") for line in lines)
+    assert not any("[idle]" in line for line in lines)
+
+
+async def test_profile_returns_speedscope_json(client: httpx.AsyncClient, admin_headers: dict[str, str]) -> None:
+    response = await client.get(
+        "/api/v1/admin/profile",
+        params={"seconds": 0.1, "interval_ms": 5, "format": "speedscope"},
+        headers=admin_headers,
+    )
+
+    assert response.status_code == 200
+    payload = response.json()
+    profile = payload["profiles"][0]
+    assert profile["type"] == "sampled"
+    assert len(profile["samples"]) == len(profile["weights"])
+    assert all(index < len(payload["shared"]["frames"]) for sample in profile["samples"] for index in sample)
+
+
+async def test_profile_requires_admin(client: httpx.AsyncClient, user_headers: dict[str, str]) -> None:
+    response = await client.get("/api/v1/admin/profile", params={"seconds": 0.1}, headers=user_headers)
+
+    assert response.status_code == 403
+
+
+async def test_profile_rejects_concurrent_session(client: httpx.AsyncClient, admin_headers: dict[str, str]) -> None:
+    profiler = get_sampling_profiler()
+    profiler._lock.acquire()
+
+    try:
+        response = await client.get("/api/v1/admin/profile", params={"seconds": 0.1}, headers=admin_headers)
+    finally:
+        profiler._lock.release()
+
+    assert response.status_code == 409
@@ -7,6 +7,7 @@ from jwt import encode
 from src.app.core.dependencies.security.user import get_user_from_jwt, require_admin_user
 from src.app.core.exceptions.auth_exc import AuthenticationRequired, Unauthorized
 from src.app.core.exceptions.base_exc import NotFoundError
+from src.app.core.security.user_cache import UserCache
 from src.app.domain.models.dto.user import UserDTO
 from src.app.domain.models.enums.role import UserRole
 from src.cfg.cfg import settings
@@ -16,8 +17,10 @@ class FakeUserService:
     def __init__(self, user: UserDTO | None, *, raise_missing: bool = False) -> None:
         self.user = user
         self.raise_missing = raise_missing
+        self.calls = 0
 
     async def get_by_username(self, username: str) -> UserDTO:
+        self.calls += 1
 
         if self.raise_missing:
             raise NotFoundError(
@@ -36,14 +39,18 @@ class FakeUserService:
         )
 
 
-def _build_token(username: str) -> str:
+def _build_token(username: str, **claims: str) -> str:
     return encode(
-        payload={"sub": username},
+        payload={"sub": username, **claims},
         key=settings.auth.jwt_secret_key,
         algorithm=settings.auth.jwt_algorithm,
     )
 
 
+def _build_cache() -> UserCache:
+    return UserCache(max_size=10, ttl_sec=60)
+
+
 async def test_get_user_from_jwt_success() -> None:
     user = UserDTO(
         id=uuid4(),
@@ -57,6 +64,7 @@ async def test_get_user_from_jwt_success() -> None:
     result = await get_user_from_jwt(
         user_service=FakeUserService(user=user),
         jwt=creds,
+        user_cache=_build_cache(),
     )
 
     assert result.username == "alice"
@@ -70,6 +78,7 @@ async def test_get_user_from_jwt_missing_user() -> None:
         await get_user_from_jwt(
             user_service=FakeUserService(user=None, raise_missing=True),
             jwt=creds,
+            user_cache=_build_cache(),
         )
 
 
@@ -80,6 +89,80 @@ async def test_get_user_from_jwt_invalid_token() -> None:
         await get_user_from_jwt(
             user_service=FakeUserService(user=None),
             jwt=creds,
+            user_cache=_build_cache(),
+        )
+
+
+async def test_get_user_from_jwt_uses_cache() -> None:
+    user = UserDTO(
+        id=uuid4(),
+        username="alice",
+        email=None,
+        role=UserRole.USER,
+    )
+    user_service = FakeUserService(user=user)
+    user_cache = _build_cache()
+    creds = HTTPAuthorizationCredentials(scheme="Bearer", credentials=_build_token(username="alice"))
+
+    first = await get_user_from_jwt(user_service=user_service, jwt=creds, user_cache=user_cache)
+    second = await get_user_from_jwt(user_service=user_service, jwt=creds, user_cache=user_cache)
+
+    assert first == second
+    assert user_service.calls == 1
+
+    user_cache.invalidate_user_id(user_id=user.id)
+    await get_user_from_jwt(user_service=user_service, jwt=creds, user_cache=user_cache)
+
+    assert user_service.calls == 2
+
+
+async def test_get_user_from_jwt_does_not_cache_user_invalidated_during_lookup() -> None:
+    user = UserDTO(
+        id=uuid4(),
+        username="alice",
+        email=None,
+        role=UserRole.USER,
+    )
+    user_cache = _build_cache()
+
+    class RenamingUserService(FakeUserService):
+        async def get_by_username(self, username: str) -> UserDTO:
+            found = await super().get_by_username(username=username)
+            user_cache.invalidate_user_id(user_id=found.id)
+            return found
+
+    user_service = RenamingUserService(user=user)
+    creds = HTTPAuthorizationCredentials(scheme="Bearer", credentials=_build_token(username="alice"))
+
+    await get_user_from_jwt(user_service=user_service, jwt=creds, user_cache=user_cache)
+
+    assert user_cache.get(username="alice") is None
+
+
+async def test_get_user_from_jwt_trusts_claims_when_enabled(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(settings.auth, "trust_token_claims", True)
+    user_id = uuid4()
+    user_service = FakeUserService(user=None, raise_missing=True)
+    token = _build_token(username="alice", uid=str(user_id), role=UserRole.ADMIN.value)
+    creds = HTTPAuthorizationCredentials(scheme="Bearer", credentials=token)
+
+    result = await get_user_from_jwt(user_service=user_service, jwt=creds, user_cache=_build_cache())
+
+    assert result.id == user_id
+    assert result.role == UserRole.ADMIN
+    assert user_service.calls == 0
+
+
+async def test_get_user_from_jwt_rejects_malformed_trusted_claims(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(settings.auth, "trust_token_claims", True)
+    token = _build_token(username="alice", uid="not-a-uuid", role=UserRole.USER.value)
+    creds = HTTPAuthorizationCredentials(scheme="Bearer", credentials=token)
+
+    with pytest.raises(AuthenticationRequired):
+        await get_user_from_jwt(
+            user_service=FakeUserService(user=None),
+            jwt=creds,
+            user_cache=_build_cache(),
         )
 
 
@@ -15,6 +15,7 @@ from src.app.core.security.oauth_state import (
     create_oauth_state,
     parse_oauth_state,
 )
+from src.app.core.security.user_cache import UserCache
 from src.app.domain.models.db.user import User
 from src.app.domain.models.dto.auth import LoginCredentials
 from src.app.domain.models.dto.user import CreateUserDTO, UpdateUserDTO
@@ -28,7 +29,7 @@ class FakeAuthManager:
     def __init__(self, *, verify_ok: bool = True) -> None:
         self.verify_ok = verify_ok
 
-    def verify_password_against_hash(self, plain_password: str, hashed_password: str) -> bool:
+    async def verify_login_password(self, plain_password: str, hashed_password: str) -> bool:
         _ = plain_password
         _ = hashed_password
 
@@ -47,12 +48,12 @@ class FakeHashManager:
         self.verify_ok = verify_ok
 
     @staticmethod
-    def hash_password(password: str) -> str:
+    async def hash_password_async(password: str) -> str:
         _ = password
 
         return "hashed"
 
-    def verify_password_against_hash(self, plain_password: str, hashed_password: str) -> bool:
+    async def verify_password_against_hash_async(self, plain_password: str, hashed_password: str) -> bool:
         _ = plain_password
         _ = hashed_password
 
@@ -275,6 +276,31 @@ async def test_user_service_update_me_no_changes_returns_current_user(db_session
     assert result.username == "alice"
 
 
+async def test_user_service_update_me_invalidates_user_cache(db_session: AsyncSession) -> None:
+    repository = UserRepository(session=db_session)
+    user_cache = UserCache(max_size=10, ttl_sec=60)
+    service = UserService(
+        user_repository=repository,
+        auth_manager=FakeHashManager(),
+        user_cache=user_cache,
+    )
+    user = User(
+        username="alice",
+        email="alice@example.com",
+        hashed_password="hashed",
+        role=UserRole.USER,
+    )
+    db_session.add(user)
+    await db_session.commit()
+    await db_session.refresh(instance=user)
+    user_cache.set(user=user.to_dto())
+
+    await service.update_me(id=user.id, schema=UpdateUserDTO(username="alice2"))
+
+    assert user_cache.get(username="alice") is None
+    assert user_cache.get(username="alice2") is None
+
+
 def test_oauth_state_roundtrip() -> None:
     state, code_verifier, cookie_value = create_oauth_state(secret="secret")
 
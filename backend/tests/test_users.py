@@ -0,0 +1,107 @@
+import logging
+from collections.abc import Awaitable, Callable
+from contextlib import AbstractContextManager
+
+import httpx
+import pytest
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.app.core.dependencies.db import QUERY_TRACKER
+from src.app.core.observability import QueryStats
+from src.app.domain.models.db.user import User
+from src.app.domain.models.enums.role import UserRole
+from src.app.domain.repositories.user_repository import UserRepository
+
+
+async def test_get_all_users_pages_with_cursor_header(
+        client: httpx.AsyncClient,
+        user_factory: Callable[[str, str, UserRole], Awaitable[User]],
+) -> None:
+    for index in range(5):
+        await user_factory(f"user_{index}", "secret", UserRole.USER)
+
+    seen_ids: list[str] = []
+    cursor: str | None = None
+    pages = 0
+
+    while True:
+        params = {"limit": 2} if cursor is None else {"limit": 2, "cursor": cursor}
+        response = await client.get("/api/v1/users/get_all", params=params)
+        assert response.status_code == 200
+
+        page = response.json()
+        seen_ids.extend(user["id"] for user in page)
+        pages += 1
+        cursor = response.headers.get("X-Next-Cursor")
+
+        if cursor is None:
+            break
+
+    assert pages == 3
+    assert len(seen_ids) == 5
+    assert seen_ids == sorted(seen_ids)
+    assert all("hashed_password" not in user for user in page)
+
+
+async def test_get_all_users_without_limit_returns_everyone(
+        client: httpx.AsyncClient,
+        user_factory: Callable[[str, str, UserRole], Awaitable[User]],
+) -> None:
+    for index in range(3):
+        await user_factory(f"user_{index}", "secret", UserRole.USER)
+
+    response = await client.get("/api/v1/users/get_all")
+
+    assert response.status_code == 200
+    assert "X-Next-Cursor" not in response.headers
+    assert len(response.json()) == 3
+    assert all("hashed_password" not in user for user in response.json())
+
+
+async def test_get_all_users_rejects_oversized_page(client: httpx.AsyncClient) -> None:
+    response = await client.get("/api/v1/users/get_all", params={"limit": 10_000})
+
+    assert response.status_code == 422
+
+
+async def test_stream_scalars_yields_every_row(
+        db_session: AsyncSession,
+        user_factory: Callable[[str, str, UserRole], Awaitable[User]],
+) -> None:
+    for index in range(5):
+        await user_factory(f"stream_{index}", "secret", UserRole.USER)
+
+    repository = UserRepository(session=db_session)
+    usernames = [user.username async for user in repository.stream_scalars(batch_size=2)]
+
+    assert sorted(usernames) == [f"stream_{index}" for index in range(5)]
+
+
+async def test_update_me_query_count(
+        client: httpx.AsyncClient,
+        user_headers: dict[str, str],
+        count_queries: Callable[[], AbstractContextManager[QueryStats]],
+) -> None:
+    with count_queries() as queries:
+        response = await client.put("/api/v1/users/me", json={"username": "renamed"}, headers=user_headers)
+
+    assert response.status_code == 200
+    assert response.json()["username"] == "renamed"
+    # token user lookup, current user by id, username uniqueness check, update
+    assert queries.count == 4
+
+
+async def test_slow_queries_are_logged_with_parameter_shape(
+        client: httpx.AsyncClient,
+        user_headers: dict[str, str],
+        caplog: pytest.LogCaptureFixture,
+        monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.setattr(QUERY_TRACKER, "slow_query_threshold_ms", 0)
+
+    with caplog.at_level(logging.WARNING, logger="src.app.core.observability.query_tracker"):
+        await client.get("/api/v1/users/me", headers=user_headers)
+
+    messages = [record.getMessage() for record in caplog.records]
+    assert any("WHERE users.username = ?; parameters (str)" in message for message in messages)
+    assert not any("'user'" in message for message in messages)